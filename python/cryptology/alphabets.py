@@ -12,6 +12,8 @@ Alphabet Standards:
 5. All alphabets support UTF-8 encoding
 """
 
+from functools import lru_cache
+
 # Standard Alphabets (lowercase)
 
 # English Alphabets
@@ -148,6 +150,54 @@ def validate_alphabet(alphabet: str) -> bool:
     """
     return len(alphabet) == len(set(alphabet))
 
+@lru_cache(maxsize=256)
+def translation_table(source: str, target: str) -> dict:
+    """
+    Build a str.translate() table mapping source characters to target characters.
+    
+    Each character of source maps to the character at the same position in
+    target. As with source.index(), the first occurrence of a repeated
+    character decides its mapping. Tables are cached per (source, target)
+    pair and must not be modified by callers.
+    
+    For ASCII text and alphabets (digits, hexadecimal, A-Z) str.translate()
+    already runs CPython's one-byte fast path, which is as fast as
+    bytes.translate(); converting to bytes and back would only add the
+    encode/decode passes.
+    
+    Args:
+        source: Alphabet being substituted
+        target: Replacement alphabet, position for position
+        
+    Returns:
+        Translation table suitable for str.translate()
+    """
+    table = {}
+    for source_char, target_char in zip(source, target):
+        table.setdefault(ord(source_char), target_char)
+    return table
+
+@lru_cache(maxsize=256)
+def compose_alphabets(source: str, *alphabets: str) -> str:
+    """
+    Fuse successive monoalphabetic substitutions into a single alphabet.
+    
+    Substituting text with the returned alphabet gives the same result as
+    substituting it with each of the given alphabets in turn, so stacked
+    layers need only one pass over the text.
+    
+    Args:
+        source: Plain alphabet all layers are defined over
+        *alphabets: Cipher alphabets in the order they are applied
+        
+    Returns:
+        Cipher alphabet equivalent to applying every layer in order
+    """
+    composed = source
+    for alphabet in alphabets:
+        composed = composed.translate(translation_table(source, alphabet))
+    return composed
+
 def get_alphabet_length(alphabet: str) -> int:
     """
     Get alphabet length in UTF-8 characters (not bytes).
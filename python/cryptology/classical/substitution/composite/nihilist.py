@@ -10,6 +10,7 @@ It converts letters to coordinates, adds a numeric key, and converts back to let
 
 import string
 import random
+from functools import lru_cache
 from typing import Optional, Tuple, Dict
 
 import cryptology.alphabets as ALPHABETS
@@ -160,10 +161,11 @@ def nihilist_generate_random_key(
     if length <= 0:
         raise ValueError("Key length must be positive")
     
+    # Draw the whole key in one random.choices call rather than per character
     if key_type == "numeric":
-        return ''.join(str(random.randint(0, 9)) for _ in range(length))
+        return ''.join(random.choices(string.digits, k=length))
     elif key_type == "alphabetic":
-        return ''.join(random.choice(string.ascii_uppercase) for _ in range(length))
+        return ''.join(random.choices(string.ascii_uppercase, k=length))
     else:
         raise ValueError(f"Invalid key_type: {key_type}")
 
@@ -226,7 +228,7 @@ def _prepare_key(key: str, key_type: str) -> str:
 
 def _letters_to_coordinates(text: str, square: str) -> list:
     """Convert letters to coordinates using the square."""
-    square_dict = _parse_square(square)
+    square_dict = _square_tables(square)[0]
     coordinates = []
     
     for letter in text:
@@ -256,7 +258,7 @@ def _key_to_values(key: str, key_type: str) -> list:
 
 def _add_coordinates_and_key(coordinates: list, key_values: list, square: str) -> list:
     """Add key values to coordinates with modular arithmetic."""
-    square_size = _get_square_size(square)
+    square_size = _square_tables(square)[2]
     result = []
     
     for i, coord in enumerate(coordinates):
@@ -273,7 +275,7 @@ def _add_coordinates_and_key(coordinates: list, key_values: list, square: str) -
 
 def _subtract_key_from_coordinates(coordinates: list, key_values: list, square: str) -> list:
     """Subtract key values from coordinates with modular arithmetic."""
-    square_size = _get_square_size(square)
+    square_size = _square_tables(square)[2]
     result = []
     
     for i, coord in enumerate(coordinates):
@@ -290,8 +292,7 @@ def _subtract_key_from_coordinates(coordinates: list, key_values: list, square:
 
 def _coordinates_to_letters(coordinates: list, square: str) -> str:
     """Convert coordinates back to letters using the square."""
-    square_dict = _parse_square(square)
-    reverse_dict = {v: k for k, v in square_dict.items()}
+    reverse_dict = _square_tables(square)[1]
     
     result = []
     for coord in coordinates:
@@ -317,6 +318,28 @@ def _parse_square(square: str) -> Dict[str, Tuple[int, int]]:
     return square_dict
 
 
+@lru_cache(maxsize=256)
+def _square_tables(
+    square: str
+) -> Tuple[Dict[str, Tuple[int, int]], Dict[Tuple[int, int], str], int]:
+    """
+    Parse a square once into its lookup tables.
+    
+    Encryption and decryption each need the letter-to-coordinate map, its
+    reverse and the square size; caching them per square string lets repeated
+    calls with the same square skip re-parsing it.
+    
+    Args:
+        square: Square string representation
+    
+    Returns:
+        Tuple of (letter -> coordinate map, coordinate -> letter map, size)
+    """
+    square_dict = _parse_square(square)
+    reverse_dict = {v: k for k, v in square_dict.items()}
+    return square_dict, reverse_dict, _get_square_size(square)
+
+
 def _get_square_size(square: str) -> int:
     """Get the size of the square (5x5 or 6x6)."""
     lines = square.strip().split('\n')
@@ -14,6 +14,7 @@ Features:
 
 import random
 import string
+from functools import lru_cache
 from typing import Dict, List, Optional, Tuple
 
 
@@ -217,6 +218,7 @@ def straddling_checkerboard_encrypt_with_random_key(
 
 # Helper functions
 
+@lru_cache(maxsize=1)
 def _create_standard_checkerboard() -> str:
     """Create a standard 10×3 checkerboard."""
     # Standard checkerboard with letters A-Z and digits 0-9
@@ -289,6 +291,7 @@ def _create_keyword_checkerboard(keyword: str, alphabet: str) -> str:
     return _checkerboard_to_string(checkerboard)
 
 
+@lru_cache(maxsize=32)
 def _create_custom_checkerboard(alphabet: str) -> str:
     """Create a custom checkerboard for the given alphabet."""
     alphabet_upper = alphabet.lower()
@@ -422,9 +425,17 @@ def _string_to_checkerboard(checkerboard_str: str) -> Dict[str, str]:
     return checkerboard
 
 
+@lru_cache(maxsize=32)
+def _checkerboard_tables(checkerboard: str) -> Tuple[Dict[str, str], Dict[str, str]]:
+    """Parse a checkerboard string once into (char -> digits, digits -> char) maps."""
+    checkerboard_dict = _string_to_checkerboard(checkerboard)
+    reverse_checkerboard = {digit: char for char, digit in checkerboard_dict.items()}
+    return checkerboard_dict, reverse_checkerboard
+
+
 def _letters_to_digits(text: str, checkerboard: str) -> str:
     """Convert letters to digits using checkerboard."""
-    checkerboard_dict = _string_to_checkerboard(checkerboard)
+    checkerboard_dict = _checkerboard_tables(checkerboard)[0]
     digits = []
     
     for char in text:
@@ -439,10 +450,7 @@ def _letters_to_digits(text: str, checkerboard: str) -> str:
 
 def _digits_to_letters(digits: str, checkerboard: str) -> str:
     """Convert digits to letters using checkerboard."""
-    checkerboard_dict = _string_to_checkerboard(checkerboard)
-    
-    # Create reverse mapping
-    reverse_checkerboard = {digit: char for char, digit in checkerboard_dict.items()}
+    reverse_checkerboard = _checkerboard_tables(checkerboard)[1]
     
     letters = []
     i = 0
@@ -488,7 +496,7 @@ def _apply_numeric_key(digits: str, key: str, reverse: bool = False) -> str:
 
 def _apply_alphabetic_key(digits: str, key: str, checkerboard: str, reverse: bool = False) -> str:
     """Apply alphabetic key to digits."""
-    checkerboard_dict = _string_to_checkerboard(checkerboard)
+    checkerboard_dict = _checkerboard_tables(checkerboard)[0]
     key_upper = key.lower()
     
     result_digits = []
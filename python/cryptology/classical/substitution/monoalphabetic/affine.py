@@ -14,6 +14,7 @@ Where:
 """
 
 import math
+from functools import lru_cache
 
 from cryptology import alphabets as ALPHABETS
 
@@ -36,6 +37,9 @@ def _mod_inverse(a: int, m: int) -> int:
     if _gcd(a, m) != 1:
         raise ValueError(f"No modular inverse exists: gcd({a}, {m}) != 1")
     
+    # Reduce first so negative keys get the same inverse as a % m
+    a %= m
+    
     # Extended Euclidean Algorithm
     m0, x0, x1 = m, 0, 1
     while a > 1:
@@ -46,6 +50,25 @@ def _mod_inverse(a: int, m: int) -> int:
     return x1 % m0
 
 
+# Coprime keys and their inverses for common alphabet lengths (digits, hex,
+# English, Turkish, Russian, ...), keyed by alphabet length then by a mod m
+_INVERSES = {
+    m: {a: pow(a, -1, m) for a in range(1, m) if math.gcd(a, m) == 1}
+    for m in (10, 16, 26, 27, 29, 32, 33)
+}
+
+
+def _check_coprime(a: int, m: int) -> None:
+    """Raise ValueError unless key 'a' is coprime with alphabet length m."""
+    inverses = _INVERSES.get(m)
+    if inverses is not None:
+        coprime = a % m in inverses
+    else:
+        coprime = _gcd(a, m) == 1
+    if not coprime:
+        raise ValueError(f"Key 'a' ({a}) must be coprime with alphabet length ({m})")
+
+
 def encrypt(plaintext: str, a: int, b: int, alphabet: str = DEFAULT_ALPHABET) -> str:
     """
     Encrypt plaintext using Affine cipher.
@@ -69,25 +92,17 @@ def encrypt(plaintext: str, a: int, b: int, alphabet: str = DEFAULT_ALPHABET) ->
     m = len(alphabet)
     
     # Check that a is coprime with m
-    if _gcd(a, m) != 1:
-        raise ValueError(f"Key 'a' ({a}) must be coprime with alphabet length ({m})")
+    _check_coprime(a, m)
     
     # Convert input to lowercase
     plaintext = plaintext.lower()
-    result = []
     
-    for char in plaintext:
-        if char in alphabet:
-            # Get position in alphabet
-            x = alphabet.index(char)
-            # Apply affine transformation: E(x) = (ax + b) mod m
-            encrypted_pos = (a * x + b) % m
-            result.append(alphabet[encrypted_pos])
-        else:
-            # Keep characters not in alphabet unchanged
-            result.append(char)
-    
-    return ''.join(result)
+    # produce_alphabet() holds E(x) = (ax + b) mod m at every position x;
+    # characters not in alphabet have no table entry and stay unchanged
+    cipher_alphabet = produce_alphabet(a, b, alphabet)
+    if cipher_alphabet == alphabet:
+        return plaintext
+    return plaintext.translate(ALPHABETS.translation_table(alphabet, cipher_alphabet))
 
 
 def decrypt(ciphertext: str, a: int, b: int, alphabet: str = DEFAULT_ALPHABET) -> str:
@@ -113,30 +128,22 @@ def decrypt(ciphertext: str, a: int, b: int, alphabet: str = DEFAULT_ALPHABET) -
     m = len(alphabet)
     
     # Check that a is coprime with m
-    if _gcd(a, m) != 1:
-        raise ValueError(f"Key 'a' ({a}) must be coprime with alphabet length ({m})")
+    _check_coprime(a, m)
     
-    # Calculate modular inverse of a
-    a_inv = _mod_inverse(a, m)
+    # Calculate modular inverse of a, precomputed for common alphabet lengths
+    a_inv = _INVERSES[m][a % m] if m in _INVERSES else _mod_inverse(a, m)
     
     # Convert input to lowercase
     ciphertext = ciphertext.lower()
-    result = []
     
-    for char in ciphertext:
-        if char in alphabet:
-            # Get position in alphabet
-            y = alphabet.index(char)
-            # Apply inverse affine transformation: D(y) = a^(-1) * (y - b) mod m
-            decrypted_pos = (a_inv * (y - b)) % m
-            result.append(alphabet[decrypted_pos])
-        else:
-            # Keep characters not in alphabet unchanged
-            result.append(char)
-    
-    return ''.join(result)
+    # Apply inverse affine transformation: D(y) = a^(-1) * (y - b) mod m
+    plain_alphabet = ''.join(alphabet[(a_inv * (y - b)) % m] for y in range(m))
+    if plain_alphabet == alphabet:
+        return ciphertext
+    return ciphertext.translate(ALPHABETS.translation_table(alphabet, plain_alphabet))
 
 
+@lru_cache(maxsize=256)
 def produce_alphabet(a: int, b: int, alphabet: str = DEFAULT_ALPHABET) -> str:
     """
     Produce an affine-transformed alphabet.
@@ -165,8 +172,7 @@ def produce_alphabet(a: int, b: int, alphabet: str = DEFAULT_ALPHABET) -> str:
     m = len(alphabet)
     
     # Check that a is coprime with m
-    if _gcd(a, m) != 1:
-        raise ValueError(f"Key 'a' ({a}) must be coprime with alphabet length ({m})")
+    _check_coprime(a, m)
     
     # Apply affine transformation to each position
     result = []
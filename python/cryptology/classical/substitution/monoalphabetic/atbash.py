@@ -6,6 +6,8 @@ The first letter is replaced with the last, the second with the second-to-last,
 Like ROT13, it is symmetric - encrypting twice returns the original text.
 """
 
+from functools import lru_cache
+
 from cryptology import alphabets as ALPHABETS
 
 # Default English alphabet (lowercase only)
@@ -29,20 +31,10 @@ def encrypt(plaintext: str, alphabet: str = DEFAULT_ALPHABET) -> str:
     """
     # Convert input to lowercase
     plaintext = plaintext.lower()
-    result = []
-    
-    for char in plaintext:
-        if char in alphabet:
-            # Find position in alphabet
-            pos = alphabet.index(char)
-            # Reverse position: first <-> last, second <-> second-to-last, etc.
-            reversed_pos = len(alphabet) - 1 - pos
-            result.append(alphabet[reversed_pos])
-        else:
-            # Keep characters not in alphabet unchanged
-            result.append(char)
     
-    return ''.join(result)
+    # Reverse position: first <-> last, second <-> second-to-last, etc.
+    # Characters not in alphabet have no table entry and stay unchanged
+    return plaintext.translate(ALPHABETS.translation_table(alphabet, produce_alphabet(alphabet)))
 
 
 def decrypt(ciphertext: str, alphabet: str = DEFAULT_ALPHABET) -> str:
@@ -66,6 +58,7 @@ def decrypt(ciphertext: str, alphabet: str = DEFAULT_ALPHABET) -> str:
     return encrypt(ciphertext, alphabet)
 
 
+@lru_cache(maxsize=256)
 def produce_alphabet(alphabet: str = DEFAULT_ALPHABET) -> str:
     """
     Produce an Atbash-reversed alphabet.
@@ -6,6 +6,8 @@ It is a type of substitution cipher where each letter in the plaintext is shifte
 a certain number of places down the alphabet.
 """
 
+from functools import lru_cache
+
 from cryptology import alphabets as ALPHABETS
 
 # Default English alphabet (lowercase only)
@@ -32,20 +34,13 @@ def encrypt(plaintext: str, shift: int = 3, alphabet: str = DEFAULT_ALPHABET) ->
     """
     # Convert input to lowercase
     plaintext = plaintext.lower()
-    result = []
-    
-    for char in plaintext:
-        if char in alphabet:
-            # Find position in alphabet
-            pos = alphabet.index(char)
-            # Shift the character
-            new_pos = (pos + shift) % len(alphabet)
-            result.append(alphabet[new_pos])
-        else:
-            # Keep characters not in alphabet unchanged
-            result.append(char)
+    if not alphabet or shift % len(alphabet) == 0:
+        # Empty alphabet or whole-turn shift: nothing to substitute
+        return plaintext
     
-    return ''.join(result)
+    # Characters not in the alphabet have no table entry and stay unchanged
+    shifted_alphabet = produce_alphabet(shift, alphabet)
+    return plaintext.translate(ALPHABETS.translation_table(alphabet, shifted_alphabet))
 
 
 def decrypt(ciphertext: str, shift: int = 3, alphabet: str = DEFAULT_ALPHABET) -> str:
@@ -67,6 +62,7 @@ def decrypt(ciphertext: str, shift: int = 3, alphabet: str = DEFAULT_ALPHABET) -
     return encrypt(ciphertext, -shift, alphabet)
 
 
+@lru_cache(maxsize=256)
 def produce_alphabet(shift: int = 3, alphabet: str = DEFAULT_ALPHABET) -> str:
     """
     Produce a Caesar-shifted alphabet.
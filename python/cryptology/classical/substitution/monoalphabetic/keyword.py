@@ -6,6 +6,8 @@ to create the cipher alphabet. The keyword (with duplicates removed) is written
 followed by the remaining letters of the alphabet in order.
 """
 
+from functools import lru_cache
+
 from cryptology import alphabets as ALPHABETS
 
 # Default English alphabet (lowercase only)
@@ -61,20 +63,13 @@ def encrypt(plaintext: str, keyword: str, alphabet: str = DEFAULT_ALPHABET) -> s
     plaintext = plaintext.lower()
     
     # Create cipher alphabet from keyword
-    cipher_alphabet = _create_cipher_alphabet(keyword, alphabet)
-    
-    result = []
-    for char in plaintext:
-        if char in alphabet:
-            # Find position in plain alphabet
-            pos = alphabet.index(char)
-            # Replace with character from cipher alphabet
-            result.append(cipher_alphabet[pos])
-        else:
-            # Keep characters not in alphabet unchanged
-            result.append(char)
-    
-    return ''.join(result)
+    cipher_alphabet = produce_alphabet(keyword, alphabet)
+    if cipher_alphabet == alphabet:
+        return plaintext
+    
+    # Replace each plain alphabet character with the cipher alphabet character
+    # at the same position; characters not in alphabet stay unchanged
+    return plaintext.translate(ALPHABETS.translation_table(alphabet, cipher_alphabet))
 
 
 def decrypt(ciphertext: str, keyword: str, alphabet: str = DEFAULT_ALPHABET) -> str:
@@ -97,22 +92,16 @@ def decrypt(ciphertext: str, keyword: str, alphabet: str = DEFAULT_ALPHABET) ->
     ciphertext = ciphertext.lower()
     
     # Create cipher alphabet from keyword
-    cipher_alphabet = _create_cipher_alphabet(keyword, alphabet)
-    
-    result = []
-    for char in ciphertext:
-        if char in cipher_alphabet:
-            # Find position in cipher alphabet
-            pos = cipher_alphabet.index(char)
-            # Replace with character from plain alphabet
-            result.append(alphabet[pos])
-        else:
-            # Keep characters not in alphabet unchanged
-            result.append(char)
-    
-    return ''.join(result)
+    cipher_alphabet = produce_alphabet(keyword, alphabet)
+    if cipher_alphabet == alphabet:
+        return ciphertext
+    
+    # Replace each cipher alphabet character with the plain alphabet character
+    # at the same position; characters not in alphabet stay unchanged
+    return ciphertext.translate(ALPHABETS.translation_table(cipher_alphabet, alphabet))
 
 
+@lru_cache(maxsize=256)
 def produce_alphabet(keyword: str, alphabet: str = DEFAULT_ALPHABET) -> str:
     """
     Produce a keyword-based alphabet.
@@ -10,6 +10,7 @@ where the shift is half the alphabet size.
 """
 
 from cryptology import alphabets as ALPHABETS
+from . import caesar
 
 # Default English alphabet (lowercase only)
 DEFAULT_ALPHABET = ALPHABETS.ENGLISH_ALPHABET
@@ -30,23 +31,8 @@ def encrypt(plaintext: str, alphabet: str = DEFAULT_ALPHABET) -> str:
         >>> encrypt("HELLO")
         'uryyb'
     """
-    # Convert input to lowercase
-    plaintext = plaintext.lower()
-    result = []
-    shift = 13  # Fixed shift value (ROT13)
-    
-    for char in plaintext:
-        if char in alphabet:
-            # Find position in alphabet
-            pos = alphabet.index(char)
-            # Shift by 13 positions
-            new_pos = (pos + shift) % len(alphabet)
-            result.append(alphabet[new_pos])
-        else:
-            # Keep characters not in alphabet unchanged
-            result.append(char)
-    
-    return ''.join(result)
+    # Shift by 13 positions
+    return caesar.encrypt(plaintext, 13, alphabet)
 
 
 def decrypt(ciphertext: str, alphabet: str = DEFAULT_ALPHABET) -> str:
@@ -67,21 +53,5 @@ def decrypt(ciphertext: str, alphabet: str = DEFAULT_ALPHABET) -> str:
         >>> decrypt("URYYB")
         'hello'
     """
-    # Convert input to lowercase
-    ciphertext = ciphertext.lower()
-    result = []
-    shift = 13  # Fixed shift value (ROT13)
-    
-    for char in ciphertext:
-        if char in alphabet:
-            # Find position in alphabet
-            pos = alphabet.index(char)
-            # Shift back by 13 positions (decryption)
-            new_pos = (pos - shift) % len(alphabet)
-            result.append(alphabet[new_pos])
-        else:
-            # Keep characters not in alphabet unchanged
-            result.append(char)
-    
-    return ''.join(result)
-
+    # Shift back by 13 positions (decryption)
+    return caesar.decrypt(ciphertext, 13, alphabet)
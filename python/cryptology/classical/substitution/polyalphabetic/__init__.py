@@ -34,6 +34,7 @@ from .autokey import (encrypt as autokey_encrypt, decrypt as autokey_decrypt,
 from .chaocipher import (encrypt as chaocipher_encrypt, decrypt as chaocipher_decrypt,
                         create_custom_alphabets as chaocipher_create_custom_alphabets,
                         create_alphabets_with_mono_ciphers as chaocipher_create_alphabets_with_mono_ciphers,
+                        create_alphabets_with_mono_ciphers_batch as chaocipher_create_alphabets_with_mono_ciphers_batch,
                         decrypt_with_alphabets as chaocipher_decrypt_with_alphabets)
 from .gronsfeld import (encrypt as gronsfeld_encrypt, decrypt as gronsfeld_decrypt,
                        produce_table as gronsfeld_produce_table,
@@ -78,6 +79,7 @@ __all__ = [
     'chaocipher_decrypt',
     'chaocipher_create_custom_alphabets',
     'chaocipher_create_alphabets_with_mono_ciphers',
+    'chaocipher_create_alphabets_with_mono_ciphers_batch',
     'chaocipher_decrypt_with_alphabets',
     'gronsfeld_encrypt',
     'gronsfeld_decrypt',
@@ -13,6 +13,7 @@ This implementation supports:
 """
 
 import random
+from bisect import bisect_left
 from typing import List, Union
 import cryptology.alphabets as ALPHABETS
 from ..monoalphabetic.caesar import produce_alphabet as caesar_produce
@@ -23,6 +24,22 @@ from ..monoalphabetic.atbash import produce_alphabet as atbash_produce
 DEFAULT_ALPHABET = ALPHABETS.ENGLISH_ALPHABET
 
 
+def _fibonacci_numbers(count: int) -> tuple:
+    """Return the first ``count`` Fibonacci numbers, starting 1, 1, 2, ..."""
+    numbers = []
+    a, b = 1, 1
+    for _ in range(count):
+        numbers.append(a)
+        a, b = b, a + b
+    return tuple(numbers)
+
+
+# Fibonacci numbers for the "fibonacci" rotation strategy, computed once.
+# F(60) is far beyond any realistic text length; longer texts fall back to
+# generating the sequence on the fly.
+_FIBONACCI_NUMBERS = _fibonacci_numbers(60)
+
+
 def _generate_scrambled_alphabet(base_alphabet: str, seed: int = 42) -> str:
     """
     Generate a deterministic scrambled alphabet from the base alphabet.
@@ -91,9 +108,15 @@ def _parse_rotation_strategy(strategy: Union[str, List[int]], plaintext: str) ->
         
         elif strategy == "fibonacci":
             # Rotate based on Fibonacci sequence
+            text_length = len(plaintext)
+            if text_length <= _FIBONACCI_NUMBERS[-1]:
+                count = bisect_left(_FIBONACCI_NUMBERS, text_length)
+                # Convert to 0-based indexing
+                return [a - 1 for a in _FIBONACCI_NUMBERS[:count]]
+            
             fib_points = []
             a, b = 1, 1
-            while a < len(plaintext):
+            while a < text_length:
                 fib_points.append(a - 1)  # Convert to 0-based indexing
                 a, b = b, a + b
             return fib_points
@@ -131,25 +154,23 @@ def _rotate_alphabet(alphabet: str, amount: int) -> str:
     return alphabet[amount:] + alphabet[:amount]
 
 
-def _find_char_position(alphabet: str, char: str) -> int:
+def _char_positions(alphabet: str) -> dict:
     """
-    Find position of character in alphabet.
+    Build a case-insensitive character -> position map for an alphabet.
+    
+    Characters are compared in lowercase, and the first occurrence of a
+    character wins.
     
     Args:
-        alphabet: Alphabet to search in
-        char: Character to find
+        alphabet: Alphabet to index
         
     Returns:
-        Position of character (0-based)
-        
-    Raises:
-        ValueError: If character not found
+        Dictionary mapping lowercase characters to their position
     """
-    char_upper = char.lower()
+    positions = {}
     for i, c in enumerate(alphabet):
-        if c.lower() == char_upper:
-            return i
-    raise ValueError(f"Character '{char}' not found in alphabet")
+        positions.setdefault(c.lower(), i)
+    return positions
 
 
 def encrypt(plaintext: str,
@@ -195,10 +216,7 @@ def encrypt(plaintext: str,
         raise ValueError(f"Invalid rotation strategy: {e}")
     
     # Clean plaintext
-    plaintext_clean = ""
-    for char in plaintext.lower():
-        if char.isalpha():
-            plaintext_clean += char
+    plaintext_clean = "".join(char for char in plaintext.lower() if char.isalpha())
     
     if not plaintext_clean:
         return ""
@@ -206,35 +224,34 @@ def encrypt(plaintext: str,
     # Initialize inner disk position
     current_position = initial_position % len(inner_alphabet)
     inner_alphabet_current = _rotate_alphabet(inner_alphabet, current_position)
+    outer_positions = _char_positions(outer_alphabet)
     
-    result = ""
+    result = []
     rotation_index = 0
     
     for i, char in enumerate(plaintext_clean):
-        try:
-            # Find character in outer alphabet
-            outer_pos = _find_char_position(outer_alphabet, char)
-            
-            # Map to inner alphabet
-            if outer_pos < len(inner_alphabet_current):
-                cipher_char = inner_alphabet_current[outer_pos]
-            else:
-                # Handle different alphabet sizes
-                cipher_char = inner_alphabet_current[outer_pos % len(inner_alphabet_current)]
-            
-            result += cipher_char
-            
-            # Check if we need to rotate
-            if rotation_index < len(rotation_points) and i == rotation_points[rotation_index]:
-                current_position = (current_position + rotation_amount) % len(inner_alphabet)
-                inner_alphabet_current = _rotate_alphabet(inner_alphabet, current_position)
-                rotation_index += 1
-                
-        except ValueError:
+        # Find character in outer alphabet
+        outer_pos = outer_positions.get(char)
+        if outer_pos is None:
             # Skip characters not in alphabet
             continue
+        
+        # Map to inner alphabet
+        if outer_pos < len(inner_alphabet_current):
+            cipher_char = inner_alphabet_current[outer_pos]
+        else:
+            # Handle different alphabet sizes
+            cipher_char = inner_alphabet_current[outer_pos % len(inner_alphabet_current)]
+        
+        result.append(cipher_char)
+        
+        # Check if we need to rotate
+        if rotation_index < len(rotation_points) and i == rotation_points[rotation_index]:
+            current_position = (current_position + rotation_amount) % len(inner_alphabet)
+            inner_alphabet_current = _rotate_alphabet(inner_alphabet, current_position)
+            rotation_index += 1
     
-    return result
+    return "".join(result)
 
 
 def decrypt(ciphertext: str,
@@ -280,10 +297,7 @@ def decrypt(ciphertext: str,
         raise ValueError(f"Invalid rotation strategy: {e}")
     
     # Clean ciphertext
-    ciphertext_clean = ""
-    for char in ciphertext.lower():
-        if char.isalpha():
-            ciphertext_clean += char
+    ciphertext_clean = "".join(char for char in ciphertext.lower() if char.isalpha())
     
     if not ciphertext_clean:
         return ""
@@ -291,32 +305,32 @@ def decrypt(ciphertext: str,
     # Initialize inner disk position
     current_position = initial_position % len(inner_alphabet)
     inner_alphabet_current = _rotate_alphabet(inner_alphabet, current_position)
+    inner_positions = _char_positions(inner_alphabet_current)
     
-    result = ""
+    result = []
     rotation_index = 0
     
     for i, char in enumerate(ciphertext_clean):
-        try:
-            # Find character in inner alphabet
-            inner_pos = _find_char_position(inner_alphabet_current, char)
-            
-            # Map to outer alphabet
-            if inner_pos < len(outer_alphabet):
-                plain_char = outer_alphabet[inner_pos]
-            else:
-                # Handle different alphabet sizes
-                plain_char = outer_alphabet[inner_pos % len(outer_alphabet)]
-            
-            result += plain_char
-            
-            # Check if we need to rotate
-            if rotation_index < len(rotation_points) and i == rotation_points[rotation_index]:
-                current_position = (current_position + rotation_amount) % len(inner_alphabet)
-                inner_alphabet_current = _rotate_alphabet(inner_alphabet, current_position)
-                rotation_index += 1
-                
-        except ValueError:
+        # Find character in inner alphabet
+        inner_pos = inner_positions.get(char)
+        if inner_pos is None:
             # Skip characters not in alphabet
             continue
+        
+        # Map to outer alphabet
+        if inner_pos < len(outer_alphabet):
+            plain_char = outer_alphabet[inner_pos]
+        else:
+            # Handle different alphabet sizes
+            plain_char = outer_alphabet[inner_pos % len(outer_alphabet)]
+        
+        result.append(plain_char)
+        
+        # Check if we need to rotate
+        if rotation_index < len(rotation_points) and i == rotation_points[rotation_index]:
+            current_position = (current_position + rotation_amount) % len(inner_alphabet)
+            inner_alphabet_current = _rotate_alphabet(inner_alphabet, current_position)
+            inner_positions = _char_positions(inner_alphabet_current)
+            rotation_index += 1
     
-    return result
+    return "".join(result)
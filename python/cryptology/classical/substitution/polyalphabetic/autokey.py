@@ -285,7 +285,7 @@ def _prepare_text(text: str, alphabet: str) -> str:
     Returns:
         Cleaned text ready for encryption
     """
-    text_clean = ""
+    text_clean = []
     for char in text.lower():
         if char.isalpha():
             # Handle custom alphabets
@@ -305,10 +305,10 @@ def _prepare_text(text: str, alphabet: str) -> str:
                         char = 'S'
                     elif char == 'Ü':
                         char = 'U'
-            text_clean += char
+            text_clean.append(char)
         elif char == ' ':
-            text_clean += ' '  # Preserve spaces
-    return text_clean
+            text_clean.append(' ')  # Preserve spaces
+    return "".join(text_clean)
 
 
 def _prepare_ciphertext(ciphertext: str) -> str:
@@ -321,11 +321,32 @@ def _prepare_ciphertext(ciphertext: str) -> str:
     Returns:
         Cleaned ciphertext ready for decryption
     """
-    text_clean = ""
-    for char in ciphertext.lower():
-        if char.isalpha() or char == ' ':
-            text_clean += char
-    return text_clean
+    return "".join(char for char in ciphertext.lower() if char.isalpha() or char == ' ')
+
+
+def _char_positions(alphabet: str) -> dict:
+    """
+    Build a character -> position map for an alphabet.
+    
+    Args:
+        alphabet: The alphabet being used
+        
+    Returns:
+        Dictionary mapping each character to its first position, as
+        alphabet.index() would
+    """
+    positions = {}
+    for i, char in enumerate(alphabet):
+        positions.setdefault(char, i)
+    return positions
+
+
+def _position(positions: dict, char: str) -> int:
+    """Look a character up in a map built by _char_positions()."""
+    try:
+        return positions[char]
+    except KeyError:
+        raise ValueError(f"Character '{char}' not found in alphabet") from None
 
 
 def _extend_key(key: str, plaintext: str, alphabet: str) -> str:
@@ -341,10 +362,9 @@ def _extend_key(key: str, plaintext: str, alphabet: str) -> str:
         Extended key combining initial key and plaintext
     """
     # Prepare plaintext (remove spaces and non-alphabetic characters)
-    prepared_plaintext = ""
-    for char in plaintext.lower():
-        if char.isalpha() and char in alphabet:
-            prepared_plaintext += char
+    prepared_plaintext = "".join(
+        char for char in plaintext.lower() if char.isalpha() and char in alphabet
+    )
     
     # Combine initial key with prepared plaintext
     extended_key = key + prepared_plaintext
@@ -364,10 +384,9 @@ def _extend_key_for_decryption(key: str, decrypted_so_far: str, alphabet: str) -
         Extended key for decryption
     """
     # Prepare decrypted text (remove spaces and non-alphabetic characters)
-    prepared_decrypted = ""
-    for char in decrypted_so_far.lower():
-        if char.isalpha() and char in alphabet:
-            prepared_decrypted += char
+    prepared_decrypted = "".join(
+        char for char in decrypted_so_far.lower() if char.isalpha() and char in alphabet
+    )
     
     # Combine initial key with prepared decrypted text
     extended_key = key + prepared_decrypted
@@ -400,21 +419,22 @@ def encrypt(plaintext: str, key: str, alphabet: str = DEFAULT_ALPHABET, table: O
     # Extend key using plaintext (Auto-key mechanism)
     extended_key = _extend_key(key, prepared_text, alphabet)
     
-    result = ""
+    positions = _char_positions(alphabet)
+    result = []
     key_index = 0
     
     for char in prepared_text:
         if char == ' ':
-            result += ' '
+            result.append(' ')
             continue
         
-        if char in alphabet:
+        if char in positions:
             # Find character position in alphabet
-            char_pos = alphabet.index(char)
+            char_pos = positions[char]
             
             # Get key character from extended key
             key_char = extended_key[key_index % len(extended_key)]
-            key_pos = alphabet.index(key_char)
+            key_pos = _position(positions, key_char)
             
             # Verify table structure
             if not isinstance(table[key_pos], list):
@@ -422,11 +442,11 @@ def encrypt(plaintext: str, key: str, alphabet: str = DEFAULT_ALPHABET, table: O
             
             # Auto-key encryption: use table for encryption
             encrypted_char = table[key_pos][char_pos]
-            result += encrypted_char
+            result.append(encrypted_char)
             
             key_index += 1
     
-    return result
+    return "".join(result)
 
 
 def decrypt(ciphertext: str, key: str, alphabet: str = DEFAULT_ALPHABET, table: Optional[List[List[str]]] = None) -> str:
@@ -452,41 +472,40 @@ def decrypt(ciphertext: str, key: str, alphabet: str = DEFAULT_ALPHABET, table:
     # Prepare ciphertext
     prepared_ciphertext = _prepare_ciphertext(ciphertext)
     
-    result = ""
+    positions = _char_positions(alphabet)
+    result = []
     key_index = 0
-    decrypted_so_far = ""
+    # Extended key, grown in place with each decrypted character instead of
+    # being rebuilt from the whole decrypted prefix on every step
+    extended_key = list(key)
     
     for char in prepared_ciphertext:
         if char == ' ':
-            result += ' '
+            result.append(' ')
             continue
         
-        if char in alphabet:
-            # Extend key using already decrypted text
-            extended_key = _extend_key_for_decryption(key, decrypted_so_far, alphabet)
-            
+        if char in positions:
             # Find character position in alphabet
-            char_pos = alphabet.index(char)
+            char_pos = positions[char]
             
             # Get key character from extended key
             key_char = extended_key[key_index % len(extended_key)]
-            key_pos = alphabet.index(key_char)
+            key_pos = _position(positions, key_char)
             
             # Auto-key decryption: find plaintext character in table
             # Look for ciphertext character in the key row
             for col_idx, table_char in enumerate(table[key_pos]):
                 if table_char == char:
                     decrypted_char = alphabet[col_idx]
-                    result += decrypted_char
-                    decrypted_so_far += decrypted_char
                     break
             else:
                 # Fallback to modular arithmetic if character not found in table
                 decrypted_pos = (char_pos - key_pos) % len(alphabet)
                 decrypted_char = alphabet[decrypted_pos]
-                result += decrypted_char
-                decrypted_so_far += decrypted_char
+            
+            result.append(decrypted_char)
+            extended_key.extend(_extend_key_for_decryption("", decrypted_char, alphabet))
             
             key_index += 1
     
-    return result
+    return "".join(result)
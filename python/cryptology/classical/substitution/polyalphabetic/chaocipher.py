@@ -20,7 +20,19 @@ Algorithm:
 """
 
 import string
-from typing import List, Tuple, Optional
+from typing import List, Tuple, Optional, Union
+from ..monoalphabetic.caesar import produce_alphabet as caesar_produce
+from ..monoalphabetic.atbash import produce_alphabet as atbash_produce
+from ..monoalphabetic.keyword import produce_alphabet as keyword_produce
+from ..monoalphabetic.affine import produce_alphabet as affine_produce
+
+# Monoalphabetic alphabet builders keyed by cipher name; Atbash takes no parameters
+_CIPHER_TABLE = {
+    "caesar": lambda params, alphabet: caesar_produce(**params, alphabet=alphabet),
+    "atbash": lambda params, alphabet: atbash_produce(alphabet=alphabet),
+    "keyword": lambda params, alphabet: keyword_produce(**params, alphabet=alphabet),
+    "affine": lambda params, alphabet: affine_produce(**params, alphabet=alphabet),
+}
 
 
 def _create_default_alphabets() -> Tuple[List[str], List[str]]:
@@ -121,15 +133,15 @@ def _prepare_text(text: str, alphabet: Optional[List[str]] = None) -> str:
 
 
 def encrypt(plaintext: str, 
-           left_alphabet: Optional[List[str]] = None,
-           right_alphabet: Optional[List[str]] = None) -> str:
+           left_alphabet: Optional[Union[str, List[str]]] = None,
+           right_alphabet: Optional[Union[str, List[str]]] = None) -> str:
     """
     Encrypt plaintext using Chaocipher.
     
     Args:
         plaintext: Text to encrypt
-        left_alphabet: Left alphabet (ciphertext alphabet)
-        right_alphabet: Right alphabet (plaintext alphabet)
+        left_alphabet: Left alphabet (ciphertext alphabet), as a string or list
+        right_alphabet: Right alphabet (plaintext alphabet), as a string or list
     
     Returns:
         Encrypted text
@@ -140,9 +152,9 @@ def encrypt(plaintext: str,
     # Prepare text
     prepared_text = _prepare_text(plaintext, right_alphabet)
     
-    encrypted = ""
-    current_left = left_alphabet.copy()
-    current_right = right_alphabet.copy()
+    encrypted = []
+    current_left = list(left_alphabet)
+    current_right = list(right_alphabet)
     
     for char in prepared_text:
         if char not in current_right:
@@ -153,25 +165,25 @@ def encrypt(plaintext: str,
         
         # Get corresponding character from left alphabet
         cipher_char = current_left[right_pos]
-        encrypted += cipher_char
+        encrypted.append(cipher_char)
         
         # Permute both alphabets
         current_left = _permute_left_alphabet(current_left, cipher_char)
         current_right = _permute_right_alphabet(current_right, char)
     
-    return encrypted
+    return "".join(encrypted)
 
 
 def decrypt(ciphertext: str,
-           left_alphabet: Optional[List[str]] = None,
-           right_alphabet: Optional[List[str]] = None) -> str:
+           left_alphabet: Optional[Union[str, List[str]]] = None,
+           right_alphabet: Optional[Union[str, List[str]]] = None) -> str:
     """
     Decrypt ciphertext using Chaocipher.
     
     Args:
         ciphertext: Text to decrypt
-        left_alphabet: Left alphabet (ciphertext alphabet)
-        right_alphabet: Right alphabet (plaintext alphabet)
+        left_alphabet: Left alphabet (ciphertext alphabet), as a string or list
+        right_alphabet: Right alphabet (plaintext alphabet), as a string or list
     
     Returns:
         Decrypted text
@@ -182,9 +194,9 @@ def decrypt(ciphertext: str,
     # Prepare text
     prepared_text = _prepare_text(ciphertext, left_alphabet)
     
-    decrypted = ""
-    current_left = left_alphabet.copy()
-    current_right = right_alphabet.copy()
+    decrypted = []
+    current_left = list(left_alphabet)
+    current_right = list(right_alphabet)
     
     for char in prepared_text:
         if char not in current_left:
@@ -195,13 +207,13 @@ def decrypt(ciphertext: str,
         
         # Get corresponding character from right alphabet
         plain_char = current_right[left_pos]
-        decrypted += plain_char
+        decrypted.append(plain_char)
         
         # Permute both alphabets (same as encryption - self-reciprocal)
         current_left = _permute_left_alphabet(current_left, char)
         current_right = _permute_right_alphabet(current_right, plain_char)
     
-    return decrypted
+    return "".join(decrypted)
 
 
 def create_custom_alphabets(left_keyword: str = "", right_keyword: str = "") -> Tuple[List[str], List[str]]:
@@ -248,9 +260,17 @@ def create_custom_alphabets(left_keyword: str = "", right_keyword: str = "") ->
     return left_alphabet, right_alphabet
 
 
+def _cipher_builder(cipher: str, side: str):
+    """Look up the alphabet builder for a monoalphabetic cipher name."""
+    try:
+        return _CIPHER_TABLE[cipher]
+    except KeyError:
+        raise ValueError(f"Unsupported {side} cipher: {cipher}") from None
+
+
 def create_alphabets_with_mono_ciphers(left_cipher: str = "atbash", left_params: dict = None, 
                                      right_cipher: str = "caesar", right_params: dict = None,
-                                     alphabet: str = None) -> Tuple[List[str], List[str]]:
+                                     alphabet: str = None) -> Tuple[str, str]:
     """
     Create custom alphabets using monoalphabetic substitution ciphers.
     
@@ -262,7 +282,7 @@ def create_alphabets_with_mono_ciphers(left_cipher: str = "atbash", left_params:
         alphabet: Base alphabet to use (default: English uppercase with space)
     
     Returns:
-        Tuple of (left_alphabet, right_alphabet)
+        Tuple of (left_alphabet, right_alphabet) as lowercase strings
     
     Example:
         >>> left_alphabet, right_alphabet = create_alphabets_with_mono_ciphers(
@@ -273,49 +293,53 @@ def create_alphabets_with_mono_ciphers(left_cipher: str = "atbash", left_params:
     if alphabet is None:
         alphabet = string.ascii_uppercase + ' '
     
-    if left_params is None:
-        left_params = {}
-    if right_params is None:
-        right_params = {}
+    left_builder = _cipher_builder(left_cipher, "left")
+    right_builder = _cipher_builder(right_cipher, "right")
     
-    # Import monoalphabetic ciphers
-    from ..monoalphabetic.caesar import produce_alphabet as caesar_produce
-    from ..monoalphabetic.atbash import produce_alphabet as atbash_produce
-    from ..monoalphabetic.keyword import produce_alphabet as keyword_produce
-    from ..monoalphabetic.affine import produce_alphabet as affine_produce
+    left_alphabet_str = left_builder(left_params or {}, alphabet)
+    right_alphabet_str = right_builder(right_params or {}, alphabet)
     
-    # Create left alphabet
-    if left_cipher == "caesar":
-        left_alphabet_str = caesar_produce(**left_params, alphabet=alphabet)
-    elif left_cipher == "atbash":
-        left_alphabet_str = atbash_produce(alphabet=alphabet)
-    elif left_cipher == "keyword":
-        left_alphabet_str = keyword_produce(**left_params, alphabet=alphabet)
-    elif left_cipher == "affine":
-        left_alphabet_str = affine_produce(**left_params, alphabet=alphabet)
-    else:
-        raise ValueError(f"Unsupported left cipher: {left_cipher}")
+    return left_alphabet_str.lower(), right_alphabet_str.lower()
+
+
+def create_alphabets_with_mono_ciphers_batch(specs: List[dict],
+                                             alphabet: str = None) -> List[Tuple[str, str]]:
+    """
+    Create several pairs of custom alphabets using monoalphabetic substitution ciphers.
     
-    # Create right alphabet
-    if right_cipher == "caesar":
-        right_alphabet_str = caesar_produce(**right_params, alphabet=alphabet)
-    elif right_cipher == "atbash":
-        right_alphabet_str = atbash_produce(alphabet=alphabet)
-    elif right_cipher == "keyword":
-        right_alphabet_str = keyword_produce(**right_params, alphabet=alphabet)
-    elif right_cipher == "affine":
-        right_alphabet_str = affine_produce(**right_params, alphabet=alphabet)
-    else:
-        raise ValueError(f"Unsupported right cipher: {right_cipher}")
+    Args:
+        specs: List of dictionaries with "left_cipher", "left_params", "right_cipher"
+               and "right_params" keys, as accepted by create_alphabets_with_mono_ciphers
+               (missing keys fall back to the same defaults, extra keys are ignored)
+        alphabet: Base alphabet to use (default: English uppercase with space)
     
-    # Convert to lists
-    left_alphabet = list(left_alphabet_str.lower())
-    right_alphabet = list(right_alphabet_str.lower())
+    Returns:
+        List of (left_alphabet, right_alphabet) tuples as lowercase strings, in spec order
     
-    return left_alphabet, right_alphabet
+    Raises:
+        ValueError: If a spec names an unsupported cipher
+    
+    Example:
+        >>> pairs = create_alphabets_with_mono_ciphers_batch([
+        ...     {"left_cipher": "caesar", "left_params": {"shift": 5},
+        ...      "right_cipher": "keyword", "right_params": {"keyword": "SECRET"}},
+        ...     {"left_cipher": "atbash", "right_cipher": "affine",
+        ...      "right_params": {"a": 5, "b": 7}},
+        ... ])
+    """
+    return [
+        create_alphabets_with_mono_ciphers(
+            left_cipher=spec.get("left_cipher", "atbash"), left_params=spec.get("left_params"),
+            right_cipher=spec.get("right_cipher", "caesar"), right_params=spec.get("right_params"),
+            alphabet=alphabet
+        )
+        for spec in specs
+    ]
 
 
-def decrypt_with_alphabets(ciphertext: str, left_alphabet: List[str], right_alphabet: List[str]) -> str:
+def decrypt_with_alphabets(ciphertext: str,
+                           left_alphabet: Union[str, List[str]],
+                           right_alphabet: Union[str, List[str]]) -> str:
     """
     Decrypt ciphertext using provided alphabets.
     
@@ -16,6 +16,7 @@ This implementation supports:
 
 import secrets
 import re
+from functools import lru_cache
 from typing import List, Optional, Tuple
 from ..monoalphabetic.caesar import produce_alphabet as caesar_produce
 from ..monoalphabetic.keyword import produce_alphabet as keyword_produce
@@ -265,6 +266,9 @@ def produce_table(table_type: str = "classical",
     """
     Produce a Gronsfeld table using different strategies.
     
+    Tables are built once per (table_type, alphabet, parameters) and cached;
+    every call returns a fresh copy that the caller may modify.
+    
     Args:
         table_type: Type of table to generate ("classical", "caesar", "affine", "keyword", "atbash")
         alphabet: The alphabet to use for the table
@@ -276,8 +280,18 @@ def produce_table(table_type: str = "classical",
     Raises:
         ValueError: If table_type is invalid or required parameters are missing
     """
-    table_type = table_type.lower()
-    
+    table = _cached_table(table_type.lower(), alphabet, tuple(sorted(kwargs.items())))
+    return [list(row) for row in table]
+
+
+@lru_cache(maxsize=32)
+def _cached_table(table_type: str, alphabet: str, params: Tuple[Tuple[str, object], ...]) -> Tuple[Tuple[str, ...], ...]:
+    """Build a Gronsfeld table once per argument set, as read-only rows."""
+    return tuple(tuple(row) for row in _build_table(table_type, alphabet, **dict(params)))
+
+
+def _build_table(table_type: str, alphabet: str, **kwargs) -> List[List[str]]:
+    """Build a Gronsfeld table of the given (lowercase) type."""
     if table_type == "classical":
         return _create_classical_table(alphabet)
     
@@ -371,7 +385,7 @@ def encrypt(plaintext: str,
     
     # Use classical table if none provided
     if table is None:
-        table = _create_classical_table(alphabet)
+        table = _cached_table("classical", alphabet, ())
     
     result = []
     key_index = 0
@@ -426,7 +440,7 @@ def decrypt(ciphertext: str,
     
     # Use classical table if none provided
     if table is None:
-        table = _create_classical_table(alphabet)
+        table = _cached_table("classical", alphabet, ())
     
     result = []
     key_index = 0
@@ -16,6 +16,7 @@ This implementation supports:
 
 import secrets
 import re
+from functools import lru_cache
 from typing import List, Optional, Tuple
 
 import cryptology.alphabets as ALPHABETS
@@ -287,6 +288,34 @@ def _find_letter_pair(letter: str, pairs: List[Tuple[str, str]]) -> Optional[Tup
     return None
 
 
+@lru_cache(maxsize=32)
+def _pair_tables(pairs: Tuple[Tuple[str, str], ...]) -> Tuple[dict, dict]:
+    """
+    Precompute the substitutions made by a set of alphabet pairs.
+    
+    Equivalent to looking each letter up with _find_letter_pair(): the first
+    pair containing a letter decides its substitution.
+    
+    Args:
+        pairs: Alphabet pairs, as a tuple so they can be cached
+        
+    Returns:
+        Tuple of (even_table, odd_table) mapping a lowercase letter to its
+        substitute for key letters at even and odd alphabet positions
+    """
+    even_table = {}
+    odd_table = {}
+    for pair in pairs:
+        for letter in pair:
+            if letter == pair[0]:
+                even_table.setdefault(letter, pair[1])
+                odd_table.setdefault(letter, pair[0])
+            else:
+                even_table.setdefault(letter, pair[0])
+                odd_table.setdefault(letter, pair[1])
+    return even_table, odd_table
+
+
 def _validate_alphabetic_key(key: str) -> None:
     """
     Validate that the key contains only alphabetic characters.
@@ -304,31 +333,6 @@ def _validate_alphabetic_key(key: str) -> None:
         raise ValueError("Porta key must contain only alphabetic characters")
 
 
-def _get_pair_index(key_letter: str, alphabet: str) -> int:
-    """
-    Get the pair index based on the key letter.
-    
-    For English alphabet: A,B -> 0, C,D -> 1, E,F -> 2, etc.
-    
-    Args:
-        key_letter: The key letter
-        alphabet: The alphabet being used
-        
-    Returns:
-        The index of the pair to use
-    """
-    alphabet_len = len(alphabet)
-    letter_pos = alphabet.find(key_letter.lower())
-    
-    if alphabet_len == 26:
-        # English alphabet: pairs are every 2 letters
-        return letter_pos // 2
-    else:
-        # Other alphabets: pairs are every (alphabet_len // 2) letters
-        pair_size = alphabet_len // 2
-        return letter_pos // pair_size
-
-
 def encrypt(plaintext: str, 
            key: str, 
            alphabet: str = DEFAULT_ALPHABET,
@@ -357,28 +361,23 @@ def encrypt(plaintext: str,
     if pairs is None:
         pairs = _create_default_pairs(alphabet)
     
+    even_table, odd_table = _pair_tables(tuple(tuple(pair) for pair in pairs))
+    
+    # Even key positions (A, C, E, etc.) swap within the pair, odd ones
+    # (B, D, F, etc.) keep the letter
+    key_tables = [even_table if alphabet.find(key_letter.lower()) % 2 == 0 else odd_table
+                  for key_letter in key]
+    
     result = []
     key_index = 0
     
     for char in plaintext:
-        if char.lower() in alphabet:
-            # Get the pair index from the key
-            pair_index = _get_pair_index(key[key_index % len(key)], alphabet)
-            
+        char_lower = char.lower()
+        if char_lower in alphabet:
             # Find which pair contains this letter
-            letter_pair = _find_letter_pair(char, pairs)
+            encrypted_char = key_tables[key_index % len(key)].get(char_lower)
             
-            if letter_pair:
-                # Determine which letter in the pair to use based on key
-                key_letter = key[key_index % len(key)].lower()
-                key_pos = alphabet.find(key_letter)
-                
-                # Use the pair based on key letter position
-                if key_pos % 2 == 0:  # Even position (A, C, E, etc.)
-                    encrypted_char = letter_pair[1] if char.lower() == letter_pair[0] else letter_pair[0]
-                else:  # Odd position (B, D, F, etc.)
-                    encrypted_char = letter_pair[0] if char.lower() == letter_pair[0] else letter_pair[1]
-                
+            if encrypted_char is not None:
                 # Preserve case
                 if char.islower():
                     encrypted_char = encrypted_char.lower()
@@ -13,6 +13,7 @@ where each row is a different Caesar cipher. This implementation supports:
 """
 
 import secrets
+from functools import lru_cache
 from typing import List, Optional, Tuple
 import cryptology.alphabets as ALPHABETS
 from ..monoalphabetic.caesar import produce_alphabet as caesar_produce
@@ -126,6 +127,23 @@ def _create_classical_table(alphabet: str) -> List[List[str]]:
     return table
 
 
+@lru_cache(maxsize=32)
+def _default_table(alphabet: str) -> List[List[str]]:
+    """
+    Classical table used when encrypt/decrypt get no table.
+    
+    Cached per alphabet and shared between calls, so it must not be modified;
+    produce_table() still returns a fresh table.
+    
+    Args:
+        alphabet: The alphabet to use for the table
+        
+    Returns:
+        A 2D list representing the Vigenère table
+    """
+    return _create_classical_table(alphabet)
+
+
 def _create_caesar_table(alphabet: str, shift: int) -> List[List[str]]:
     """
     Create Vigenère table where each row uses Caesar cipher with different shifts.
@@ -283,28 +301,24 @@ def produce_table(table_type: str = "classical",
         raise ValueError(f"Unknown table type: {table_type}")
 
 
-def _find_char_position(alphabet: str, char: str) -> int:
+@lru_cache(maxsize=32)
+def _char_positions(alphabet: str) -> dict:
     """
-    Find position of character in alphabet.
+    Map each lowercase alphabet character to its position.
+    
+    Matching is case-insensitive for lowercase input characters, and the
+    first occurrence of a character decides its position.
     
     Args:
-        alphabet: Alphabet to search in
-        char: Character to find
+        alphabet: Alphabet to index
         
     Returns:
-        Position of character (0-based)
-        
-    Raises:
-        ValueError: If character not found
+        Dictionary mapping character to position (0-based)
     """
-    # For Turkish characters and case-insensitive matching
-    char_lower = char.lower()
-    alphabet_lower = alphabet.lower()
-    
-    for i, c in enumerate(alphabet_lower):
-        if c == char_lower:
-            return i
-    raise ValueError(f"Character '{char}' not found in alphabet")
+    positions = {}
+    for i, c in enumerate(alphabet.lower()):
+        positions.setdefault(c, i)
+    return positions
 
 
 def _prepare_ciphertext(text: str, alphabet: str) -> str:
@@ -318,15 +332,8 @@ def _prepare_ciphertext(text: str, alphabet: str) -> str:
     Returns:
         Cleaned text ready for decryption
     """
-    text_clean = ""
-    for char in text.lower():
-        if char.isalpha():
-            text_clean += char
-        elif char == ' ':
-            # Preserve spaces
-            text_clean += char
-    
-    return text_clean
+    # Keep letters and spaces
+    return ''.join(char for char in text.lower() if char.isalpha() or char == ' ')
 
 
 def _prepare_text(text: str, alphabet: str) -> str:
@@ -340,15 +347,8 @@ def _prepare_text(text: str, alphabet: str) -> str:
     Returns:
         Cleaned text ready for encryption
     """
-    text_clean = ""
-    for char in text.lower():
-        if char.isalpha():
-            text_clean += char
-        elif char == ' ':
-            # Preserve spaces
-            text_clean += char
-    
-    return text_clean
+    # Keep letters and spaces
+    return ''.join(char for char in text.lower() if char.isalpha() or char == ' ')
 
 
 def encrypt(plaintext: str, 
@@ -372,12 +372,12 @@ def encrypt(plaintext: str,
     
     # Generate table if not provided
     if table is None:
-        # Always use _create_classical_table to ensure correct structure
-        table = _create_classical_table(alphabet)
+        # Always use the classical table to ensure correct structure
+        table = _default_table(alphabet)
     
     # Verify table structure at start
     if not isinstance(table[0], list):
-        table = _create_classical_table(alphabet)
+        table = _default_table(alphabet)
     
     # Prepare text and key
     plaintext_clean = _prepare_text(plaintext, alphabet)
@@ -387,38 +387,36 @@ def encrypt(plaintext: str,
         return ""
     
     # Encrypt using Vigenère method
-    result = ""
+    positions = _char_positions(alphabet)
+    key_positions = [positions.get(key_char) for key_char in key_clean]
+    key_len = len(key_positions)
+    result = []
     key_index = 0
     
     for char in plaintext_clean:
         if char == ' ':
             # Preserve spaces
-            result += char
-        else:
-            try:
-                # Find character positions
-                plain_pos = _find_char_position(alphabet, char)
-                key_index_mod = key_index % len(key_clean)
-                key_char = key_clean[key_index_mod]
-                key_pos = _find_char_position(alphabet, key_char)
-                
-                # Verify table structure
-                if not isinstance(table[key_pos], list):
-                    # Table was corrupted somehow - rebuild
-                    table = _create_classical_table(alphabet)
-                
-                # Get cipher character from table
-                cipher_char = table[key_pos][plain_pos]
-                result += cipher_char
-                
-                # Move to next key character
-                key_index += 1
-                
-            except ValueError as e:
-                # Skip characters not in alphabet
-                continue
-    
-    return result
+            result.append(char)
+            continue
+        
+        # Skip characters not in alphabet
+        plain_pos = positions.get(char)
+        key_pos = key_positions[key_index % key_len]
+        if plain_pos is None or key_pos is None:
+            continue
+        
+        # Verify table structure
+        if not isinstance(table[key_pos], list):
+            # Table was corrupted somehow - rebuild
+            table = _default_table(alphabet)
+        
+        # Get cipher character from table
+        result.append(table[key_pos][plain_pos])
+        
+        # Move to next key character
+        key_index += 1
+    
+    return ''.join(result)
 
 
 def decrypt(ciphertext: str,
@@ -442,12 +440,12 @@ def decrypt(ciphertext: str,
     
     # Generate table if not provided
     if table is None:
-        # Always use _create_classical_table to ensure correct structure
-        table = _create_classical_table(alphabet)
+        # Always use the classical table to ensure correct structure
+        table = _default_table(alphabet)
     
     # Verify table structure at start
     if table and not isinstance(table[0], list):
-        table = _create_classical_table(alphabet)
+        table = _default_table(alphabet)
     
     # Prepare text and key
     ciphertext_clean = _prepare_ciphertext(ciphertext, alphabet)
@@ -457,41 +455,46 @@ def decrypt(ciphertext: str,
         return ""
     
     # Decrypt using Vigenère method
-    result = ""
+    positions = _char_positions(alphabet)
+    key_positions = [positions.get(key_char) for key_char in key_clean]
+    key_len = len(key_positions)
+    row_positions = {}
+    result = []
     key_index = 0
     
-    for i, char in enumerate(ciphertext_clean):
+    for char in ciphertext_clean:
         if char == ' ':
             # Preserve spaces
-            result += char
-        else:
-            try:
-                # Find key position
-                key_pos = _find_char_position(alphabet, key_clean[key_index % len(key_clean)])
-                
-                # Find cipher character in table row
-                if not isinstance(table[key_pos], list):
-                    # Table was corrupted - rebuild
-                    table = _create_classical_table(alphabet)
-                
-                cipher_pos = None
-                for j, c in enumerate(table[key_pos]):
-                    if c == char:
-                        cipher_pos = j
-                        break
-                
-                if cipher_pos is None:
-                    raise ValueError(f"Character '{char}' not found in table row")
-                
-                # Get plain character from alphabet
-                plain_char = alphabet[cipher_pos]
-                result += plain_char
-                
-                # Move to next key character
-                key_index += 1
-                
-            except ValueError:
-                # Skip characters not in alphabet
-                continue
-    
-    return result
+            result.append(char)
+            continue
+        
+        # Skip characters not in alphabet
+        key_pos = key_positions[key_index % key_len]
+        if key_pos is None:
+            continue
+        
+        # Find cipher character in table row
+        if not isinstance(table[key_pos], list):
+            # Table was corrupted - rebuild
+            table = _default_table(alphabet)
+            row_positions.clear()
+        
+        row = row_positions.get(key_pos)
+        if row is None:
+            row = {}
+            for j, c in enumerate(table[key_pos]):
+                row.setdefault(c, j)
+            row_positions[key_pos] = row
+        
+        cipher_pos = row.get(char)
+        if cipher_pos is None:
+            # Character not found in table row
+            continue
+        
+        # Get plain character from alphabet
+        result.append(alphabet[cipher_pos])
+        
+        # Move to next key character
+        key_index += 1
+    
+    return ''.join(result)
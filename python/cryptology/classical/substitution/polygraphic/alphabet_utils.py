@@ -195,6 +195,44 @@ def create_caesared_alphabet(base_alphabet: str, shift: int) -> str:
     return base_alphabet[shift:] + base_alphabet[:shift]
 
 
+def position_map(square: List[List[str]]) -> dict:
+    """
+    Map every character of a key square to its (row, column) position.
+    
+    Args:
+        square: The key square (5x5 or 6x6)
+        
+    Returns:
+        Dictionary from character to position; the first occurrence wins,
+        as when scanning the square row by row
+    """
+    positions = {}
+    for i, row in enumerate(square):
+        for j, char in enumerate(row):
+            positions.setdefault(char, (i, j))
+    return positions
+
+
+def lookup_position(positions: dict, char: str) -> Tuple[int, int]:
+    """
+    Look a character up in a position map built by position_map().
+    
+    Args:
+        positions: Position map of a key square
+        char: Character to find
+        
+    Returns:
+        (row, column) of the character
+        
+    Raises:
+        ValueError: If the character is not in the key square
+    """
+    try:
+        return positions[char]
+    except KeyError:
+        raise ValueError(f"Character {char} not found in key square") from None
+
+
 def get_letter_combination_rules() -> dict:
     """
     Get the letter combination rules for different languages.
@@ -31,32 +31,6 @@ def _prepare_text(text: str, n: int) -> str:
     return text_clean
 
 
-def _char_to_num(char: str) -> int:
-    """
-    Convert character to number (A=0, B=1, ..., Z=25).
-    
-    Args:
-        char: Single character
-        
-    Returns:
-        Number representation (0-25)
-    """
-    return ord(char) - ord('A')
-
-
-def _num_to_char(num: int) -> str:
-    """
-    Convert number to character (0=A, 1=B, ..., 25=Z).
-    
-    Args:
-        num: Number (0-25)
-        
-    Returns:
-        Character representation
-    """
-    return chr((num % 26) + ord('A'))
-
-
 def _mod_inverse(a: int, m: int) -> int:
     """
     Find modular inverse of a mod m.
@@ -119,57 +93,30 @@ def _matrix_inverse(matrix: np.ndarray) -> np.ndarray:
     return inverse.astype(int)
 
 
-def _encrypt_ngram(key_matrix: np.ndarray, ngram: str) -> str:
+def _apply_matrix(matrix: np.ndarray, text: str) -> str:
     """
-    Encrypt an n-gram using Hill cipher.
+    Multiply every n-gram of the text by the matrix in one NumPy operation.
     
-    Args:
-        key_matrix: Encryption key matrix (n x n)
-        ngram: String of n characters to encrypt
-        
-    Returns:
-        Encrypted n-gram
-    """
-    n = len(ngram)
-    if n != key_matrix.shape[0]:
-        raise ValueError(f"N-gram length {n} must match matrix size {key_matrix.shape[0]}")
-    
-    # Convert characters to numbers
-    vector = np.array([_char_to_num(char) for char in ngram])
-    
-    # Matrix multiplication
-    result_vector = (key_matrix @ vector) % 26
-    
-    # Convert back to characters
-    return ''.join(_num_to_char(num) for num in result_vector)
-
-
-def _decrypt_ngram(key_matrix: np.ndarray, ngram: str) -> str:
-    """
-    Decrypt an n-gram using Hill cipher.
+    Each n-gram is read as a vector of letter numbers (A=0, ..., Z=25) and
+    replaced by the letters of (matrix @ vector) % 26.
     
     Args:
-        key_matrix: Encryption key matrix (n x n)
-        ngram: String of n characters to decrypt
+        matrix: Key matrix (n x n)
+        text: Prepared text whose length is a multiple of n
         
     Returns:
-        Decrypted n-gram
+        Transformed text
     """
-    n = len(ngram)
-    if n != key_matrix.shape[0]:
-        raise ValueError(f"N-gram length {n} must match matrix size {key_matrix.shape[0]}")
-    
-    # Find modular inverse of key matrix
-    inverse_matrix = _matrix_inverse(key_matrix)
+    n = matrix.shape[0]
     
-    # Convert characters to numbers
-    vector = np.array([_char_to_num(char) for char in ngram])
+    # Convert characters to numbers, one n-gram per row
+    vectors = np.frombuffer(text.encode('ascii'), dtype=np.uint8).astype(np.int64) - ord('A')
     
-    # Matrix multiplication with inverse
-    result_vector = (inverse_matrix @ vector) % 26
+    # Row-vector form of key_matrix @ vector for every n-gram at once
+    result = (vectors.reshape(-1, n) @ matrix.T) % 26
     
     # Convert back to characters
-    return ''.join(_num_to_char(num) for num in result_vector)
+    return (result.astype(np.uint8) + ord('A')).tobytes().decode('ascii')
 
 
 def encrypt(plaintext: str, key_matrix: List[List[int]]) -> str:
@@ -202,12 +149,7 @@ def encrypt(plaintext: str, key_matrix: List[List[int]]) -> str:
     text = _prepare_text(plaintext, n)
     
     # Encrypt n-grams
-    result = ""
-    for i in range(0, len(text), n):
-        ngram = text[i:i+n]
-        result += _encrypt_ngram(key_array, ngram)
-    
-    return result
+    return _apply_matrix(key_array, text)
 
 
 def decrypt(ciphertext: str, key_matrix: List[List[int]]) -> str:
@@ -239,10 +181,9 @@ def decrypt(ciphertext: str, key_matrix: List[List[int]]) -> str:
     # Prepare text
     text = _prepare_text(ciphertext, n)
     
-    # Decrypt n-grams
-    result = ""
-    for i in range(0, len(text), n):
-        ngram = text[i:i+n]
-        result += _decrypt_ngram(key_array, ngram)
+    if not text:
+        return ""
     
-    return result
+    # Decrypt n-grams with the modular inverse, computed once for the whole text
+    inverse_matrix = _matrix_inverse(key_array)
+    return _apply_matrix(inverse_matrix, text)
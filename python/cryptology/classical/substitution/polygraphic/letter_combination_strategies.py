@@ -155,6 +155,12 @@ class LetterCombinationEngine:
     
     def _apply_combinations(self, alphabet: str, combinations: Dict[str, str]) -> str:
         """Apply letter combinations."""
+        # Single-letter rules whose replacements are not rewritten by another
+        # rule give the same result in one translate() pass as applied in turn
+        if all(len(original) == 1 for original in combinations) and \
+                not any(char in combinations for replacement in combinations.values() for char in replacement):
+            return alphabet.translate(str.maketrans(combinations))
+        
         result = alphabet
         for original, replacement in combinations.items():
             result = result.replace(original, replacement)
@@ -162,13 +168,7 @@ class LetterCombinationEngine:
     
     def _remove_duplicates(self, alphabet: str) -> str:
         """Remove duplicate characters while preserving order."""
-        seen = set()
-        unique_chars = []
-        for char in alphabet:
-            if char not in seen:
-                unique_chars.append(char)
-                seen.add(char)
-        return ''.join(unique_chars)
+        return ''.join(dict.fromkeys(alphabet))
     
     def _generic_combine(self, alphabet: str, target_size: int) -> str:
         """Generic combination for unknown languages."""
@@ -183,10 +183,7 @@ class LetterCombinationEngine:
     
     def _apply_custom_rules(self, alphabet: str, custom_rules: Dict[str, str]) -> str:
         """Apply custom combination rules."""
-        result = alphabet
-        for original, replacement in custom_rules.items():
-            result = result.replace(original, replacement)
-        return self._remove_duplicates(result)
+        return self._remove_duplicates(self._apply_combinations(alphabet, custom_rules))
     
     def get_combination_report(self, alphabet: str) -> Dict:
         """Generate a report on letter combination strategy."""
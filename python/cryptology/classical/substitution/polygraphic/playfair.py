@@ -11,7 +11,7 @@ from typing import Optional, Dict, Any
 import cryptology.alphabets as ALPHABETS
 from .alphabet_utils import (
     get_square_size, combine_similar_letters, create_square_alphabet,
-    create_caesared_alphabet, detect_language
+    create_caesared_alphabet, detect_language, position_map, lookup_position
 )
 from .monoalphabetic_squares import create_monoalphabetic_square
 
@@ -86,29 +86,19 @@ def _create_key_square(
             square_size = get_square_size(len(transformed_alphabet))
         
         # Build Playfair square: key + remaining transformed alphabet
-        key_clean = ""
+        key_clean = []
         seen = set()
         for char in key.lower():
             if char.isalpha() and char not in seen:
-                key_clean += char
+                key_clean.append(char)
                 seen.add(char)
         
         # Add remaining letters from transformed alphabet
         for char in transformed_alphabet:
-            if char not in seen and char in transformed_alphabet:
-                key_clean += char
+            if char not in seen:
+                key_clean.append(char)
                 seen.add(char)
         
-        # Ensure we have enough characters
-        if len(key_clean) < square_size * square_size:
-            # Pad with remaining transformed alphabet
-            for char in transformed_alphabet:
-                if char not in seen:
-                    key_clean += char
-                    seen.add(char)
-                    if len(key_clean) >= square_size * square_size:
-                        break
-        
         # Create square
         square = []
         for i in range(square_size):
@@ -149,17 +139,15 @@ def _create_key_square(
         square_alphabet = alphabet + "0123"  # 32 letters + 4 digits = 36 chars
     
     # Remove duplicates while preserving order, keep lowercase
-    key_clean = ""
+    key_clean = []
     seen = set()
     for char in key.lower():
         if char.isalpha() and char not in seen:
-            key_clean += char
+            key_clean.append(char)
             seen.add(char)
     
     # Add remaining letters from square alphabet
-    for char in square_alphabet:
-        if char not in seen:
-            key_clean += char
+    key_clean.extend(char for char in square_alphabet if char not in seen)
     
     # Create square
     square = []
@@ -234,13 +222,19 @@ def _find_position(square: list[list[str]], char: str) -> tuple[int, int]:
     raise ValueError(f"Character {char} not found in key square")
 
 
-def _encrypt_digram(square: list[list[str]], digram: str) -> str:
+def _encrypt_digram(
+    square: list[list[str]],
+    digram: str,
+    positions: Optional[dict[str, tuple[int, int]]] = None
+) -> str:
     """
     Encrypt a digram using Playfair rules.
     
     Args:
         square: The 5x5 key square
         digram: Two-character string to encrypt
+        positions: Optional position map from position_map() to avoid
+            scanning the square
         
     Returns:
         Encrypted digram
@@ -249,8 +243,12 @@ def _encrypt_digram(square: list[list[str]], digram: str) -> str:
         raise ValueError("Digram must be exactly 2 characters")
     
     char1, char2 = digram[0], digram[1]
-    row1, col1 = _find_position(square, char1)
-    row2, col2 = _find_position(square, char2)
+    if positions is None:
+        row1, col1 = _find_position(square, char1)
+        row2, col2 = _find_position(square, char2)
+    else:
+        row1, col1 = lookup_position(positions, char1)
+        row2, col2 = lookup_position(positions, char2)
     
     square_size = len(square)  # Dynamic square size
     
@@ -271,13 +269,19 @@ def _encrypt_digram(square: list[list[str]], digram: str) -> str:
         return square[row1][col2] + square[row2][col1]
 
 
-def _decrypt_digram(square: list[list[str]], digram: str) -> str:
+def _decrypt_digram(
+    square: list[list[str]],
+    digram: str,
+    positions: Optional[dict[str, tuple[int, int]]] = None
+) -> str:
     """
     Decrypt a digram using Playfair rules.
     
     Args:
         square: The 5x5 key square
         digram: Two-character string to decrypt
+        positions: Optional position map from position_map() to avoid
+            scanning the square
         
     Returns:
         Decrypted digram
@@ -286,8 +290,12 @@ def _decrypt_digram(square: list[list[str]], digram: str) -> str:
         raise ValueError("Digram must be exactly 2 characters")
     
     char1, char2 = digram[0], digram[1]
-    row1, col1 = _find_position(square, char1)
-    row2, col2 = _find_position(square, char2)
+    if positions is None:
+        row1, col1 = _find_position(square, char1)
+        row2, col2 = _find_position(square, char2)
+    else:
+        row1, col1 = lookup_position(positions, char1)
+        row2, col2 = lookup_position(positions, char2)
     
     square_size = len(square)  # Dynamic square size
     
@@ -308,23 +316,27 @@ def _decrypt_digram(square: list[list[str]], digram: str) -> str:
         return square[row1][col2] + square[row2][col1]
 
 
-def encrypt(
-    plaintext: str, 
-    key: str, 
+def build_grid(
+    key: str,
     alphabet: str = DEFAULT_ALPHABET,
     square_type: str = "standard",
     mono_params: Optional[Dict[str, Any]] = None
-) -> str:
+) -> list[list[str]]:
     """
-    Encrypt plaintext using Playfair cipher.
+    Build the Playfair key square once so it can be reused.
+    
+    Encrypting and decrypting with the same key and alphabet produce the
+    same square, so callers doing both can build it once and pass it to
+    encrypt_with_grid()/decrypt_with_grid().
     
     Args:
-        plaintext: Text to encrypt
         key: Keyword for generating the key square
         alphabet: The alphabet to use (default: English)
+        square_type: Type of square ("standard", "caesar", "atbash", "affine", "keyword")
+        mono_params: Parameters for monoalphabetic-based squares
         
     Returns:
-        Encrypted text
+        The key square
         
     Raises:
         ValueError: If key is empty or contains no letters
@@ -332,19 +344,80 @@ def encrypt(
     if not key or not re.search(r'[A-Za-z]', key):
         raise ValueError("Key must contain at least one letter")
     
-    # Create key square
-    square = _create_key_square(key, alphabet, square_type, mono_params)
+    return _create_key_square(key, alphabet, square_type, mono_params)
+
+
+def encrypt_with_grid(
+    plaintext: str,
+    grid: list[list[str]],
+    alphabet: str = DEFAULT_ALPHABET
+) -> str:
+    """
+    Encrypt plaintext using a prebuilt Playfair key square.
     
-    # Prepare text
+    Args:
+        plaintext: Text to encrypt
+        grid: Key square returned by build_grid()
+        alphabet: The alphabet the square was built from (default: English)
+        
+    Returns:
+        Encrypted text
+    """
     text = _prepare_text(plaintext, alphabet)
     
+    positions = position_map(grid)
+    
     # Encrypt digrams
-    result = ""
-    for i in range(0, len(text), 2):
-        digram = text[i:i+2]
-        result += _encrypt_digram(square, digram)
+    return "".join(_encrypt_digram(grid, text[i:i+2], positions) for i in range(0, len(text), 2))
+
+
+def decrypt_with_grid(
+    ciphertext: str,
+    grid: list[list[str]],
+    alphabet: str = DEFAULT_ALPHABET
+) -> str:
+    """
+    Decrypt ciphertext using a prebuilt Playfair key square.
+    
+    Args:
+        ciphertext: Text to decrypt
+        grid: Key square returned by build_grid()
+        alphabet: The alphabet the square was built from (default: English)
+        
+    Returns:
+        Decrypted text
+    """
+    text = _prepare_text(ciphertext, alphabet)
+    
+    positions = position_map(grid)
+    
+    # Decrypt digrams
+    return "".join(_decrypt_digram(grid, text[i:i+2], positions) for i in range(0, len(text), 2))
+
+
+def encrypt(
+    plaintext: str, 
+    key: str, 
+    alphabet: str = DEFAULT_ALPHABET,
+    square_type: str = "standard",
+    mono_params: Optional[Dict[str, Any]] = None
+) -> str:
+    """
+    Encrypt plaintext using Playfair cipher.
     
-    return result
+    Args:
+        plaintext: Text to encrypt
+        key: Keyword for generating the key square
+        alphabet: The alphabet to use (default: English)
+        
+    Returns:
+        Encrypted text
+        
+    Raises:
+        ValueError: If key is empty or contains no letters
+    """
+    square = build_grid(key, alphabet, square_type, mono_params)
+    return encrypt_with_grid(plaintext, square, alphabet)
 
 
 def decrypt(
@@ -368,19 +441,5 @@ def decrypt(
     Raises:
         ValueError: If key is empty or contains no letters
     """
-    if not key or not re.search(r'[A-Za-z]', key):
-        raise ValueError("Key must contain at least one letter")
-    
-    # Create key square
-    square = _create_key_square(key, alphabet, square_type, mono_params)
-    
-    # Prepare text
-    text = _prepare_text(ciphertext, alphabet)
-    
-    # Decrypt digrams
-    result = ""
-    for i in range(0, len(text), 2):
-        digram = text[i:i+2]
-        result += _decrypt_digram(square, digram)
-    
-    return result
+    square = build_grid(key, alphabet, square_type, mono_params)
+    return decrypt_with_grid(ciphertext, square, alphabet)
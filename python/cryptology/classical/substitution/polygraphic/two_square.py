@@ -9,6 +9,7 @@ import re
 from typing import Optional, Dict, Any
 import cryptology.alphabets as ALPHABETS
 from .monoalphabetic_squares import _create_caesar_alphabet, _create_atbash_alphabet, _create_affine_alphabet, _create_keyword_alphabet
+from .alphabet_utils import position_map, lookup_position
 
 DEFAULT_ALPHABET = ALPHABETS.ENGLISH_ALPHABET  # Already lowercase
 TURKISH_EXTENDED = ALPHABETS.TURKISH_EXTENDED  # Already lowercase
@@ -149,7 +150,13 @@ def _find_position(square: list[list[str]], char: str) -> tuple[int, int]:
     raise ValueError(f"Character {char} not found in key square")
 
 
-def _encrypt_digram(square1: list[list[str]], square2: list[list[str]], digram: str) -> str:
+def _encrypt_digram(
+    square1: list[list[str]],
+    square2: list[list[str]],
+    digram: str,
+    positions1: Optional[dict[str, tuple[int, int]]] = None,
+    positions2: Optional[dict[str, tuple[int, int]]] = None
+) -> str:
     """
     Encrypt a digram using Two Square rules.
     
@@ -157,6 +164,8 @@ def _encrypt_digram(square1: list[list[str]], square2: list[list[str]], digram:
         square1: The first 5x5 key square
         square2: The second 5x5 key square
         digram: Two-character string to encrypt
+        positions1: Optional position map of square1 from position_map()
+        positions2: Optional position map of square2 from position_map()
         
     Returns:
         Encrypted digram
@@ -165,14 +174,26 @@ def _encrypt_digram(square1: list[list[str]], square2: list[list[str]], digram:
         raise ValueError("Digram must be exactly 2 characters")
     
     char1, char2 = digram[0], digram[1]
-    row1, col1 = _find_position(square1, char1)
-    row2, col2 = _find_position(square2, char2)
+    if positions1 is None:
+        row1, col1 = _find_position(square1, char1)
+    else:
+        row1, col1 = lookup_position(positions1, char1)
+    if positions2 is None:
+        row2, col2 = _find_position(square2, char2)
+    else:
+        row2, col2 = lookup_position(positions2, char2)
     
     # Use opposite corners of the rectangle formed by the two positions
     return square1[row1][col2] + square2[row2][col1]
 
 
-def _decrypt_digram(square1: list[list[str]], square2: list[list[str]], digram: str) -> str:
+def _decrypt_digram(
+    square1: list[list[str]],
+    square2: list[list[str]],
+    digram: str,
+    positions1: Optional[dict[str, tuple[int, int]]] = None,
+    positions2: Optional[dict[str, tuple[int, int]]] = None
+) -> str:
     """
     Decrypt a digram using Two Square rules.
     
@@ -180,6 +201,8 @@ def _decrypt_digram(square1: list[list[str]], square2: list[list[str]], digram:
         square1: The first 5x5 key square
         square2: The second 5x5 key square
         digram: Two-character string to decrypt
+        positions1: Optional position map of square1 from position_map()
+        positions2: Optional position map of square2 from position_map()
         
     Returns:
         Decrypted digram
@@ -188,8 +211,14 @@ def _decrypt_digram(square1: list[list[str]], square2: list[list[str]], digram:
         raise ValueError("Digram must be exactly 2 characters")
     
     char1, char2 = digram[0], digram[1]
-    row1, col1 = _find_position(square1, char1)
-    row2, col2 = _find_position(square2, char2)
+    if positions1 is None:
+        row1, col1 = _find_position(square1, char1)
+    else:
+        row1, col1 = lookup_position(positions1, char1)
+    if positions2 is None:
+        row2, col2 = _find_position(square2, char2)
+    else:
+        row2, col2 = lookup_position(positions2, char2)
     
     # Use opposite corners of the rectangle formed by the two positions
     return square1[row1][col2] + square2[row2][col1]
@@ -228,13 +257,14 @@ def encrypt(
     # Prepare text
     text = _prepare_text(plaintext)
     
-    # Encrypt digrams
-    result = ""
-    for i in range(0, len(text), 2):
-        digram = text[i:i+2]
-        result += _encrypt_digram(square1, square2, digram)
+    positions1 = position_map(square1)
+    positions2 = position_map(square2)
     
-    return result
+    # Encrypt digrams
+    return "".join(
+        _encrypt_digram(square1, square2, text[i:i+2], positions1, positions2)
+        for i in range(0, len(text), 2)
+    )
 
 
 def decrypt(
@@ -270,10 +300,11 @@ def decrypt(
     # Prepare text
     text = _prepare_text(ciphertext)
     
-    # Decrypt digrams
-    result = ""
-    for i in range(0, len(text), 2):
-        digram = text[i:i+2]
-        result += _decrypt_digram(square1, square2, digram)
+    positions1 = position_map(square1)
+    positions2 = position_map(square2)
     
-    return result
+    # Decrypt digrams
+    return "".join(
+        _decrypt_digram(square1, square2, text[i:i+2], positions1, positions2)
+        for i in range(0, len(text), 2)
+    )
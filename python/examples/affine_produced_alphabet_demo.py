@@ -7,6 +7,7 @@ then use that transformed alphabet with polygraphic ciphers.
 
 import sys
 import os
+from collections import Counter, namedtuple
 
 # Add the parent directory to the path so we can import cryptology
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -15,8 +16,16 @@ from cryptology.classical.substitution.monoalphabetic.affine import produce_alph
 from cryptology.classical.substitution.monoalphabetic.caesar import produce_alphabet as caesar_produce
 from cryptology.classical.substitution.monoalphabetic.keyword import produce_alphabet as keyword_produce
 from cryptology.classical.substitution.polygraphic.playfair import encrypt as playfair_encrypt, decrypt as playfair_decrypt
+from cryptology.classical.substitution.polygraphic.playfair import (
+    build_grid as playfair_build_grid,
+    encrypt_with_grid as playfair_encrypt_with_grid,
+    decrypt_with_grid as playfair_decrypt_with_grid,
+)
 from cryptology.classical.substitution.polygraphic.two_square import encrypt as two_square_encrypt, decrypt as two_square_decrypt
 
+# A named alphabet compared in demonstrate_security_benefits()
+Approach = namedtuple("Approach", "name alphabet description")
+
 
 def demonstrate_affine_produced_alphabet():
     """Demonstrate using Affine cipher to produce alphabets."""
@@ -155,8 +164,10 @@ def demonstrate_affine_with_custom_languages():
         print(f"Plaintext: {plaintext}")
         print(f"Key: {key}")
         
-        encrypted = playfair_encrypt(plaintext, key, affine_turkish)
-        decrypted = playfair_decrypt(encrypted, key, affine_turkish)
+        # Build the key square once and share it between encrypt and decrypt
+        grid = playfair_build_grid(key, affine_turkish)
+        encrypted = playfair_encrypt_with_grid(plaintext, grid, affine_turkish)
+        decrypted = playfair_decrypt_with_grid(encrypted, grid, affine_turkish)
         
         print(f"Encrypted: {encrypted}")
         print(f"Decrypted: {decrypted}")
@@ -185,13 +196,14 @@ def demonstrate_alphabet_analysis():
         (7, 13)   # Another Affine
     ]
     
+    base_counts = Counter(base_alphabet)
     for a, b in test_params:
         try:
             affine_alphabet = affine_produce(a, b, base_alphabet)
             print(f"Affine(a={a}, b={b}): {affine_alphabet}")
             
             # Check if it's a permutation
-            if sorted(affine_alphabet) == sorted(base_alphabet):
+            if Counter(affine_alphabet) == base_counts:
                 print("  ✓ Valid permutation")
             else:
                 print("  ✗ Not a valid permutation")
@@ -215,20 +227,20 @@ def demonstrate_security_benefits():
     print()
     
     # Compare different approaches
-    approaches = {
-        "Standard Playfair": (base_alphabet, "Standard English alphabet"),
-        "Caesar-Produced": (caesar_produce(5, base_alphabet), "Caesar-shifted alphabet"),
-        "Affine-Produced": (affine_produce(3, 5, base_alphabet), "Affine-transformed alphabet"),
-        "Keyword-Produced": (keyword_produce("SECRET", base_alphabet), "Keyword-based alphabet")
-    }
+    approaches = [
+        Approach("Standard Playfair", base_alphabet, "Standard English alphabet"),
+        Approach("Caesar-Produced", caesar_produce(5, base_alphabet), "Caesar-shifted alphabet"),
+        Approach("Affine-Produced", affine_produce(3, 5, base_alphabet), "Affine-transformed alphabet"),
+        Approach("Keyword-Produced", keyword_produce("SECRET", base_alphabet), "Keyword-based alphabet")
+    ]
     
-    for approach_name, (alphabet, description) in approaches.items():
-        print(f"{approach_name}:")
-        print(f"  Description: {description}")
-        print(f"  Alphabet: {alphabet}")
+    for approach in approaches:
+        print(f"{approach.name}:")
+        print(f"  Description: {approach.description}")
+        print(f"  Alphabet: {approach.alphabet}")
         
         try:
-            encrypted = playfair_encrypt(plaintext, key, alphabet)
+            encrypted = playfair_encrypt(plaintext, key, approach.alphabet)
             print(f"  Encrypted: {encrypted}")
             print(f"  Length: {len(encrypted)} characters")
         except Exception as e:
@@ -65,6 +65,7 @@ def demonstrate_rotation_strategies():
     print(f"Plaintext: {plaintext}")
     print()
     
+    plaintext_nospace = plaintext.replace(' ', '')
     for strategy in strategies:
         try:
             encrypted = alberti_encrypt(plaintext, rotation_strategy=strategy)
@@ -73,7 +74,7 @@ def demonstrate_rotation_strategies():
             print(f"Strategy: {strategy}")
             print(f"Encrypted: {encrypted}")
             print(f"Decrypted: {decrypted}")
-            print(f"Success: {'✓' if decrypted == plaintext.replace(' ', '') else '✗'}")
+            print(f"Success: {'✓' if decrypted == plaintext_nospace else '✗'}")
             print()
         except Exception as e:
             print(f"Strategy: {strategy} - Error: {e}")
@@ -190,13 +191,14 @@ def demonstrate_complex_patterns():
     print(f"Custom pattern: {custom_pattern}")
     print()
     
+    plaintext_nospace = plaintext.replace(' ', '')
     try:
         encrypted = alberti_encrypt(plaintext, rotation_strategy=custom_pattern)
         decrypted = alberti_decrypt(encrypted, rotation_strategy=custom_pattern)
         
         print(f"Encrypted: {encrypted}")
         print(f"Decrypted: {decrypted}")
-        print(f"Success: {'✓' if decrypted == plaintext.replace(' ', '') else '✗'}")
+        print(f"Success: {'✓' if decrypted == plaintext_nospace else '✗'}")
     except Exception as e:
         print(f"Error: {e}")
     print()
@@ -6,70 +6,74 @@ This example shows how to create Chaocipher alphabets using various
 monoalphabetic substitution ciphers for enhanced security.
 """
 
+import sys
+
 from cryptology.classical.substitution.polyalphabetic.chaocipher import (
-    create_alphabets_with_mono_ciphers, encrypt, decrypt
+    create_alphabets_with_mono_ciphers, create_alphabets_with_mono_ciphers_batch,
+    encrypt, decrypt
+)
+
+# Left/right monoalphabetic cipher combinations to demonstrate
+COMBINATIONS = (
+    {
+        "name": "Caesar + Keyword",
+        "left_cipher": "caesar", "left_params": {"shift": 5},
+        "right_cipher": "keyword", "right_params": {"keyword": "SECRET"}
+    },
+    {
+        "name": "Atbash + Affine",
+        "left_cipher": "atbash", "left_params": {},
+        "right_cipher": "affine", "right_params": {"a": 5, "b": 7}
+    },
+    {
+        "name": "Keyword + Caesar",
+        "left_cipher": "keyword", "left_params": {"keyword": "HELLO"},
+        "right_cipher": "caesar", "right_params": {"shift": 13}
+    },
+    {
+        "name": "Affine + Keyword",
+        "left_cipher": "affine", "left_params": {"a": 7, "b": 3},
+        "right_cipher": "keyword", "right_params": {"keyword": "WORLD"}
+    }
 )
 
 
 def demonstrate_mono_cipher_combinations():
     """Demonstrate various combinations of monoalphabetic ciphers."""
-    print("=== Chaocipher with Monoalphabetic Cipher Integration ===\n")
+    lines = []
+    lines.append("=== Chaocipher with Monoalphabetic Cipher Integration ===\n")
     
     plaintext = "HELLO WORLD"
-    print(f"Plaintext: {plaintext}\n")
+    lines.append(f"Plaintext: {plaintext}\n")
     
-    # Test different combinations
-    combinations = [
-        {
-            "name": "Caesar + Keyword",
-            "left_cipher": "caesar", "left_params": {"shift": 5},
-            "right_cipher": "keyword", "right_params": {"keyword": "SECRET"}
-        },
-        {
-            "name": "Atbash + Affine",
-            "left_cipher": "atbash", "left_params": {},
-            "right_cipher": "affine", "right_params": {"a": 5, "b": 7}
-        },
-        {
-            "name": "Keyword + Caesar",
-            "left_cipher": "keyword", "left_params": {"keyword": "HELLO"},
-            "right_cipher": "caesar", "right_params": {"shift": 13}
-        },
-        {
-            "name": "Affine + Keyword",
-            "left_cipher": "affine", "left_params": {"a": 7, "b": 3},
-            "right_cipher": "keyword", "right_params": {"keyword": "WORLD"}
-        }
-    ]
+    # Create all alphabet pairs using monoalphabetic ciphers in one call
+    alphabet_pairs = create_alphabets_with_mono_ciphers_batch(COMBINATIONS)
     
-    for i, combo in enumerate(combinations, 1):
-        print(f"{i}. {combo['name']} Combination")
-        print("=" * 50)
-        
-        # Create alphabets using monoalphabetic ciphers
-        left_alphabet, right_alphabet = create_alphabets_with_mono_ciphers(
-            left_cipher=combo["left_cipher"], left_params=combo["left_params"],
-            right_cipher=combo["right_cipher"], right_params=combo["right_params"]
-        )
+    for i, (combo, (left_alphabet, right_alphabet)) in enumerate(zip(COMBINATIONS, alphabet_pairs), 1):
+        lines.append(f"{i}. {combo['name']} Combination")
+        lines.append("=" * 50)
         
         # Show alphabet details
-        print(f"Left alphabet ({combo['left_cipher']}): {''.join(left_alphabet[:10])}...")
-        print(f"Right alphabet ({combo['right_cipher']}): {''.join(right_alphabet[:10])}...")
+        lines.append(f"Left alphabet ({combo['left_cipher']}): {left_alphabet[:10]}...")
+        lines.append(f"Right alphabet ({combo['right_cipher']}): {right_alphabet[:10]}...")
         
         # Encrypt and decrypt
         encrypted = encrypt(plaintext, left_alphabet, right_alphabet)
         decrypted = decrypt(encrypted, left_alphabet, right_alphabet)
         
-        print(f"Encrypted: {encrypted}")
-        print(f"Decrypted: {decrypted}")
-        print(f"Success: {'✓' if plaintext == decrypted else '✗'}")
-        print()
+        lines.append(f"Encrypted: {encrypted}")
+        lines.append(f"Decrypted: {decrypted}")
+        lines.append(f"Success: {'✓' if plaintext == decrypted else '✗'}")
+        lines.append("")
+    
+    sys.stdout.write("\n".join(lines) + "\n")
 
 
 def demonstrate_custom_alphabet():
     """Demonstrate using custom base alphabet."""
-    print("5. Custom Base Alphabet")
-    print("=" * 50)
+    lines = []
+    lines.append("5. Custom Base Alphabet")
+    lines.append("=" * 50)
     
     # Use only letters (no space) for a 26-character alphabet
     custom_alphabet = "ABCDEFGHIJKLMNOPQRSTUVWXYZ"
@@ -80,25 +84,28 @@ def demonstrate_custom_alphabet():
         alphabet=custom_alphabet
     )
     
-    print(f"Custom alphabet: {custom_alphabet}")
-    print(f"Left alphabet (Caesar shift=3): {''.join(left_alphabet)}")
-    print(f"Right alphabet (Atbash): {''.join(right_alphabet)}")
+    lines.append(f"Custom alphabet: {custom_alphabet}")
+    lines.append(f"Left alphabet (Caesar shift=3): {left_alphabet}")
+    lines.append(f"Right alphabet (Atbash): {right_alphabet}")
     
     plaintext = "HELLO"
     encrypted = encrypt(plaintext, left_alphabet, right_alphabet)
     decrypted = decrypt(encrypted, left_alphabet, right_alphabet)
     
-    print(f"Plaintext: {plaintext}")
-    print(f"Encrypted: {encrypted}")
-    print(f"Decrypted: {decrypted}")
-    print(f"Success: {'✓' if plaintext == decrypted else '✗'}")
-    print()
+    lines.append(f"Plaintext: {plaintext}")
+    lines.append(f"Encrypted: {encrypted}")
+    lines.append(f"Decrypted: {decrypted}")
+    lines.append(f"Success: {'✓' if plaintext == decrypted else '✗'}")
+    lines.append("")
+    
+    sys.stdout.write("\n".join(lines) + "\n")
 
 
 def demonstrate_error_handling():
     """Demonstrate error handling for invalid parameters."""
-    print("6. Error Handling")
-    print("=" * 50)
+    lines = []
+    lines.append("6. Error Handling")
+    lines.append("=" * 50)
     
     # Test invalid cipher name
     try:
@@ -107,7 +114,7 @@ def demonstrate_error_handling():
             right_cipher="caesar", right_params={"shift": 3}
         )
     except ValueError as e:
-        print(f"Invalid cipher name error: {e}")
+        lines.append(f"Invalid cipher name error: {e}")
     
     # Test Affine cipher with non-coprime 'a'
     try:
@@ -116,9 +123,11 @@ def demonstrate_error_handling():
             right_cipher="caesar", right_params={"shift": 3}
         )
     except ValueError as e:
-        print(f"Affine coprime error: {e}")
+        lines.append(f"Affine coprime error: {e}")
+    
+    lines.append("")
     
-    print()
+    sys.stdout.write("\n".join(lines) + "\n")
 
 
 if __name__ == "__main__":
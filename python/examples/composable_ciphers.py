@@ -5,12 +5,15 @@ This example shows how monoalphabetic ciphers can produce custom alphabets
 that are then used by polygraphic ciphers, creating a powerful composable system.
 """
 
+import io
 import sys
 import os
 
 # Add the parent directory to the path so we can import cryptology
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
+import cryptology.alphabets as ALPHABETS
+
 # Import monoalphabetic ciphers
 from cryptology.classical.substitution.monoalphabetic.caesar import produce_alphabet as caesar_produce
 from cryptology.classical.substitution.monoalphabetic.keyword import produce_alphabet as keyword_produce
@@ -23,6 +26,16 @@ from cryptology.classical.substitution.polygraphic.two_square import encrypt as
 from cryptology.classical.substitution.polygraphic.four_square import encrypt as four_square_encrypt, decrypt as four_square_decrypt
 from cryptology.classical.substitution.polygraphic.hill import encrypt as hill_encrypt, decrypt as hill_decrypt
 
+# Fixed inputs shared by the demonstrations
+BASE_ALPHABET = "abcdefghijklmnopqrstuvwxyz"
+HILL_MATRIX = [[3, 3], [2, 5]]
+FOUR_SQUARE_KEYS = ("MONARCHY", "PLAYFAIR", "CIPHER", "SECRET")
+ANALYSIS_SHIFTS = (1, 3, 5, 13)
+ANALYSIS_KEYWORDS = ("SECRET", "PLAYFAIR", "CIPHER")
+ANALYSIS_AFFINE_PARAMS = ((3, 1), (5, 8), (7, 13))
+MULTI_LAYER_KEYS = ("KEY1", "KEY2")
+MULTI_LAYER_KEYWORD = "SECRET"
+
 
 def demonstrate_caesar_playfair():
     """Demonstrate Caesar-produced alphabet with Playfair cipher."""
@@ -76,7 +89,7 @@ def demonstrate_affine_four_square():
     print("=== Affine + Four Square ===")
     
     plaintext = "THE QUICK BROWN FOX"
-    keys = ["MONARCHY", "PLAYFAIR", "CIPHER", "SECRET"]
+    keys = FOUR_SQUARE_KEYS
     
     # Produce affine-transformed alphabets
     affine_alphabets = []
@@ -102,7 +115,7 @@ def demonstrate_atbash_hill():
     print("=== Atbash + Hill ===")
     
     plaintext = "HELLO WORLD"
-    hill_matrix = [[3, 3], [2, 5]]
+    hill_matrix = HILL_MATRIX
     
     # Produce Atbash-reversed alphabet
     atbash_alphabet = atbash_produce()
@@ -124,25 +137,31 @@ def demonstrate_multi_layer_encryption():
     print("=== Multi-Layer Encryption ===")
     
     plaintext = "SECRET MESSAGE"
+    key1, key2 = MULTI_LAYER_KEYS
     
     # Layer 1: Caesar + Playfair
     caesared_alphabet = caesar_produce(shift=7)
-    layer1_encrypted = playfair_encrypt(plaintext, "KEY1", caesared_alphabet)
+    layer1_encrypted = playfair_encrypt(plaintext, key1, caesared_alphabet)
     
     # Layer 2: Keyword + Two Square
-    keyword_alphabet1 = keyword_produce("SECRET")
-    keyword_alphabet2 = keyword_produce("KEY2")
-    layer2_encrypted = two_square_encrypt(layer1_encrypted, "KEY1", "KEY2", keyword_alphabet1, keyword_alphabet2)
+    keyword_alphabet1 = keyword_produce(MULTI_LAYER_KEYWORD)
+    keyword_alphabet2 = keyword_produce(key2)
+    layer2_encrypted = two_square_encrypt(layer1_encrypted, key1, key2, keyword_alphabet1, keyword_alphabet2)
     
     # Layer 3: Affine + Hill
     affine_alphabet = affine_produce(5, 8)
-    hill_matrix = [[3, 3], [2, 5]]
-    layer3_encrypted = hill_encrypt(layer2_encrypted, hill_matrix)
+    layer3_encrypted = hill_encrypt(layer2_encrypted, HILL_MATRIX)
+    
+    # The monoalphabetic layers alone fuse into one alphabet and a single pass
+    fused_alphabet = ALPHABETS.compose_alphabets(BASE_ALPHABET, caesared_alphabet, keyword_alphabet1, affine_alphabet)
+    fused_encrypted = plaintext.lower().translate(ALPHABETS.translation_table(BASE_ALPHABET, fused_alphabet))
     
     print(f"Original: {plaintext}")
     print(f"Layer 1 (Caesar+Playfair): {layer1_encrypted}")
     print(f"Layer 2 (Keyword+Two Square): {layer2_encrypted}")
     print(f"Layer 3 (Affine+Hill): {layer3_encrypted}")
+    print(f"Fused Caesar+Keyword+Affine alphabet: {fused_alphabet}")
+    print(f"Fused monoalphabetic layers: {fused_encrypted}")
     print()
 
 
@@ -175,35 +194,37 @@ def demonstrate_custom_language_combinations():
 
 def demonstrate_alphabet_analysis():
     """Demonstrate analysis of produced alphabets."""
-    print("=== Alphabet Analysis ===")
+    buf = io.StringIO()
+    write = buf.write
+    write("=== Alphabet Analysis ===\n")
     
-    base_alphabet = "abcdefghijklmnopqrstuvwxyz"
+    base_alphabet = BASE_ALPHABET
     
     # Different Caesar shifts
-    for shift in [1, 3, 5, 13]:
+    for shift in ANALYSIS_SHIFTS:
         caesared = caesar_produce(shift, base_alphabet)
-        print(f"Caesar shift {shift:2d}: {caesared}")
+        write(f"Caesar shift {shift:2d}: {caesared}\n")
     
-    print()
+    write("\n")
     
     # Different keywords
-    keywords = ["SECRET", "PLAYFAIR", "CIPHER"]
-    for keyword in keywords:
+    for keyword in ANALYSIS_KEYWORDS:
         keyword_alphabet = keyword_produce(keyword, base_alphabet)
-        print(f"Keyword '{keyword}': {keyword_alphabet}")
+        write(f"Keyword '{keyword}': {keyword_alphabet}\n")
     
-    print()
+    write("\n")
     
     # Different affine parameters
-    affine_params = [(3, 1), (5, 8), (7, 13)]
-    for a, b in affine_params:
+    for a, b in ANALYSIS_AFFINE_PARAMS:
         try:
             affine_alphabet = affine_produce(a, b, base_alphabet)
-            print(f"Affine (a={a}, b={b}): {affine_alphabet}")
+            write(f"Affine (a={a}, b={b}): {affine_alphabet}\n")
         except ValueError as e:
-            print(f"Affine (a={a}, b={b}): Error - {e}")
+            write(f"Affine (a={a}, b={b}): Error - {e}\n")
     
-    print()
+    write("\n")
+    
+    sys.stdout.write(buf.getvalue())
 
 
 if __name__ == "__main__":
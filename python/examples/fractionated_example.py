@@ -6,16 +6,86 @@ techniques, and how they can use custom alphabets for enhanced security.
 """
 
 import sys
-import os
+from pathlib import Path
 
-# Add the parent directory to the path so we can import cryptology
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+# Add the parent directory to the path so we can import cryptology; each
+# demonstration imports only the ciphers it uses
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
 
-from cryptology.classical.substitution.fractionated import bifid_encrypt, bifid_decrypt, trifid_encrypt, trifid_decrypt
+# Turkish alphabet shared by the Bifid and Trifid demonstrations
+TURKISH_ALPHABET = "ABCÇDEFGĞHIJKLMNOÖPRSŞTUÜVYZ"
+
+# Fixed explanatory text printed by the demonstrations
+BIFID_FRACTIONATION_STEPS = """\
+Step 1: Create 5x5 Polybius square
+M O N A R
+C H Y B D
+E F G I J
+K L P S T
+U V W X Z
+
+Step 2: Convert each letter to coordinates
+H -> (1,2), E -> (2,0), L -> (3,1), L -> (3,1), O -> (0,1)
+Rows: [1, 2, 3, 3, 0]
+Cols: [2, 0, 1, 1, 1]
+
+Step 3: Fractionation - write all rows, then all columns
+Fractionated: [1, 2, 3, 3, 0, 2, 0, 1, 1, 1]
+
+Step 4: Read pairs of coordinates to get new letters
+(1,2) -> H, (3,0) -> K, (0,1) -> O, (1,1) -> H
+"""
+
+TRIFID_FRACTIONATION_STEPS = """\
+Step 1: Create 3x3x3 Trifid cube
+Layer 0:    Layer 1:    Layer 2:
+M O N       P Q R       X Y Z
+A B C       D E F       G H I
+J K L       S T U       V W X
+
+Step 2: Convert each letter to 3D coordinates
+H -> (0,1,1), E -> (1,1,1), L -> (0,2,2), L -> (0,2,2), O -> (0,0,1)
+Layers: [0, 1, 0, 0, 0]
+Rows:   [1, 1, 2, 2, 0]
+Cols:   [1, 1, 2, 2, 1]
+
+Step 3: Fractionation - write all layers, then all rows, then all columns
+Fractionated: [0, 1, 0, 0, 0, 1, 1, 2, 2, 0, 1, 1, 2, 2, 1]
+
+Step 4: Read triplets of coordinates to get new letters
+(0,1,1) -> B, (0,0,1) -> O, (1,2,2) -> U
+"""
+
+SECURITY_BENEFITS = """\
+Security Benefits:
+1. Fractionation breaks letter frequency patterns
+2. Each letter affects multiple positions in ciphertext
+3. Trifid provides 3D fractionation (even more secure)
+4. Custom alphabets add another layer of security
+5. Resistant to frequency analysis attacks
+"""
+
+COMPOSABLE_BENEFITS = """\
+Multi-layer encryption provides:
+1. Caesar shift adds basic substitution
+2. Keyword rearrangement adds complexity
+3. Bifid fractionation breaks patterns
+4. Trifid 3D fractionation adds maximum security
+"""
+
+KEY_FEATURES = """\
+Key Features:
+1. Bifid: 2D fractionation with 5x5 square
+2. Trifid: 3D fractionation with 3x3x3 cube
+3. Custom alphabet support for any language
+4. Composable with monoalphabetic ciphers
+5. Enhanced security through fractionation"""
 
 
 def demonstrate_bifid_cipher():
     """Demonstrate the Bifid cipher with English alphabet."""
+    from cryptology.classical.substitution.fractionated import bifid_encrypt, bifid_decrypt
+    
     print("=== Bifid Cipher Demo ===")
     
     plaintext = "HELLO WORLD"
@@ -37,6 +107,8 @@ def demonstrate_bifid_cipher():
 
 def demonstrate_trifid_cipher():
     """Demonstrate the Trifid cipher with English alphabet."""
+    from cryptology.classical.substitution.fractionated import trifid_encrypt, trifid_decrypt
+    
     print("=== Trifid Cipher Demo ===")
     
     plaintext = "HELLO WORLD"
@@ -58,52 +130,56 @@ def demonstrate_trifid_cipher():
 
 def demonstrate_bifid_with_custom_alphabet():
     """Demonstrate Bifid cipher with Turkish alphabet."""
+    from cryptology.classical.substitution.fractionated import bifid_encrypt, bifid_decrypt
+    
     print("=== Bifid Cipher with Turkish Alphabet ===")
     
     plaintext = "MERHABA DÜNYA"
     key = "GİZLİ"
-    turkish_alphabet = "ABCÇDEFGĞHIJKLMNOÖPRSŞTUÜVYZ"
     
     print(f"Plaintext: {plaintext}")
     print(f"Key: {key}")
-    print(f"Turkish alphabet: {turkish_alphabet}")
+    print(f"Turkish alphabet: {TURKISH_ALPHABET}")
     print()
     
     # Encrypt
-    encrypted = bifid_encrypt(plaintext, key, turkish_alphabet)
+    encrypted = bifid_encrypt(plaintext, key, TURKISH_ALPHABET)
     print(f"Encrypted: {encrypted}")
     
     # Decrypt
-    decrypted = bifid_decrypt(encrypted, key, turkish_alphabet)
+    decrypted = bifid_decrypt(encrypted, key, TURKISH_ALPHABET)
     print(f"Decrypted: {decrypted}")
     print()
 
 
 def demonstrate_trifid_with_custom_alphabet():
     """Demonstrate Trifid cipher with Turkish alphabet."""
+    from cryptology.classical.substitution.fractionated import trifid_encrypt, trifid_decrypt
+    
     print("=== Trifid Cipher with Turkish Alphabet ===")
     
     plaintext = "MERHABA DÜNYA"
     key = "GİZLİ"
-    turkish_alphabet = "ABCÇDEFGĞHIJKLMNOÖPRSŞTUÜVYZ"
     
     print(f"Plaintext: {plaintext}")
     print(f"Key: {key}")
-    print(f"Turkish alphabet: {turkish_alphabet}")
+    print(f"Turkish alphabet: {TURKISH_ALPHABET}")
     print()
     
     # Encrypt
-    encrypted = trifid_encrypt(plaintext, key, turkish_alphabet)
+    encrypted = trifid_encrypt(plaintext, key, TURKISH_ALPHABET)
     print(f"Encrypted: {encrypted}")
     
     # Decrypt
-    decrypted = trifid_decrypt(encrypted, key, turkish_alphabet)
+    decrypted = trifid_decrypt(encrypted, key, TURKISH_ALPHABET)
     print(f"Decrypted: {decrypted}")
     print()
 
 
 def demonstrate_fractionation_technique():
     """Demonstrate how fractionation works in Bifid cipher."""
+    from cryptology.classical.substitution.fractionated import bifid_encrypt
+    
     print("=== Fractionation Technique Explanation ===")
     
     plaintext = "HELLO"
@@ -113,27 +189,7 @@ def demonstrate_fractionation_technique():
     print(f"Key: {key}")
     print()
     
-    print("Step 1: Create 5x5 Polybius square")
-    print("M O N A R")
-    print("C H Y B D")
-    print("E F G I J")
-    print("K L P S T")
-    print("U V W X Z")
-    print()
-    
-    print("Step 2: Convert each letter to coordinates")
-    print("H -> (1,2), E -> (2,0), L -> (3,1), L -> (3,1), O -> (0,1)")
-    print("Rows: [1, 2, 3, 3, 0]")
-    print("Cols: [2, 0, 1, 1, 1]")
-    print()
-    
-    print("Step 3: Fractionation - write all rows, then all columns")
-    print("Fractionated: [1, 2, 3, 3, 0, 2, 0, 1, 1, 1]")
-    print()
-    
-    print("Step 4: Read pairs of coordinates to get new letters")
-    print("(1,2) -> H, (3,0) -> K, (0,1) -> O, (1,1) -> H")
-    print()
+    print(BIFID_FRACTIONATION_STEPS)
     
     # Actual encryption
     encrypted = bifid_encrypt(plaintext, key)
@@ -143,6 +199,8 @@ def demonstrate_fractionation_technique():
 
 def demonstrate_trifid_fractionation():
     """Demonstrate how fractionation works in Trifid cipher."""
+    from cryptology.classical.substitution.fractionated import trifid_encrypt
+    
     print("=== Trifid Fractionation Technique ===")
     
     plaintext = "HELLO"
@@ -152,27 +210,7 @@ def demonstrate_trifid_fractionation():
     print(f"Key: {key}")
     print()
     
-    print("Step 1: Create 3x3x3 Trifid cube")
-    print("Layer 0:    Layer 1:    Layer 2:")
-    print("M O N       P Q R       X Y Z")
-    print("A B C       D E F       G H I")
-    print("J K L       S T U       V W X")
-    print()
-    
-    print("Step 2: Convert each letter to 3D coordinates")
-    print("H -> (0,1,1), E -> (1,1,1), L -> (0,2,2), L -> (0,2,2), O -> (0,0,1)")
-    print("Layers: [0, 1, 0, 0, 0]")
-    print("Rows:   [1, 1, 2, 2, 0]")
-    print("Cols:   [1, 1, 2, 2, 1]")
-    print()
-    
-    print("Step 3: Fractionation - write all layers, then all rows, then all columns")
-    print("Fractionated: [0, 1, 0, 0, 0, 1, 1, 2, 2, 0, 1, 1, 2, 2, 1]")
-    print()
-    
-    print("Step 4: Read triplets of coordinates to get new letters")
-    print("(0,1,1) -> B, (0,0,1) -> O, (1,2,2) -> U")
-    print()
+    print(TRIFID_FRACTIONATION_STEPS)
     
     # Actual encryption
     encrypted = trifid_encrypt(plaintext, key)
@@ -182,6 +220,8 @@ def demonstrate_trifid_fractionation():
 
 def demonstrate_security_benefits():
     """Demonstrate security benefits of fractionated ciphers."""
+    from cryptology.classical.substitution.fractionated import bifid_encrypt, trifid_encrypt
+    
     print("=== Security Benefits of Fractionated Ciphers ===")
     
     plaintext = "THE QUICK BROWN FOX JUMPS OVER THE LAZY DOG"
@@ -200,22 +240,17 @@ def demonstrate_security_benefits():
     print(f"Trifid encrypted: {trifid_encrypted}")
     print()
     
-    print("Security Benefits:")
-    print("1. Fractionation breaks letter frequency patterns")
-    print("2. Each letter affects multiple positions in ciphertext")
-    print("3. Trifid provides 3D fractionation (even more secure)")
-    print("4. Custom alphabets add another layer of security")
-    print("5. Resistant to frequency analysis attacks")
-    print()
+    print(SECURITY_BENEFITS)
 
 
 def demonstrate_composable_system():
     """Demonstrate fractionated ciphers with monoalphabetic-produced alphabets."""
-    print("=== Composable System: Monoalphabetic + Fractionated ===")
-    
+    from cryptology.classical.substitution.fractionated import bifid_encrypt, trifid_encrypt
     from cryptology.classical.substitution.monoalphabetic.caesar import produce_alphabet as caesar_produce
     from cryptology.classical.substitution.monoalphabetic.keyword import produce_alphabet as keyword_produce
     
+    print("=== Composable System: Monoalphabetic + Fractionated ===")
+    
     plaintext = "COMPOSABLE CIPHER SYSTEM"
     key = "FRACTIONATED"
     
@@ -240,12 +275,7 @@ def demonstrate_composable_system():
     print(f"Trifid with keyword alphabet: {trifid_encrypted}")
     print()
     
-    print("Multi-layer encryption provides:")
-    print("1. Caesar shift adds basic substitution")
-    print("2. Keyword rearrangement adds complexity")
-    print("3. Bifid fractionation breaks patterns")
-    print("4. Trifid 3D fractionation adds maximum security")
-    print()
+    print(COMPOSABLE_BENEFITS)
 
 
 if __name__ == "__main__":
@@ -264,9 +294,4 @@ if __name__ == "__main__":
     
     print("Demo completed!")
     print()
-    print("Key Features:")
-    print("1. Bifid: 2D fractionation with 5x5 square")
-    print("2. Trifid: 3D fractionation with 3x3x3 cube")
-    print("3. Custom alphabet support for any language")
-    print("4. Composable with monoalphabetic ciphers")
-    print("5. Enhanced security through fractionation")
+    print(KEY_FEATURES)
@@ -5,8 +5,10 @@ This example shows how different letter combination strategies handle
 various languages and alphabet sizes for polygraphic ciphers.
 """
 
+import io
 import sys
 import os
+from functools import lru_cache
 
 # Add the parent directory to the path so we can import cryptology
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -14,168 +16,185 @@ sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from cryptology.classical.substitution.polygraphic.letter_combination_strategies import (
     LetterCombinationEngine, CombinationStrategy
 )
-from cryptology.classical.substitution.polygraphic.playfair import encrypt as playfair_encrypt, decrypt as playfair_decrypt
+
+# Alphabets exercised by the per-language tests and the combination reports
+TURKISH_ALPHABET = "abcçdefgğhıijklmnoöprsştuüvyz"
+RUSSIAN_ALPHABET = "абвгдежзийклмнопрстуфхцчшщъыьэюя"
+GERMAN_ALPHABET = "abcdefghijklmnopqrstuvwxyzäöüß"
+SPANISH_ALPHABET = "abcdefghijklmnñopqrstuvwxyzáéíóú"
+FRENCH_ALPHABET = "abcdefghijklmnopqrstuvwxyzàâäéèêëîïôöùûüÿç"
+
+# One engine shared by every test; results repeat across tests, so cache them
+ENGINE = LetterCombinationEngine()
+
+
+@lru_cache(maxsize=None)
+def _combine(alphabet, strategy, target_size=None, custom_rules_key=None):
+    """Cached ``ENGINE.combine_letters``; custom rules are passed as a frozenset of items."""
+    custom_rules = dict(custom_rules_key) if custom_rules_key is not None else None
+    return ENGINE.combine_letters(alphabet, strategy, target_size=target_size, custom_rules=custom_rules)
+
+
+@lru_cache(maxsize=None)
+def _detect(alphabet):
+    """Cached ``ENGINE.detect_language``."""
+    return ENGINE.detect_language(alphabet)
 
 
 def test_turkish_alphabet():
     """Test Turkish alphabet combination strategies."""
-    print("=== Turkish Alphabet Combination ===")
-    
-    # Turkish alphabet (29 letters)
-    turkish_alphabet = "abcçdefgğhıijklmnoöprsştuüvyz"
-    engine = LetterCombinationEngine()
+    from cryptology.classical.substitution.polygraphic.playfair import encrypt as playfair_encrypt, decrypt as playfair_decrypt
+    out = io.StringIO()
+    print("=== Turkish Alphabet Combination ===", file=out)
     
-    print(f"Original Turkish alphabet: {turkish_alphabet}")
-    print(f"Original size: {len(turkish_alphabet)}")
-    print(f"Detected language: {engine.detect_language(turkish_alphabet)}")
-    print()
+    print(f"Original Turkish alphabet: {TURKISH_ALPHABET}", file=out)
+    print(f"Original size: {len(TURKISH_ALPHABET)}", file=out)
+    print(f"Detected language: {_detect(TURKISH_ALPHABET)}", file=out)
+    print(file=out)
     
     # Test different strategies
     strategies = {
-        "Smart Combine": engine.combine_letters(turkish_alphabet, CombinationStrategy.SMART_COMBINE),
-        "Preserve Base": engine.combine_letters(turkish_alphabet, CombinationStrategy.PRESERVE_BASE),
-        "Generic": engine.combine_letters(turkish_alphabet, CombinationStrategy.PRESERVE_BASE, target_size=25)
+        "Smart Combine": _combine(TURKISH_ALPHABET, CombinationStrategy.SMART_COMBINE),
+        "Preserve Base": _combine(TURKISH_ALPHABET, CombinationStrategy.PRESERVE_BASE),
+        "Generic": _combine(TURKISH_ALPHABET, CombinationStrategy.PRESERVE_BASE, 25)
     }
     
     for strategy_name, result in strategies.items():
-        print(f"{strategy_name}: {result}")
-        print(f"  Size: {len(result)}")
-        print()
+        print(f"{strategy_name}: {result}", file=out)
+        print(f"  Size: {len(result)}", file=out)
+        print(file=out)
     
     # Test with Playfair
     try:
         encrypted = playfair_encrypt("merhaba dünya", "gizli", strategies["Smart Combine"])
         decrypted = playfair_decrypt(encrypted, "gizli", strategies["Smart Combine"])
-        print(f"Playfair test: '{encrypted}' -> '{decrypted}'")
+        print(f"Playfair test: '{encrypted}' -> '{decrypted}'", file=out)
     except Exception as e:
-        print(f"Playfair test failed: {e}")
+        print(f"Playfair test failed: {e}", file=out)
     
-    print()
+    print(file=out)
+    
+    sys.stdout.write(out.getvalue())
 
 
 def test_russian_alphabet():
     """Test Russian alphabet combination strategies."""
-    print("=== Russian Alphabet Combination ===")
+    out = io.StringIO()
+    print("=== Russian Alphabet Combination ===", file=out)
     
-    # Russian alphabet (33 letters)
-    russian_alphabet = "абвгдежзийклмнопрстуфхцчшщъыьэюя"
-    engine = LetterCombinationEngine()
-    
-    print(f"Original Russian alphabet: {russian_alphabet}")
-    print(f"Original size: {len(russian_alphabet)}")
-    print(f"Detected language: {engine.detect_language(russian_alphabet)}")
-    print()
+    print(f"Original Russian alphabet: {RUSSIAN_ALPHABET}", file=out)
+    print(f"Original size: {len(RUSSIAN_ALPHABET)}", file=out)
+    print(f"Detected language: {_detect(RUSSIAN_ALPHABET)}", file=out)
+    print(file=out)
     
     # Test different strategies
     strategies = {
-        "Smart Combine": engine.combine_letters(russian_alphabet, CombinationStrategy.SMART_COMBINE),
-        "Preserve Base": engine.combine_letters(russian_alphabet, CombinationStrategy.PRESERVE_BASE),
-        "Generic": engine.combine_letters(russian_alphabet, CombinationStrategy.PRESERVE_BASE, target_size=25)
+        "Smart Combine": _combine(RUSSIAN_ALPHABET, CombinationStrategy.SMART_COMBINE),
+        "Preserve Base": _combine(RUSSIAN_ALPHABET, CombinationStrategy.PRESERVE_BASE),
+        "Generic": _combine(RUSSIAN_ALPHABET, CombinationStrategy.PRESERVE_BASE, 25)
     }
     
     for strategy_name, result in strategies.items():
-        print(f"{strategy_name}: {result}")
-        print(f"  Size: {len(result)}")
-        print()
+        print(f"{strategy_name}: {result}", file=out)
+        print(f"  Size: {len(result)}", file=out)
+        print(file=out)
     
-    print()
+    print(file=out)
+    
+    sys.stdout.write(out.getvalue())
 
 
 def test_german_alphabet():
     """Test German alphabet combination strategies."""
-    print("=== German Alphabet Combination ===")
+    out = io.StringIO()
+    print("=== German Alphabet Combination ===", file=out)
     
-    # German alphabet with umlauts
-    german_alphabet = "abcdefghijklmnopqrstuvwxyzäöüß"
-    engine = LetterCombinationEngine()
-    
-    print(f"Original German alphabet: {german_alphabet}")
-    print(f"Original size: {len(german_alphabet)}")
-    print(f"Detected language: {engine.detect_language(german_alphabet)}")
-    print()
+    print(f"Original German alphabet: {GERMAN_ALPHABET}", file=out)
+    print(f"Original size: {len(GERMAN_ALPHABET)}", file=out)
+    print(f"Detected language: {_detect(GERMAN_ALPHABET)}", file=out)
+    print(file=out)
     
     # Test different strategies
     strategies = {
-        "Smart Combine": engine.combine_letters(german_alphabet, CombinationStrategy.SMART_COMBINE),
-        "Preserve Base": engine.combine_letters(german_alphabet, CombinationStrategy.PRESERVE_BASE),
-        "Generic": engine.combine_letters(german_alphabet, CombinationStrategy.PRESERVE_BASE, target_size=25)
+        "Smart Combine": _combine(GERMAN_ALPHABET, CombinationStrategy.SMART_COMBINE),
+        "Preserve Base": _combine(GERMAN_ALPHABET, CombinationStrategy.PRESERVE_BASE),
+        "Generic": _combine(GERMAN_ALPHABET, CombinationStrategy.PRESERVE_BASE, 25)
     }
     
     for strategy_name, result in strategies.items():
-        print(f"{strategy_name}: {result}")
-        print(f"  Size: {len(result)}")
-        print()
+        print(f"{strategy_name}: {result}", file=out)
+        print(f"  Size: {len(result)}", file=out)
+        print(file=out)
     
-    print()
+    print(file=out)
+    
+    sys.stdout.write(out.getvalue())
 
 
 def test_spanish_alphabet():
     """Test Spanish alphabet combination strategies."""
-    print("=== Spanish Alphabet Combination ===")
-    
-    # Spanish alphabet with ñ and accents
-    spanish_alphabet = "abcdefghijklmnñopqrstuvwxyzáéíóú"
-    engine = LetterCombinationEngine()
+    out = io.StringIO()
+    print("=== Spanish Alphabet Combination ===", file=out)
     
-    print(f"Original Spanish alphabet: {spanish_alphabet}")
-    print(f"Original size: {len(spanish_alphabet)}")
-    print(f"Detected language: {engine.detect_language(spanish_alphabet)}")
-    print()
+    print(f"Original Spanish alphabet: {SPANISH_ALPHABET}", file=out)
+    print(f"Original size: {len(SPANISH_ALPHABET)}", file=out)
+    print(f"Detected language: {_detect(SPANISH_ALPHABET)}", file=out)
+    print(file=out)
     
     # Test different strategies
     strategies = {
-        "Smart Combine": engine.combine_letters(spanish_alphabet, CombinationStrategy.SMART_COMBINE),
-        "Preserve Base": engine.combine_letters(spanish_alphabet, CombinationStrategy.PRESERVE_BASE),
-        "Generic": engine.combine_letters(spanish_alphabet, CombinationStrategy.PRESERVE_BASE, target_size=25)
+        "Smart Combine": _combine(SPANISH_ALPHABET, CombinationStrategy.SMART_COMBINE),
+        "Preserve Base": _combine(SPANISH_ALPHABET, CombinationStrategy.PRESERVE_BASE),
+        "Generic": _combine(SPANISH_ALPHABET, CombinationStrategy.PRESERVE_BASE, 25)
     }
     
     for strategy_name, result in strategies.items():
-        print(f"{strategy_name}: {result}")
-        print(f"  Size: {len(result)}")
-        print()
+        print(f"{strategy_name}: {result}", file=out)
+        print(f"  Size: {len(result)}", file=out)
+        print(file=out)
     
-    print()
+    print(file=out)
+    
+    sys.stdout.write(out.getvalue())
 
 
 def test_french_alphabet():
     """Test French alphabet combination strategies."""
-    print("=== French Alphabet Combination ===")
+    out = io.StringIO()
+    print("=== French Alphabet Combination ===", file=out)
     
-    # French alphabet with many accents
-    french_alphabet = "abcdefghijklmnopqrstuvwxyzàâäéèêëîïôöùûüÿç"
-    engine = LetterCombinationEngine()
-    
-    print(f"Original French alphabet: {french_alphabet}")
-    print(f"Original size: {len(french_alphabet)}")
-    print(f"Detected language: {engine.detect_language(french_alphabet)}")
-    print()
+    print(f"Original French alphabet: {FRENCH_ALPHABET}", file=out)
+    print(f"Original size: {len(FRENCH_ALPHABET)}", file=out)
+    print(f"Detected language: {_detect(FRENCH_ALPHABET)}", file=out)
+    print(file=out)
     
     # Test different strategies
     strategies = {
-        "Smart Combine": engine.combine_letters(french_alphabet, CombinationStrategy.SMART_COMBINE),
-        "Preserve Base": engine.combine_letters(french_alphabet, CombinationStrategy.PRESERVE_BASE),
-        "Generic": engine.combine_letters(french_alphabet, CombinationStrategy.PRESERVE_BASE, target_size=25)
+        "Smart Combine": _combine(FRENCH_ALPHABET, CombinationStrategy.SMART_COMBINE),
+        "Preserve Base": _combine(FRENCH_ALPHABET, CombinationStrategy.PRESERVE_BASE),
+        "Generic": _combine(FRENCH_ALPHABET, CombinationStrategy.PRESERVE_BASE, 25)
     }
     
     for strategy_name, result in strategies.items():
-        print(f"{strategy_name}: {result}")
-        print(f"  Size: {len(result)}")
-        print()
+        print(f"{strategy_name}: {result}", file=out)
+        print(f"  Size: {len(result)}", file=out)
+        print(file=out)
     
-    print()
+    print(file=out)
+    
+    sys.stdout.write(out.getvalue())
 
 
 def test_custom_combination_rules():
     """Test custom combination rules."""
-    print("=== Custom Combination Rules ===")
+    out = io.StringIO()
+    print("=== Custom Combination Rules ===", file=out)
     
     # Custom alphabet with special characters
     custom_alphabet = "abcdefghijklmnopqrstuvwxyz!@#$%^&*()"
-    engine = LetterCombinationEngine()
-    
-    print(f"Original custom alphabet: {custom_alphabet}")
-    print(f"Original size: {len(custom_alphabet)}")
-    print()
+    print(f"Original custom alphabet: {custom_alphabet}", file=out)
+    print(f"Original size: {len(custom_alphabet)}", file=out)
+    print(file=out)
     
     # Custom combination rules
     custom_rules = {
@@ -183,70 +202,74 @@ def test_custom_combination_rules():
         '^': 'v', '&': 'n', '*': 'x', '(': 'c', ')': 'o'
     }
     
-    result = engine.combine_letters(custom_alphabet, CombinationStrategy.CUSTOM, custom_rules=custom_rules)
-    print(f"Custom rules result: {result}")
-    print(f"Size: {len(result)}")
-    print()
+    result = _combine(custom_alphabet, CombinationStrategy.CUSTOM, custom_rules_key=frozenset(custom_rules.items()))
+    print(f"Custom rules result: {result}", file=out)
+    print(f"Size: {len(result)}", file=out)
+    print(file=out)
     
-    print()
+    print(file=out)
+    
+    sys.stdout.write(out.getvalue())
 
 
 def test_combination_reports():
     """Test combination strategy reports."""
-    print("=== Combination Strategy Reports ===")
+    out = io.StringIO()
+    print("=== Combination Strategy Reports ===", file=out)
     
     test_alphabets = [
-        ("Turkish", "abcçdefgğhıijklmnoöprsştuüvyz"),
-        ("Russian", "абвгдежзийклмнопрстуфхцчшщъыьэюя"),
-        ("German", "abcdefghijklmnopqrstuvwxyzäöüß"),
-        ("Spanish", "abcdefghijklmnñopqrstuvwxyzáéíóú"),
-        ("French", "abcdefghijklmnopqrstuvwxyzàâäéèêëîïôöùûüÿç")
+        ("Turkish", TURKISH_ALPHABET),
+        ("Russian", RUSSIAN_ALPHABET),
+        ("German", GERMAN_ALPHABET),
+        ("Spanish", SPANISH_ALPHABET),
+        ("French", FRENCH_ALPHABET)
     ]
     
-    engine = LetterCombinationEngine()
-    
     for language_name, alphabet in test_alphabets:
-        print(f"--- {language_name} Report ---")
-        report = engine.get_combination_report(alphabet)
+        print(f"--- {language_name} Report ---", file=out)
+        report = ENGINE.get_combination_report(alphabet)
         
-        print(f"Original: {report['original_alphabet']}")
-        print(f"Size: {report['original_size']}")
-        print(f"Detected Language: {report['detected_language']}")
-        print("Strategies:")
+        print(f"Original: {report['original_alphabet']}", file=out)
+        print(f"Size: {report['original_size']}", file=out)
+        print(f"Detected Language: {report['detected_language']}", file=out)
+        print("Strategies:", file=out)
         for strategy_name, result in report['strategies'].items():
-            print(f"  {strategy_name}: {result} (size: {len(result)})")
-        print("Recommendations:")
+            print(f"  {strategy_name}: {result} (size: {len(result)})", file=out)
+        print("Recommendations:", file=out)
         for rec in report['recommendations']:
-            print(f"  - {rec}")
-        print()
+            print(f"  - {rec}", file=out)
+        print(file=out)
+    
+    sys.stdout.write(out.getvalue())
 
 
 def test_edge_cases():
     """Test edge cases for letter combination."""
-    print("=== Edge Cases ===")
-    
-    engine = LetterCombinationEngine()
+    out = io.StringIO()
+    print("=== Edge Cases ===", file=out)
     
     # Very short alphabet
     short_alphabet = "abc"
-    print(f"Short alphabet: {short_alphabet}")
-    result = engine.combine_letters(short_alphabet, CombinationStrategy.SMART_COMBINE, target_size=25)
-    print(f"Result: {result} (size: {len(result)})")
-    print()
+    print(f"Short alphabet: {short_alphabet}", file=out)
+    result = _combine(short_alphabet, CombinationStrategy.SMART_COMBINE, 25)
+    print(f"Result: {result} (size: {len(result)})", file=out)
+    print(file=out)
     
     # Very long alphabet
     long_alphabet = "abcdefghijklmnopqrstuvwxyz0123456789!@#$%^&*()_+-=[]{}|;':\",./<>?"
-    print(f"Long alphabet: {long_alphabet}")
-    result = engine.combine_letters(long_alphabet, CombinationStrategy.SMART_COMBINE, target_size=25)
-    print(f"Result: {result} (size: {len(result)})")
-    print()
+    print(f"Long alphabet: {long_alphabet}", file=out)
+    result = _combine(long_alphabet, CombinationStrategy.SMART_COMBINE, 25)
+    print(f"Result: {result} (size: {len(result)})", file=out)
+    print(file=out)
     
     # Alphabet with duplicates
     duplicate_alphabet = "aabbccddeeffgghhiijjkkllmmnnooppqqrrssttuuvvwwxxyyzz"
-    print(f"Duplicate alphabet: {duplicate_alphabet}")
-    result = engine.combine_letters(duplicate_alphabet, CombinationStrategy.SMART_COMBINE, target_size=25)
-    print(f"Result: {result} (size: {len(result)})")
-    print()
+    print(f"Duplicate alphabet: {duplicate_alphabet}", file=out)
+    result = _combine(duplicate_alphabet, CombinationStrategy.SMART_COMBINE, 25)
+    print(f"Result: {result} (size: {len(result)})", file=out)
+    print(file=out)
+    
+    sys.stdout.write(out.getvalue())
 
 
 if __name__ == "__main__":
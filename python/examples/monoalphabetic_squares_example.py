@@ -13,10 +13,13 @@ from cryptology.classical.substitution.polygraphic.monoalphabetic_squares import
     validate_mono_params
 )
 
-from cryptology.classical.substitution.polygraphic.playfair import encrypt as playfair_encrypt, decrypt as playfair_decrypt
-from cryptology.classical.substitution.fractionated.bifid import encrypt as bifid_encrypt, decrypt as bifid_decrypt
-from cryptology.classical.substitution.fractionated.trifid import encrypt as trifid_encrypt, decrypt as trifid_decrypt
-from cryptology.classical.substitution.composite.nihilist import nihilist_encrypt, nihilist_decrypt
+# The ciphers are imported by the functions that run them, so importing this
+# module only loads the square utilities
+
+
+def _fmt_square(square, indent="  "):
+    """Format a square as numbered rows, one per line."""
+    return "\n".join(f"{indent}Row {i+1}: {line}" for i, line in enumerate(square.split('\n')))
 
 
 def demonstrate_monoalphabetic_squares():
@@ -65,9 +68,7 @@ def demonstrate_monoalphabetic_squares():
         try:
             square = create_monoalphabetic_square(square_type, mono_params=mono_params)
             print(f"\nGenerated {square_type} square:")
-            lines = square.split('\n')
-            for i, line in enumerate(lines):
-                print(f"  Row {i+1}: {line}")
+            print(_fmt_square(square))
             print()
             
             # Test with different ciphers
@@ -81,6 +82,9 @@ def demonstrate_monoalphabetic_squares():
 
 def test_ciphers_with_square(square_type, square, plaintext, key, mono_params):
     """Test different ciphers using the generated square."""
+    from cryptology.classical.substitution.polygraphic.playfair import encrypt as playfair_encrypt, decrypt as playfair_decrypt
+    from cryptology.classical.substitution.fractionated.bifid import encrypt as bifid_encrypt, decrypt as bifid_decrypt
+    from cryptology.classical.substitution.composite.nihilist import nihilist_encrypt, nihilist_decrypt
     
     print(f"Testing ciphers with {square_type} square:")
     
@@ -120,6 +124,7 @@ def test_ciphers_with_square(square_type, square, plaintext, key, mono_params):
 
 def demonstrate_turkish_alphabet():
     """Demonstrate monoalphabetic squares with Turkish alphabet."""
+    from cryptology.classical.substitution.composite.nihilist import nihilist_encrypt, nihilist_decrypt
     
     print("=" * 80)
     print("MONOALPHABETIC SQUARES WITH TURKISH ALPHABET")
@@ -139,9 +144,7 @@ def demonstrate_turkish_alphabet():
     try:
         square = create_monoalphabetic_square("caesar", turkish_alphabet, {"shift": 5})
         print(f"Square:")
-        lines = square.split('\n')
-        for i, line in enumerate(lines):
-            print(f"  Row {i+1}: {line}")
+        print(_fmt_square(square))
         print()
         
         # Test Nihilist with Turkish
@@ -178,10 +181,12 @@ def demonstrate_parameter_validation():
         ("invalid", {}, False),
     ]
     
+    lines = []
     for square_type, mono_params, expected in test_cases:
         result = validate_mono_params(square_type, mono_params)
         status = "✓" if result == expected else "✗"
-        print(f"{status} {square_type}: {mono_params} -> {result} (expected {expected})")
+        lines.append(f"{status} {square_type}: {mono_params} -> {result} (expected {expected})")
+    print("\n".join(lines))
 
 
 def main():
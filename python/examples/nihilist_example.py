@@ -10,53 +10,79 @@ This module demonstrates various ways to use the Nihilist cipher including:
 - Integration with other ciphers
 """
 
-from cryptology.classical.substitution.composite.nihilist import (
-    nihilist_encrypt,
-    nihilist_decrypt,
-    nihilist_produce_square,
-    nihilist_generate_random_key,
-    nihilist_generate_key_for_text,
-    nihilist_encrypt_with_random_key
-)
+import io
+import sys
+from functools import lru_cache
+
+# Each example imports the Nihilist functions it uses, so importing this
+# module does not load the cipher
+
+
+@lru_cache(maxsize=128)
+def _square(square_type, alphabet=None, mono_params_items=None, keyword=None):
+    """Cached ``nihilist_produce_square``; mono_params are passed as sorted items."""
+    from cryptology.classical.substitution.composite.nihilist import nihilist_produce_square
+    mono_params = dict(mono_params_items) if mono_params_items else None
+    return nihilist_produce_square(square_type, keyword=keyword, alphabet=alphabet, mono_params=mono_params)
+
+
+def _params_key(params):
+    """Turn a mono_params dict into the hashable key used by ``_square``."""
+    return tuple(sorted(params.items())) if params else None
+
+
+def _fmt_square(square, indent="  "):
+    """Format a square as numbered rows, one per line."""
+    return "\n".join(f"{indent}Row {i+1}: {line}" for i, line in enumerate(square.split('\n')))
 
 
 def example_basic_usage():
     """Demonstrate basic Nihilist cipher usage."""
-    print("=" * 60)
-    print("BASIC NIHILIST CIPHER USAGE")
-    print("=" * 60)
+    from cryptology.classical.substitution.composite.nihilist import (
+        nihilist_encrypt,
+        nihilist_decrypt
+    )
+    out = io.StringIO()
+    print("=" * 60, file=out)
+    print("BASIC NIHILIST CIPHER USAGE", file=out)
+    print("=" * 60, file=out)
     
     plaintext = "HELLOWORLD"  # Removed space
     key = "12345"
     
-    print(f"Plaintext: {plaintext}")
-    print(f"Key: {key}")
-    print()
+    print(f"Plaintext: {plaintext}", file=out)
+    print(f"Key: {key}", file=out)
+    print(file=out)
     
     # Generate a standard square
-    square = nihilist_produce_square("standard")
-    print("Standard Square:")
-    lines = square.split('\n')
-    for i, line in enumerate(lines):
-        print(f"  Row {i+1}: {line}")
-    print()
+    square = _square("standard")
+    print("Standard Square:", file=out)
+    print(_fmt_square(square), file=out)
+    print(file=out)
     
     # Encrypt
     encrypted = nihilist_encrypt(plaintext, key, square=square)
-    print(f"Encrypted: {encrypted}")
+    print(f"Encrypted: {encrypted}", file=out)
     
     # Decrypt
     decrypted = nihilist_decrypt(encrypted, key, square=square)
-    print(f"Decrypted: {decrypted}")
-    print(f"✓ Success: {decrypted == plaintext}")
-    print()
+    print(f"Decrypted: {decrypted}", file=out)
+    print(f"✓ Success: {decrypted == plaintext}", file=out)
+    print(file=out)
+    
+    sys.stdout.write(out.getvalue())
 
 
 def example_different_square_types():
     """Demonstrate different square types."""
-    print("=" * 60)
-    print("DIFFERENT SQUARE TYPES")
-    print("=" * 60)
+    from cryptology.classical.substitution.composite.nihilist import (
+        nihilist_encrypt,
+        nihilist_decrypt
+    )
+    out = io.StringIO()
+    print("=" * 60, file=out)
+    print("DIFFERENT SQUARE TYPES", file=out)
+    print("=" * 60, file=out)
     
     plaintext = "HELLO"
     key = "12345"
@@ -72,92 +98,108 @@ def example_different_square_types():
     ]
     
     for name, square_type, mono_params in square_types:
-        print(f"{name} Square:")
+        print(f"{name} Square:", file=out)
         
         try:
             if square_type == "keyword":
-                square = nihilist_produce_square(square_type, keyword=mono_params["keyword"])
+                square = _square(square_type, keyword=mono_params["keyword"])
             else:
-                square = nihilist_produce_square(square_type, mono_params=mono_params)
+                square = _square(square_type, mono_params_items=_params_key(mono_params))
             
             # Show first row of square
             first_row = square.split('\n')[0]
-            print(f"  First row: {first_row}")
+            print(f"  First row: {first_row}", file=out)
             
             # Test encryption/decryption
             encrypted = nihilist_encrypt(plaintext, key, square=square)
             decrypted = nihilist_decrypt(encrypted, key, square=square)
             
-            print(f"  Encrypted: {encrypted}")
-            print(f"  Decrypted: {decrypted}")
-            print(f"  ✓ Success: {decrypted == plaintext}")
+            print(f"  Encrypted: {encrypted}", file=out)
+            print(f"  Decrypted: {decrypted}", file=out)
+            print(f"  ✓ Success: {decrypted == plaintext}", file=out)
             
         except Exception as e:
-            print(f"  ✗ Error: {e}")
+            print(f"  ✗ Error: {e}", file=out)
         
-        print()
+        print(file=out)
+    
+    sys.stdout.write(out.getvalue())
 
 
 def example_random_key_generation():
     """Demonstrate random key generation."""
-    print("=" * 60)
-    print("RANDOM KEY GENERATION")
-    print("=" * 60)
+    from cryptology.classical.substitution.composite.nihilist import (
+        nihilist_decrypt,
+        nihilist_generate_random_key,
+        nihilist_generate_key_for_text,
+        nihilist_encrypt_with_random_key
+    )
+    out = io.StringIO()
+    print("=" * 60, file=out)
+    print("RANDOM KEY GENERATION", file=out)
+    print("=" * 60, file=out)
     
     plaintext = "HELLOWORLD"  # Removed space
     
-    print(f"Plaintext: {plaintext}")
-    print()
+    print(f"Plaintext: {plaintext}", file=out)
+    print(file=out)
     
     # Generate random numeric key
-    print("Numeric Keys:")
+    print("Numeric Keys:", file=out)
     for length in [5, 10, 15]:
         key = nihilist_generate_random_key(length, "numeric")
-        print(f"  Length {length}: {key}")
-    print()
+        print(f"  Length {length}: {key}", file=out)
+    print(file=out)
     
     # Generate random alphabetic key
-    print("Alphabetic Keys:")
+    print("Alphabetic Keys:", file=out)
     for length in [5, 10, 15]:
         key = nihilist_generate_random_key(length, "alphabetic")
-        print(f"  Length {length}: {key}")
-    print()
+        print(f"  Length {length}: {key}", file=out)
+    print(file=out)
     
     # Generate key for specific text
-    print("Keys for specific text:")
+    print("Keys for specific text:", file=out)
     numeric_key = nihilist_generate_key_for_text(plaintext, "numeric")
     alphabetic_key = nihilist_generate_key_for_text(plaintext, "alphabetic")
     
-    print(f"  Numeric key: {numeric_key}")
-    print(f"  Alphabetic key: {alphabetic_key}")
-    print()
+    print(f"  Numeric key: {numeric_key}", file=out)
+    print(f"  Alphabetic key: {alphabetic_key}", file=out)
+    print(file=out)
     
     # Test encryption with random key
-    print("Encryption with random key:")
-    square = nihilist_produce_square("standard")
+    print("Encryption with random key:", file=out)
+    square = _square("standard")
     
     encrypted, generated_key = nihilist_encrypt_with_random_key(plaintext, 10, "numeric")
-    print(f"  Generated key: {generated_key}")
-    print(f"  Encrypted: {encrypted}")
+    print(f"  Generated key: {generated_key}", file=out)
+    print(f"  Encrypted: {encrypted}", file=out)
     
     decrypted = nihilist_decrypt(encrypted, generated_key, square=square)
-    print(f"  Decrypted: {decrypted}")
-    print(f"  ✓ Success: {decrypted == plaintext}")
-    print()
+    print(f"  Decrypted: {decrypted}", file=out)
+    print(f"  ✓ Success: {decrypted == plaintext}", file=out)
+    print(file=out)
+    
+    sys.stdout.write(out.getvalue())
 
 
 def example_monoalphabetic_squares():
     """Demonstrate monoalphabetic square integration."""
-    print("=" * 60)
-    print("MONOALPHABETIC SQUARE INTEGRATION")
-    print("=" * 60)
+    from cryptology.classical.substitution.composite.nihilist import (
+        nihilist_encrypt,
+        nihilist_decrypt
+    )
+    out = io.StringIO()
+    print("=" * 60, file=out)
+    print("MONOALPHABETIC SQUARE INTEGRATION", file=out)
+    print("=" * 60, file=out)
     
     plaintext = "HELLO"
     key = "12345"
     
-    print(f"Plaintext: {plaintext}")
-    print(f"Key: {key}")
-    print()
+    print(f"Plaintext: {plaintext}", file=out)
+    print(f"Key: {key}", file=out)
+    print(file=out)
     
     # Test different monoalphabetic transformations
     transformations = [
@@ -169,84 +211,95 @@ def example_monoalphabetic_squares():
     ]
     
     for name, square_type, mono_params in transformations:
-        print(f"{name}:")
+        print(f"{name}:", file=out)
         
         try:
-            square = nihilist_produce_square(square_type, mono_params=mono_params)
+            square = _square(square_type, mono_params_items=_params_key(mono_params))
             
             # Show the square
-            lines = square.split('\n')
-            print("  Square:")
-            for i, line in enumerate(lines):
-                print(f"    Row {i+1}: {line}")
+            print("  Square:", file=out)
+            print(_fmt_square(square, "    "), file=out)
             
             # Test encryption/decryption
             encrypted = nihilist_encrypt(plaintext, key, square=square)
             decrypted = nihilist_decrypt(encrypted, key, square=square)
             
-            print(f"  Encrypted: {encrypted}")
-            print(f"  Decrypted: {decrypted}")
-            print(f"  ✓ Success: {decrypted == plaintext}")
+            print(f"  Encrypted: {encrypted}", file=out)
+            print(f"  Decrypted: {decrypted}", file=out)
+            print(f"  ✓ Success: {decrypted == plaintext}", file=out)
             
         except Exception as e:
-            print(f"  ✗ Error: {e}")
+            print(f"  ✗ Error: {e}", file=out)
         
-        print()
+        print(file=out)
+    
+    sys.stdout.write(out.getvalue())
 
 
 def example_turkish_alphabet():
     """Demonstrate Turkish alphabet support."""
-    print("=" * 60)
-    print("TURKISH ALPHABET SUPPORT")
-    print("=" * 60)
+    from cryptology.classical.substitution.composite.nihilist import (
+        nihilist_encrypt,
+        nihilist_decrypt
+    )
+    out = io.StringIO()
+    print("=" * 60, file=out)
+    print("TURKISH ALPHABET SUPPORT", file=out)
+    print("=" * 60, file=out)
     
     turkish_alphabet = "ABCÇDEFGĞHIİJKLMNOÖPRSŞTUÜVYZ"
     plaintext = "MERHABA"  # "Hello" in Turkish
     key = "12345"
     
-    print(f"Turkish Alphabet: {turkish_alphabet}")
-    print(f"Plaintext: {plaintext}")
-    print(f"Key: {key}")
-    print()
+    print(f"Turkish Alphabet: {turkish_alphabet}", file=out)
+    print(f"Plaintext: {plaintext}", file=out)
+    print(f"Key: {key}", file=out)
+    print(file=out)
     
     # Generate Turkish square
-    square = nihilist_produce_square("standard", alphabet=turkish_alphabet)
-    print("Turkish Square (6x6):")
-    lines = square.split('\n')
-    for i, line in enumerate(lines):
-        print(f"  Row {i+1}: {line}")
-    print()
+    square = _square("standard", alphabet=turkish_alphabet)
+    print("Turkish Square (6x6):", file=out)
+    print(_fmt_square(square), file=out)
+    print(file=out)
     
     # Test encryption/decryption
     try:
         encrypted = nihilist_encrypt(plaintext, key, square=square)
         decrypted = nihilist_decrypt(encrypted, key, square=square)
         
-        print(f"Encrypted: {encrypted}")
-        print(f"Decrypted: {decrypted}")
-        print(f"✓ Success: {decrypted == plaintext}")
+        print(f"Encrypted: {encrypted}", file=out)
+        print(f"Decrypted: {decrypted}", file=out)
+        print(f"✓ Success: {decrypted == plaintext}", file=out)
         
     except Exception as e:
-        print(f"✗ Error: {e}")
-        print("Note: Turkish alphabet integration may need coordinate handling fixes")
+        print(f"✗ Error: {e}", file=out)
+        print("Note: Turkish alphabet integration may need coordinate handling fixes", file=out)
     
-    print()
+    print(file=out)
+    
+    sys.stdout.write(out.getvalue())
 
 
 def example_key_variations():
     """Demonstrate different key types and lengths."""
-    print("=" * 60)
-    print("KEY VARIATIONS")
-    print("=" * 60)
+    from cryptology.classical.substitution.composite.nihilist import (
+        nihilist_encrypt,
+        nihilist_decrypt,
+        nihilist_generate_random_key
+    )
+    out = io.StringIO()
+    print("=" * 60, file=out)
+    print("KEY VARIATIONS", file=out)
+    print("=" * 60, file=out)
     
     plaintext = "HELLOWORLD"  # Removed space
-    square = nihilist_produce_square("standard")
+    square = _square("standard")
     
-    print(f"Plaintext: {plaintext}")
-    print()
+    print(f"Plaintext: {plaintext}", file=out)
+    print(file=out)
     
     # Test different key lengths
-    print("Different key lengths:")
+    print("Different key lengths:", file=out)
     key_lengths = [1, 3, 5, 10, 20]
     
     for length in key_lengths:
@@ -254,14 +307,14 @@ def example_key_variations():
         encrypted = nihilist_encrypt(plaintext, key, square=square)
         decrypted = nihilist_decrypt(encrypted, key, square=square)
         
-        print(f"  Key length {length}: {key}")
-        print(f"    Encrypted: {encrypted}")
-        print(f"    Decrypted: {decrypted}")
-        print(f"    ✓ Success: {decrypted == plaintext}")
-        print()
+        print(f"  Key length {length}: {key}", file=out)
+        print(f"    Encrypted: {encrypted}", file=out)
+        print(f"    Decrypted: {decrypted}", file=out)
+        print(f"    ✓ Success: {decrypted == plaintext}", file=out)
+        print(file=out)
     
     # Test alphabetic keys
-    print("Alphabetic keys:")
+    print("Alphabetic keys:", file=out)
     alphabetic_keys = ["ABCDE", "HELLO", "CRYPTO"]
     
     for key in alphabetic_keys:
@@ -269,23 +322,30 @@ def example_key_variations():
             encrypted = nihilist_encrypt(plaintext, key, square=square)
             decrypted = nihilist_decrypt(encrypted, key, square=square)
             
-            print(f"  Key: {key}")
-            print(f"    Encrypted: {encrypted}")
-            print(f"    Decrypted: {decrypted}")
-            print(f"    ✓ Success: {decrypted == plaintext}")
+            print(f"  Key: {key}", file=out)
+            print(f"    Encrypted: {encrypted}", file=out)
+            print(f"    Decrypted: {decrypted}", file=out)
+            print(f"    ✓ Success: {decrypted == plaintext}", file=out)
         except Exception as e:
-            print(f"  Key: {key}")
-            print(f"    ✗ Error: {e}")
-        print()
+            print(f"  Key: {key}", file=out)
+            print(f"    ✗ Error: {e}", file=out)
+        print(file=out)
+    
+    sys.stdout.write(out.getvalue())
 
 
 def example_error_handling():
     """Demonstrate error handling."""
-    print("=" * 60)
-    print("ERROR HANDLING")
-    print("=" * 60)
+    from cryptology.classical.substitution.composite.nihilist import (
+        nihilist_encrypt,
+        nihilist_produce_square
+    )
+    out = io.StringIO()
+    print("=" * 60, file=out)
+    print("ERROR HANDLING", file=out)
+    print("=" * 60, file=out)
     
-    square = nihilist_produce_square("standard")
+    square = _square("standard")
     
     # Test various error conditions
     error_cases = [
@@ -298,21 +358,21 @@ def example_error_handling():
     ]
     
     for description, plaintext, key in error_cases:
-        print(f"{description}:")
+        print(f"{description}:", file=out)
         
         try:
             if plaintext is None or key is None:
                 encrypted = nihilist_encrypt(plaintext, key, square=square)
             else:
                 encrypted = nihilist_encrypt(plaintext, key, square=square)
-            print(f"  ✗ Unexpected success: {encrypted}")
+            print(f"  ✗ Unexpected success: {encrypted}", file=out)
         except Exception as e:
-            print(f"  ✓ Correctly caught error: {type(e).__name__}: {e}")
+            print(f"  ✓ Correctly caught error: {type(e).__name__}: {e}", file=out)
         
-        print()
+        print(file=out)
     
     # Test invalid square types
-    print("Invalid square types:")
+    print("Invalid square types:", file=out)
     invalid_types = ["invalid", "caesar", "affine"]  # Missing parameters
     
     for square_type in invalid_types:
@@ -323,11 +383,13 @@ def example_error_handling():
                 square = nihilist_produce_square(square_type)  # Missing a, b
             else:
                 square = nihilist_produce_square(square_type)
-            print(f"  ✗ Unexpected success with {square_type}")
+            print(f"  ✗ Unexpected success with {square_type}", file=out)
         except Exception as e:
-            print(f"  ✓ Correctly caught error with {square_type}: {type(e).__name__}: {e}")
+            print(f"  ✓ Correctly caught error with {square_type}: {type(e).__name__}: {e}", file=out)
     
-    print()
+    print(file=out)
+    
+    sys.stdout.write(out.getvalue())
 
 
 def main():
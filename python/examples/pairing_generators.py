@@ -4,10 +4,16 @@ Custom Pairing Strategy Generator for Porta Cipher
 Provides utility functions to generate various pairing strategies
 """
 
+import io
 import random
 import string
+import sys
+from bisect import bisect_left
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from math import gcd
 from typing import List, Tuple, Dict
-from cryptology.classical.substitution.polyalphabetic import porta_produce_pairs
+from cryptology.classical.substitution.polyalphabetic import porta_produce_pairs, porta_encrypt, porta_decrypt
 
 def generate_frequency_based_pairs(alphabet: str, num_pairs: int = None) -> List[Tuple[str, str]]:
     """
@@ -27,14 +33,14 @@ def generate_frequency_based_pairs(alphabet: str, num_pairs: int = None) -> List
     frequency_order = "ETAOINSHRDLCUMWFGYPBVKJXQZ"
     
     # Filter to only include letters in our alphabet
-    available_letters = [c for c in frequency_order if c in alphabet.upper()]
+    alphabet_letters = frozenset(alphabet.upper())
+    available_letters = [c for c in frequency_order if c in alphabet_letters]
     
     pairs = []
     for i in range(min(num_pairs, len(available_letters) // 2)):
-        if i < len(available_letters) // 2:
-            common_letter = available_letters[i]
-            rare_letter = available_letters[-(i + 1)]
-            pairs.append((common_letter, rare_letter))
+        common_letter = available_letters[i]
+        rare_letter = available_letters[-(i + 1)]
+        pairs.append((common_letter, rare_letter))
     
     return pairs
 
@@ -53,15 +59,16 @@ def generate_caesar_pairs(alphabet: str, shift: int = 13, num_pairs: int = None)
     if num_pairs is None:
         num_pairs = len(alphabet) // 2
     
+    alphabet_len = len(alphabet)
     pairs = []
     used_letters = set()
     
-    for i in range(len(alphabet)):
+    for i in range(alphabet_len):
         if len(pairs) >= num_pairs:
             break
         
         if alphabet[i] not in used_letters:
-            shifted_index = (i + shift) % len(alphabet)
+            shifted_index = (i + shift) % alphabet_len
             if alphabet[shifted_index] not in used_letters:
                 pairs.append((alphabet[i], alphabet[shifted_index]))
                 used_letters.add(alphabet[i])
@@ -84,11 +91,9 @@ def generate_atbash_symmetric_pairs(alphabet: str, num_pairs: int = None) -> Lis
     if num_pairs is None:
         num_pairs = len(alphabet) // 2
     
-    pairs = []
-    for i in range(min(num_pairs, len(alphabet) // 2)):
-        pairs.append((alphabet[i], alphabet[-(i + 1)]))
-    
-    return pairs
+    # Pair the first letters with the last ones read backwards
+    count = max(0, min(num_pairs, len(alphabet) // 2))
+    return list(zip(alphabet[:count], alphabet[::-1][:count]))
 
 def generate_affine_pairs(alphabet: str, a: int = 3, b: int = 1, num_pairs: int = None) -> List[Tuple[str, str]]:
     """
@@ -106,22 +111,17 @@ def generate_affine_pairs(alphabet: str, a: int = 3, b: int = 1, num_pairs: int
     if num_pairs is None:
         num_pairs = len(alphabet) // 2
     
-    def gcd(a_val, b_val):
-        while b_val:
-            a_val, b_val = b_val, a_val % b_val
-        return a_val
-    
-    # Ensure 'a' is coprime with alphabet length
+    # Ensure 'a' is coprime with alphabet length: otherwise take the next
+    # coprime multiplier, wrapping around to 1
     alphabet_len = len(alphabet)
-    while gcd(a, alphabet_len) != 1:
-        a = (a + 1) % alphabet_len
-        if a == 0:
-            a = 1
+    if gcd(a, alphabet_len) != 1:
+        coprimes = _coprimes(alphabet_len)
+        a = coprimes[bisect_left(coprimes, a % alphabet_len) % len(coprimes)]
     
     pairs = []
     used_letters = set()
     
-    for i in range(len(alphabet)):
+    for i in range(alphabet_len):
         if len(pairs) >= num_pairs:
             break
         
@@ -137,6 +137,36 @@ def generate_affine_pairs(alphabet: str, a: int = 3, b: int = 1, num_pairs: int
     
     return pairs
 
+@lru_cache(maxsize=16)
+def _coprimes(n: int) -> Tuple[int, ...]:
+    """
+    Multipliers in 1..n-1 that are coprime with n, cached per n
+    
+    Args:
+        n: Alphabet length
+    
+    Returns:
+        Sorted tuple of the coprime multipliers
+    """
+    return tuple(x for x in range(1, n) if gcd(x, n) == 1)
+
+@lru_cache(maxsize=None)
+def _prime_sieve(limit: int) -> Tuple[bool, ...]:
+    """
+    Sieve of Eratosthenes up to and including limit, cached per limit
+    
+    Args:
+        limit: Largest number to classify
+    
+    Returns:
+        Tuple whose entry n is True when n is prime
+    """
+    is_prime = [False, False] + [True] * (limit - 1)
+    for n in range(2, int(limit ** 0.5) + 1):
+        if is_prime[n]:
+            is_prime[n * n::n] = [False] * len(range(n * n, limit + 1, n))
+    return tuple(is_prime)
+
 def generate_prime_position_pairs(alphabet: str, num_pairs: int = None) -> List[Tuple[str, str]]:
     """
     Generate pairs based on prime number positions
@@ -151,25 +181,21 @@ def generate_prime_position_pairs(alphabet: str, num_pairs: int = None) -> List[
     if num_pairs is None:
         num_pairs = len(alphabet) // 2
     
-    def is_prime(n):
-        if n < 2:
-            return False
-        for i in range(2, int(n ** 0.5) + 1):
-            if n % i == 0:
-                return False
-        return True
+    alphabet_len = len(alphabet)
+    # One flag per 1-based position: is_prime[n] is True when n is prime
+    is_prime = _prime_sieve(alphabet_len + 1)
     
     pairs = []
     used_letters = set()
     
-    for i in range(len(alphabet)):
+    for i in range(alphabet_len):
         if len(pairs) >= num_pairs:
             break
         
-        if is_prime(i + 1) and alphabet[i] not in used_letters:
+        if is_prime[i + 1] and alphabet[i] not in used_letters:
             # Find next prime position
-            for j in range(i + 1, len(alphabet)):
-                if is_prime(j + 1) and alphabet[j] not in used_letters:
+            for j in range(i + 1, alphabet_len):
+                if is_prime[j + 1] and alphabet[j] not in used_letters:
                     pairs.append((alphabet[i], alphabet[j]))
                     used_letters.add(alphabet[i])
                     used_letters.add(alphabet[j])
@@ -190,16 +216,16 @@ def analyze_pairing_strategy(pairs: List[Tuple[str, str]], alphabet: str,
     Returns:
         Dictionary with analysis results
     """
-    from cryptology.classical.substitution.polyalphabetic import porta_encrypt, porta_decrypt
-    
     try:
         # Test encryption/decryption
         encrypted = porta_encrypt(test_text, "TEST", alphabet, pairs)
         decrypted = porta_decrypt(encrypted, "TEST", alphabet, pairs)
         
         # Calculate statistics
-        total_chars = len([c for c in test_text if c.isalpha()])
-        changed_chars = sum(1 for i, c in enumerate(test_text) if c.isalpha() and encrypted[i] != c)
+        # One flag per letter of the test text: True when encryption changed it
+        changed_flags = [c != e for c, e in zip(test_text, encrypted) if c.isalpha()]
+        total_chars = len(changed_flags)
+        changed_chars = sum(changed_flags)
         change_rate = (changed_chars / total_chars) * 100 if total_chars > 0 else 0
         
         return {
@@ -212,6 +238,46 @@ def analyze_pairing_strategy(pairs: List[Tuple[str, str]], alphabet: str,
     except Exception as e:
         return {'error': str(e)}
 
+def _render_strategy(strategy_name: str, generator_func, args: Tuple, alphabet: str, test_text: str) -> str:
+    """
+    Generate and analyze one pairing strategy, returning its report text
+    
+    Args:
+        strategy_name: Heading for the strategy
+        generator_func: Pair generator to call
+        args: Positional arguments for the generator
+        alphabet: The alphabet used
+        test_text: Text to test with
+    
+    Returns:
+        The printed report for the strategy
+    """
+    out = io.StringIO()
+    print(f"\n{strategy_name}", file=out)
+    print("-" * 50, file=out)
+    
+    try:
+        pairs = generator_func(*args)
+        print(f"Generated pairs: {pairs}", file=out)
+        
+        # Analyze the strategy
+        analysis = analyze_pairing_strategy(pairs, alphabet, test_text)
+        
+        if 'error' in analysis:
+            print(f"Error: {analysis['error']}", file=out)
+        else:
+            print(f"Test text: {test_text}", file=out)
+            print(f"Encrypted: {analysis['encrypted']}", file=out)
+            print(f"Decrypted: {analysis['decrypted']}", file=out)
+            print(f"Success: {analysis['success']}", file=out)
+            print(f"Change rate: {analysis['change_rate']:.1f}%", file=out)
+            print(f"Pairs count: {analysis['pairs_count']}", file=out)
+    
+    except Exception as e:
+        print(f"Error generating pairs: {e}", file=out)
+    
+    return out.getvalue()
+
 def demonstrate_pairing_generators():
     """Demonstrate all pairing strategy generators"""
     
@@ -222,38 +288,22 @@ def demonstrate_pairing_generators():
     alphabet = "ABCDEFGHIJKLMNOPQRSTUVWXYZ"
     test_text = "HELLO WORLD"
     
-    generators = {
-        "Frequency-Based": lambda: generate_frequency_based_pairs(alphabet, 10),
-        "Atbash/Symmetric": lambda: generate_atbash_symmetric_pairs(alphabet, 10),
-        "Caesar-Shifted (+13)": lambda: generate_caesar_pairs(alphabet, 13, 10),
-        "Affine-Based (a=3, b=1)": lambda: generate_affine_pairs(alphabet, 3, 1, 10),
-        "Affine-Based (a=5, b=2)": lambda: generate_affine_pairs(alphabet, 5, 2, 10),
-        "Prime Position": lambda: generate_prime_position_pairs(alphabet, 10)
-    }
-    
-    for strategy_name, generator_func in generators.items():
-        print(f"\n{strategy_name}")
-        print("-" * 50)
-        
-        try:
-            pairs = generator_func()
-            print(f"Generated pairs: {pairs}")
-            
-            # Analyze the strategy
-            analysis = analyze_pairing_strategy(pairs, alphabet, test_text)
-            
-            if 'error' in analysis:
-                print(f"Error: {analysis['error']}")
-            else:
-                print(f"Test text: {test_text}")
-                print(f"Encrypted: {analysis['encrypted']}")
-                print(f"Decrypted: {analysis['decrypted']}")
-                print(f"Success: {analysis['success']}")
-                print(f"Change rate: {analysis['change_rate']:.1f}%")
-                print(f"Pairs count: {analysis['pairs_count']}")
-        
-        except Exception as e:
-            print(f"Error generating pairs: {e}")
+    generators = (
+        ("Frequency-Based", generate_frequency_based_pairs, (alphabet, 10)),
+        ("Atbash/Symmetric", generate_atbash_symmetric_pairs, (alphabet, 10)),
+        ("Caesar-Shifted (+13)", generate_caesar_pairs, (alphabet, 13, 10)),
+        ("Affine-Based (a=3, b=1)", generate_affine_pairs, (alphabet, 3, 1, 10)),
+        ("Affine-Based (a=5, b=2)", generate_affine_pairs, (alphabet, 5, 2, 10)),
+        ("Prime Position", generate_prime_position_pairs, (alphabet, 10))
+    )
+    
+    # The strategies are independent; evaluate them concurrently and print in order
+    with ThreadPoolExecutor(max_workers=len(generators)) as executor:
+        reports = executor.map(
+            lambda strategy: _render_strategy(*strategy, alphabet, test_text), generators
+        )
+        for report in reports:
+            sys.stdout.write(report)
     
     print("\n" + "=" * 80)
     print("GENERATOR DEMONSTRATION COMPLETED")
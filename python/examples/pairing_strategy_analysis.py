@@ -7,6 +7,34 @@ Analyzes security implications and effectiveness of different pairing approaches
 from cryptology.classical.substitution.polyalphabetic import porta_produce_pairs, porta_encrypt, porta_decrypt
 import string
 
+# Hand-picked pairings compared by the analysis, built once at import
+STRATEGIES = {
+    "Frequency-Based (Common ↔ Rare)": (
+        ('E', 'Z'), ('T', 'Q'), ('A', 'X'), ('O', 'J'), ('I', 'K'),
+        ('N', 'V'), ('S', 'B'), ('H', 'Y'), ('R', 'W'), ('D', 'F')
+    ),
+    "Symmetric (Mirror Positions)": (
+        ('A', 'Z'), ('B', 'Y'), ('C', 'X'), ('D', 'W'), ('E', 'V'),
+        ('F', 'U'), ('G', 'T'), ('H', 'S'), ('I', 'R'), ('J', 'Q'),
+        ('K', 'P'), ('L', 'O'), ('M', 'N')
+    ),
+    "Caesar-Shifted (+3)": (
+        ('A', 'D'), ('B', 'E'), ('C', 'F'), ('G', 'J'), ('H', 'K'),
+        ('I', 'L'), ('M', 'P'), ('N', 'Q'), ('O', 'R'), ('S', 'V'),
+        ('T', 'W'), ('U', 'X'), ('Y', 'Z')
+    ),
+    "Vowel-Consonant": (
+        ('A', 'B'), ('E', 'C'), ('I', 'D'), ('O', 'F'), ('U', 'G')
+    ),
+    "Prime Position": (
+        ('A', 'C'), ('B', 'E'), ('D', 'G'), ('F', 'I'), ('H', 'K')
+    ),
+    "Keyboard-Based": (
+        ('Q', 'W'), ('E', 'R'), ('T', 'Y'), ('U', 'I'), ('O', 'P'),
+        ('A', 'S'), ('D', 'F'), ('G', 'H'), ('J', 'K'), ('L', 'Z')
+    )
+}
+
 def analyze_pairing_strategies():
     """Analyze different custom pairing strategies"""
     
@@ -18,36 +46,9 @@ def analyze_pairing_strategies():
     test_text = "THE QUICK BROWN FOX JUMPS OVER THE LAZY DOG"
     test_key = "SECRET"
     
-    strategies = {
-        "Frequency-Based (Common ↔ Rare)": [
-            ('E', 'Z'), ('T', 'Q'), ('A', 'X'), ('O', 'J'), ('I', 'K'),
-            ('N', 'V'), ('S', 'B'), ('H', 'Y'), ('R', 'W'), ('D', 'F')
-        ],
-        "Symmetric (Mirror Positions)": [
-            ('A', 'Z'), ('B', 'Y'), ('C', 'X'), ('D', 'W'), ('E', 'V'),
-            ('F', 'U'), ('G', 'T'), ('H', 'S'), ('I', 'R'), ('J', 'Q'),
-            ('K', 'P'), ('L', 'O'), ('M', 'N')
-        ],
-        "Caesar-Shifted (+3)": [
-            ('A', 'D'), ('B', 'E'), ('C', 'F'), ('G', 'J'), ('H', 'K'),
-            ('I', 'L'), ('M', 'P'), ('N', 'Q'), ('O', 'R'), ('S', 'V'),
-            ('T', 'W'), ('U', 'X'), ('Y', 'Z')
-        ],
-        "Vowel-Consonant": [
-            ('A', 'B'), ('E', 'C'), ('I', 'D'), ('O', 'F'), ('U', 'G')
-        ],
-        "Prime Position": [
-            ('A', 'C'), ('B', 'E'), ('D', 'G'), ('F', 'I'), ('H', 'K')
-        ],
-        "Keyboard-Based": [
-            ('Q', 'W'), ('E', 'R'), ('T', 'Y'), ('U', 'I'), ('O', 'P'),
-            ('A', 'S'), ('D', 'F'), ('G', 'H'), ('J', 'K'), ('L', 'Z')
-        ]
-    }
-    
     results = {}
     
-    for strategy_name, pairs in strategies.items():
+    for strategy_name, pairs in STRATEGIES.items():
         print(f"\n{strategy_name}")
         print("-" * 60)
         
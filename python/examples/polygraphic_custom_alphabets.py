@@ -11,7 +11,12 @@ import os
 # Add the parent directory to the path so we can import cryptology
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from cryptology.classical.substitution.polygraphic.playfair import encrypt as playfair_encrypt, decrypt as playfair_decrypt
+from cryptology.classical.substitution.polygraphic.playfair import encrypt as playfair_encrypt
+from cryptology.classical.substitution.polygraphic.playfair import (
+    build_grid as playfair_build_grid,
+    encrypt_with_grid as playfair_encrypt_with_grid,
+    decrypt_with_grid as playfair_decrypt_with_grid,
+)
 from cryptology.classical.substitution.polygraphic.two_square import encrypt as two_square_encrypt, decrypt as two_square_decrypt
 from cryptology.classical.substitution.polygraphic.four_square import encrypt as four_square_encrypt, decrypt as four_square_decrypt
 from cryptology.classical.substitution.polygraphic.hill import encrypt as hill_encrypt, decrypt as hill_decrypt
@@ -41,8 +46,10 @@ def demonstrate_turkish_alphabet():
     
     # Playfair with Turkish
     try:
-        encrypted = playfair_encrypt(plaintext, key, turkish_alphabet)
-        decrypted = playfair_decrypt(encrypted, key, turkish_alphabet)
+        # Build the key square once and share it between encrypt and decrypt
+        grid = playfair_build_grid(key, turkish_alphabet)
+        encrypted = playfair_encrypt_with_grid(plaintext, grid, turkish_alphabet)
+        decrypted = playfair_decrypt_with_grid(encrypted, grid, turkish_alphabet)
         print(f"Playfair Encrypted: {encrypted}")
         print(f"Playfair Decrypted: {decrypted}")
     except Exception as e:
@@ -72,8 +79,10 @@ def demonstrate_russian_alphabet():
     
     # Playfair with Russian
     try:
-        encrypted = playfair_encrypt(plaintext, key, russian_alphabet)
-        decrypted = playfair_decrypt(encrypted, key, russian_alphabet)
+        # Build the key square once and share it between encrypt and decrypt
+        grid = playfair_build_grid(key, russian_alphabet)
+        encrypted = playfair_encrypt_with_grid(plaintext, grid, russian_alphabet)
+        decrypted = playfair_decrypt_with_grid(encrypted, grid, russian_alphabet)
         print(f"Playfair Encrypted: {encrypted}")
         print(f"Playfair Decrypted: {decrypted}")
     except Exception as e:
@@ -101,8 +110,10 @@ def demonstrate_caesared_alphabet():
     
     # Playfair with Caesared alphabet
     try:
-        encrypted = playfair_encrypt(plaintext, key, caesared_alphabet)
-        decrypted = playfair_decrypt(encrypted, key, caesared_alphabet)
+        # Build the key square once and share it between encrypt and decrypt
+        grid = playfair_build_grid(key, caesared_alphabet)
+        encrypted = playfair_encrypt_with_grid(plaintext, grid, caesared_alphabet)
+        decrypted = playfair_decrypt_with_grid(encrypted, grid, caesared_alphabet)
         print(f"Playfair Encrypted: {encrypted}")
         print(f"Playfair Decrypted: {decrypted}")
     except Exception as e:
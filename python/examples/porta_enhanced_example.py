@@ -8,197 +8,212 @@ This example demonstrates the enhanced Porta cipher with:
 - Multiple pairing strategies
 """
 
+import io
+import sys
+from functools import lru_cache
+
 from cryptology.classical.substitution.polyalphabetic.porta import (
     encrypt, decrypt, produce_pairs, generate_random_key, generate_key_for_text, encrypt_with_random_key
 )
 
 
+# Uppercase Turkish alphabet (29 letters)
+TURKISH_ALPHABET = "ABCÇDEFGĞHIİJKLMNOÖPRSŞTUÜVYZ"
+
+# User-defined pairs shared by the custom pair examples
+CUSTOM_PAIRS = (("A", "Z"), ("B", "Y"), ("C", "X"), ("D", "W"), ("E", "V"))
+
+
+@lru_cache(maxsize=32)
+def _produce_pairs(pair_type, alphabet=None, custom_pairs=None):
+    """Cached ``produce_pairs``; custom pairs are passed as a tuple of tuples."""
+    if alphabet is None:
+        return produce_pairs(pair_type, custom_pairs=list(custom_pairs) if custom_pairs else None)
+    return produce_pairs(pair_type, alphabet, list(custom_pairs) if custom_pairs else None)
+
+
 def main():
-    print("=" * 70)
-    print("ENHANCED PORTA CIPHER EXAMPLE - CUSTOM PAIRING SUPPORT")
-    print("=" * 70)
-    
-    # Example 1: Default pairs
-    print("\n1. Default Alphabet Pairs")
-    print("-" * 50)
-    
-    default_pairs = produce_pairs("default")
-    print(f"Default pairs (first 5): {default_pairs[:5]}")
-    print(f"Total pairs: {len(default_pairs)}")
-    
-    plaintext = "HELLO"
-    key = "KEY"
-    encrypted = encrypt(plaintext, key, pairs=default_pairs)
-    decrypted = decrypt(encrypted, key, pairs=default_pairs)
-    
-    print(f"Plaintext: {plaintext}")
-    print(f"Encrypted: {encrypted}")
-    print(f"Decrypted: {decrypted}")
-    print(f"Success: {plaintext == decrypted}")
-    
-    # Example 2: Turkish alphabet pairs
-    print("\n2. Turkish Alphabet Pairs")
-    print("-" * 50)
-    
-    turkish_alphabet = "ABCÇDEFGĞHIİJKLMNOÖPRSŞTUÜVYZ"
-    turkish_pairs = produce_pairs("turkish", turkish_alphabet)
-    
-    print(f"Turkish alphabet: {turkish_alphabet}")
-    print(f"Turkish pairs: {turkish_pairs}")
-    print(f"Total Turkish pairs: {len(turkish_pairs)}")
-    
-    turkish_text = "MERHABA"
-    key = "A"
-    encrypted_turkish = encrypt(turkish_text, key, turkish_alphabet, turkish_pairs)
-    decrypted_turkish = decrypt(encrypted_turkish, key, turkish_alphabet, turkish_pairs)
-    
-    print(f"Turkish text: {turkish_text}")
-    print(f"Encrypted: {encrypted_turkish}")
-    print(f"Decrypted: {decrypted_turkish}")
-    print(f"Success: {turkish_text == decrypted_turkish}")
-    
-    # Example 3: Custom user-defined pairs
-    print("\n3. Custom User-Defined Pairs")
-    print("-" * 50)
-    
-    custom_pairs = [("A", "Z"), ("B", "Y"), ("C", "X"), ("D", "W"), ("E", "V")]
-    validated_pairs = produce_pairs("custom", custom_pairs=custom_pairs)
-    
-    print(f"Custom pairs: {validated_pairs}")
-    
-    plaintext = "ABCDE"
-    key = "ABCDE"
-    encrypted_custom = encrypt(plaintext, key, pairs=validated_pairs)
-    decrypted_custom = decrypt(encrypted_custom, key, pairs=validated_pairs)
-    
-    print(f"Plaintext: {plaintext}")
-    print(f"Encrypted: {encrypted_custom}")
-    print(f"Decrypted: {decrypted_custom}")
-    print(f"Success: {plaintext == decrypted_custom}")
-    
-    # Example 4: Balanced pairs
-    print("\n4. Balanced Alphabet Pairs")
-    print("-" * 50)
-    
-    alphabet = "ABCDEFGHIJKL"  # 12 letters
-    balanced_pairs = produce_pairs("balanced", alphabet)
-    
-    print(f"Alphabet: {alphabet}")
-    print(f"Balanced pairs: {balanced_pairs}")
-    
-    plaintext = "ABC"
-    key = "ABC"
-    encrypted_balanced = encrypt(plaintext, key, alphabet, balanced_pairs)
-    decrypted_balanced = decrypt(encrypted_balanced, key, alphabet, balanced_pairs)
-    
-    print(f"Plaintext: {plaintext}")
-    print(f"Encrypted: {encrypted_balanced}")
-    print(f"Decrypted: {decrypted_balanced}")
-    print(f"Success: {plaintext == decrypted_balanced}")
-    
-    # Example 5: Pair validation and error handling
-    print("\n5. Pair Validation and Error Handling")
-    print("-" * 50)
-    
-    # Test invalid custom pairs
-    try:
-        produce_pairs("custom")  # Missing custom_pairs
-    except ValueError as e:
-        print(f"Missing custom_pairs error: {e}")
-    
+    out = io.StringIO()
     try:
-        produce_pairs("custom", custom_pairs=[])  # Empty pairs
-    except ValueError as e:
-        print(f"Empty pairs error: {e}")
-    
-    try:
-        produce_pairs("custom", custom_pairs=[("A", "Z"), ("A", "Y")])  # Duplicate letter
-    except ValueError as e:
-        print(f"Duplicate letter error: {e}")
-    
-    try:
-        produce_pairs("invalid")  # Invalid pair type
-    except ValueError as e:
-        print(f"Invalid pair type error: {e}")
-    
-    # Example 6: Self-reciprocal property with custom pairs
-    print("\n6. Self-Reciprocal Property with Custom Pairs")
-    print("-" * 50)
-    
-    custom_pairs = [("A", "Z"), ("B", "Y"), ("C", "X")]
-    plaintext = "ABC"
-    key = "ABC"
-    
-    encrypted = encrypt(plaintext, key, pairs=custom_pairs)
-    print(f"Plaintext: {plaintext}")
-    print(f"Encrypted: {encrypted}")
-    
-    # Demonstrate self-reciprocal property
-    encrypted_again = encrypt(encrypted, key, pairs=custom_pairs)
-    print(f"Encrypt encrypted text: {encrypted_again}")
-    print(f"Self-reciprocal: {encrypted_again == plaintext}")
-    
-    # Example 7: Different alphabet sizes
-    print("\n7. Different Alphabet Sizes")
-    print("-" * 50)
-    
-    test_cases = [
-        ("ABCDEFGHIJKL", "balanced"),  # 12 letters
-        ("ABCDEFGHIJKLMNOPQRSTUVWXYZ", "default"),  # 26 letters
-        ("ABCÇDEFGĞHIİJKLMNOÖPRSŞTUÜVYZ", "turkish")  # 29 letters
-    ]
-    
-    for alphabet, pair_type in test_cases:
-        pairs = produce_pairs(pair_type, alphabet)
-        print(f"Alphabet ({len(alphabet)} letters): {alphabet[:10]}...")
-        print(f"Pair type: {pair_type}, Pairs: {len(pairs)}")
-        
-        # Test encryption
-        plaintext = alphabet[:3]
+        print("=" * 70, file=out)
+        print("ENHANCED PORTA CIPHER EXAMPLE - CUSTOM PAIRING SUPPORT", file=out)
+        print("=" * 70, file=out)
+        
+        # Example 1: Default pairs
+        print("\n1. Default Alphabet Pairs", file=out)
+        print("-" * 50, file=out)
+        
+        default_pairs = _produce_pairs("default")
+        print(f"Default pairs (first 5): {default_pairs[:5]}", file=out)
+        print(f"Total pairs: {len(default_pairs)}", file=out)
+        
+        plaintext = "HELLO"
+        key = "KEY"
+        encrypted = encrypt(plaintext, key, pairs=default_pairs)
+        decrypted = decrypt(encrypted, key, pairs=default_pairs)
+        
+        print(f"Plaintext: {plaintext}", file=out)
+        print(f"Encrypted: {encrypted}", file=out)
+        print(f"Decrypted: {decrypted}", file=out)
+        print(f"Success: {plaintext == decrypted}", file=out)
+        
+        # Example 2: Turkish alphabet pairs
+        print("\n2. Turkish Alphabet Pairs", file=out)
+        print("-" * 50, file=out)
+        
+        turkish_alphabet = TURKISH_ALPHABET
+        turkish_pairs = _produce_pairs("turkish", turkish_alphabet)
+        
+        print(f"Turkish alphabet: {turkish_alphabet}", file=out)
+        print(f"Turkish pairs: {turkish_pairs}", file=out)
+        print(f"Total Turkish pairs: {len(turkish_pairs)}", file=out)
+        
+        turkish_text = "MERHABA"
+        key = "A"
+        encrypted_turkish = encrypt(turkish_text, key, turkish_alphabet, turkish_pairs)
+        decrypted_turkish = decrypt(encrypted_turkish, key, turkish_alphabet, turkish_pairs)
+        
+        print(f"Turkish text: {turkish_text}", file=out)
+        print(f"Encrypted: {encrypted_turkish}", file=out)
+        print(f"Decrypted: {decrypted_turkish}", file=out)
+        print(f"Success: {turkish_text == decrypted_turkish}", file=out)
+        
+        # Example 3: Custom user-defined pairs
+        print("\n3. Custom User-Defined Pairs", file=out)
+        print("-" * 50, file=out)
+        
+        validated_pairs = _produce_pairs("custom", custom_pairs=CUSTOM_PAIRS)
+        
+        print(f"Custom pairs: {validated_pairs}", file=out)
+        
+        plaintext = "ABCDE"
+        key = "ABCDE"
+        encrypted_custom = encrypt(plaintext, key, pairs=validated_pairs)
+        decrypted_custom = decrypt(encrypted_custom, key, pairs=validated_pairs)
+        
+        print(f"Plaintext: {plaintext}", file=out)
+        print(f"Encrypted: {encrypted_custom}", file=out)
+        print(f"Decrypted: {decrypted_custom}", file=out)
+        print(f"Success: {plaintext == decrypted_custom}", file=out)
+        
+        # Example 4: Balanced pairs
+        print("\n4. Balanced Alphabet Pairs", file=out)
+        print("-" * 50, file=out)
+        
+        alphabet = "ABCDEFGHIJKL"  # 12 letters
+        balanced_pairs = _produce_pairs("balanced", alphabet)
+        
+        print(f"Alphabet: {alphabet}", file=out)
+        print(f"Balanced pairs: {balanced_pairs}", file=out)
+        
+        plaintext = "ABC"
+        key = "ABC"
+        encrypted_balanced = encrypt(plaintext, key, alphabet, balanced_pairs)
+        decrypted_balanced = decrypt(encrypted_balanced, key, alphabet, balanced_pairs)
+        
+        print(f"Plaintext: {plaintext}", file=out)
+        print(f"Encrypted: {encrypted_balanced}", file=out)
+        print(f"Decrypted: {decrypted_balanced}", file=out)
+        print(f"Success: {plaintext == decrypted_balanced}", file=out)
+        
+        # Example 5: Pair validation and error handling
+        print("\n5. Pair Validation and Error Handling", file=out)
+        print("-" * 50, file=out)
+        
+        # Test invalid custom pairs
+        error_cases = (
+            ("Missing custom_pairs", ("custom",), {}),
+            ("Empty pairs", ("custom",), {"custom_pairs": []}),
+            ("Duplicate letter", ("custom",), {"custom_pairs": [("A", "Z"), ("A", "Y")]}),
+            ("Invalid pair type", ("invalid",), {}),
+        )
+        for label, args, kwargs in error_cases:
+            try:
+                produce_pairs(*args, **kwargs)
+            except ValueError as e:
+                print(f"{label} error: {e}", file=out)
+        
+        # Example 6: Self-reciprocal property with custom pairs
+        print("\n6. Self-Reciprocal Property with Custom Pairs", file=out)
+        print("-" * 50, file=out)
+        
+        custom_pairs = [("A", "Z"), ("B", "Y"), ("C", "X")]
+        plaintext = "ABC"
+        key = "ABC"
+        
+        encrypted = encrypt(plaintext, key, pairs=custom_pairs)
+        print(f"Plaintext: {plaintext}", file=out)
+        print(f"Encrypted: {encrypted}", file=out)
+        
+        # Demonstrate self-reciprocal property
+        encrypted_again = encrypt(encrypted, key, pairs=custom_pairs)
+        print(f"Encrypt encrypted text: {encrypted_again}", file=out)
+        print(f"Self-reciprocal: {encrypted_again == plaintext}", file=out)
+        
+        # Example 7: Different alphabet sizes
+        print("\n7. Different Alphabet Sizes", file=out)
+        print("-" * 50, file=out)
+        
+        test_cases = [
+            ("ABCDEFGHIJKL", "balanced"),  # 12 letters
+            ("ABCDEFGHIJKLMNOPQRSTUVWXYZ", "default"),  # 26 letters
+            (TURKISH_ALPHABET, "turkish")  # 29 letters
+        ]
+        
         key = "ABC"
-        encrypted = encrypt(plaintext, key, alphabet, pairs)
-        decrypted = decrypt(encrypted, key, alphabet, pairs)
-        print(f"Test: {plaintext} -> {encrypted} -> {decrypted} (Success: {plaintext == decrypted})")
-        print()
-    
-    # Example 8: Random key generation with custom pairs
-    print("\n8. Random Key Generation with Custom Pairs")
-    print("-" * 50)
-    
-    custom_pairs = [("A", "Z"), ("B", "Y"), ("C", "X"), ("D", "W"), ("E", "V")]
-    plaintext = "ABCDE"
-    
-    # Generate random key
-    random_key = generate_random_key(5)
-    print(f"Random key: {random_key}")
-    
-    encrypted_random = encrypt(plaintext, random_key, pairs=custom_pairs)
-    decrypted_random = decrypt(encrypted_random, random_key, pairs=custom_pairs)
-    
-    print(f"Plaintext: {plaintext}")
-    print(f"Encrypted: {encrypted_random}")
-    print(f"Decrypted: {decrypted_random}")
-    print(f"Success: {plaintext == decrypted_random}")
-    
-    # Example 9: Encrypt with random key and custom pairs
-    print("\n9. Encrypt with Random Key and Custom Pairs")
-    print("-" * 50)
-    
-    plaintext = "SECRET MESSAGE"
-    encrypted_text, generated_key = encrypt_with_random_key(plaintext)
-    
-    print(f"Plaintext: {plaintext}")
-    print(f"Generated Key: {generated_key}")
-    print(f"Encrypted: {encrypted_text}")
-    
-    # Decrypt using the generated key
-    decrypted_text = decrypt(encrypted_text, generated_key)
-    print(f"Decrypted: {decrypted_text}")
-    print(f"Success: {plaintext == decrypted_text}")
-    
-    print("\n" + "=" * 70)
-    print("ENHANCED PORTA CIPHER EXAMPLE COMPLETED")
-    print("=" * 70)
+        lines = []
+        for alphabet, pair_type in test_cases:
+            pairs = _produce_pairs(pair_type, alphabet)
+            lines.append(f"Alphabet ({len(alphabet)} letters): {alphabet[:10]}...")
+            lines.append(f"Pair type: {pair_type}, Pairs: {len(pairs)}")
+            
+            # Test encryption
+            plaintext = alphabet[:3]
+            encrypted = encrypt(plaintext, key, alphabet, pairs)
+            decrypted = decrypt(encrypted, key, alphabet, pairs)
+            lines.append(f"Test: {plaintext} -> {encrypted} -> {decrypted} (Success: {plaintext == decrypted})")
+            lines.append("")
+        out.write("\n".join(lines) + "\n")
+        
+        # Example 8: Random key generation with custom pairs
+        print("\n8. Random Key Generation with Custom Pairs", file=out)
+        print("-" * 50, file=out)
+        
+        plaintext = "ABCDE"
+        
+        # Generate random key
+        random_key = generate_random_key(5)
+        print(f"Random key: {random_key}", file=out)
+        
+        encrypted_random = encrypt(plaintext, random_key, pairs=CUSTOM_PAIRS)
+        decrypted_random = decrypt(encrypted_random, random_key, pairs=CUSTOM_PAIRS)
+        
+        print(f"Plaintext: {plaintext}", file=out)
+        print(f"Encrypted: {encrypted_random}", file=out)
+        print(f"Decrypted: {decrypted_random}", file=out)
+        print(f"Success: {plaintext == decrypted_random}", file=out)
+        
+        # Example 9: Encrypt with random key and custom pairs
+        print("\n9. Encrypt with Random Key and Custom Pairs", file=out)
+        print("-" * 50, file=out)
+        
+        plaintext = "SECRET MESSAGE"
+        encrypted_text, generated_key = encrypt_with_random_key(plaintext)
+        
+        print(f"Plaintext: {plaintext}", file=out)
+        print(f"Generated Key: {generated_key}", file=out)
+        print(f"Encrypted: {encrypted_text}", file=out)
+        
+        # Decrypt using the generated key
+        decrypted_text = decrypt(encrypted_text, generated_key)
+        print(f"Decrypted: {decrypted_text}", file=out)
+        print(f"Success: {plaintext == decrypted_text}", file=out)
+        
+        print("\n" + "=" * 70, file=out)
+        print("ENHANCED PORTA CIPHER EXAMPLE COMPLETED", file=out)
+        print("=" * 70, file=out)
+    finally:
+        sys.stdout.write(out.getvalue())
 
 
 if __name__ == "__main__":
@@ -7,6 +7,7 @@ including classical tabula recta and custom tables generated using monoalphabeti
 
 import sys
 import os
+from functools import lru_cache
 
 # Add the parent directory to the path so we can import cryptology
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -14,6 +15,12 @@ sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from cryptology.classical.substitution.polyalphabetic import vigenere_encrypt, vigenere_decrypt, vigenere_produce_table
 
 
+@lru_cache(maxsize=64)
+def _produce_table(table_type, **kwargs):
+    """Cached ``vigenere_produce_table``; the returned table is shared, so do not modify it."""
+    return vigenere_produce_table(table_type, **kwargs)
+
+
 def demonstrate_classical_vigenere():
     """Demonstrate classical Vigenère cipher with tabula recta."""
     print("=== Classical Vigenère Cipher Demo ===")
@@ -49,7 +56,7 @@ def demonstrate_caesar_table():
     print()
     
     # Generate Caesar table
-    caesar_table = vigenere_produce_table("caesar", shift=shift)
+    caesar_table = _produce_table("caesar", shift=shift)
     print("Caesar table generated (each row shifts by base_shift + row_index)")
     print()
     
@@ -77,7 +84,7 @@ def demonstrate_affine_table():
     print()
     
     # Generate Affine table
-    affine_table = vigenere_produce_table("affine", a=a, b=b)
+    affine_table = _produce_table("affine", a=a, b=b)
     print("Affine table generated (each row uses a*x + (b + row_index) mod 26)")
     print()
     
@@ -105,7 +112,7 @@ def demonstrate_keyword_table():
     print()
     
     # Generate Keyword table
-    keyword_table = vigenere_produce_table("keyword", keyword=keyword)
+    keyword_table = _produce_table("keyword", keyword=keyword)
     print("Keyword table generated (each row uses keyword + row_character)")
     print()
     
@@ -131,7 +138,7 @@ def demonstrate_atbash_table():
     print()
     
     # Generate Atbash table
-    atbash_table = vigenere_produce_table("atbash")
+    atbash_table = _produce_table("atbash")
     print("Atbash table generated (each row uses reversed alphabet with rotation)")
     print()
     
@@ -159,7 +166,7 @@ def demonstrate_turkish_alphabet():
     print()
     
     # Generate classical table for Turkish
-    turkish_table = vigenere_produce_table("classical", alphabet=turkish_alphabet)
+    turkish_table = _produce_table("classical", alphabet=turkish_alphabet)
     print("Turkish classical table generated (29x29)")
     print()
     
@@ -185,11 +192,11 @@ def demonstrate_table_comparison():
     print()
     
     # Generate different tables
-    classical_table = vigenere_produce_table("classical")
-    caesar_table = vigenere_produce_table("caesar", shift=5)
-    affine_table = vigenere_produce_table("affine", a=3, b=7)
-    keyword_table = vigenere_produce_table("keyword", keyword="SECRET")
-    atbash_table = vigenere_produce_table("atbash")
+    classical_table = _produce_table("classical")
+    caesar_table = _produce_table("caesar", shift=5)
+    affine_table = _produce_table("affine", a=3, b=7)
+    keyword_table = _produce_table("keyword", keyword="SECRET")
+    atbash_table = _produce_table("atbash")
     
     tables = [
         ("Classical", classical_table),
@@ -218,9 +225,9 @@ def demonstrate_security_analysis():
     print()
     
     # Generate different tables
-    classical_table = vigenere_produce_table("classical")
-    caesar_table = vigenere_produce_table("caesar", shift=13)
-    affine_table = vigenere_produce_table("affine", a=5, b=11)
+    classical_table = _produce_table("classical")
+    caesar_table = _produce_table("caesar", shift=13)
+    affine_table = _produce_table("affine", a=5, b=11)
     
     tables = [
         ("Classical", classical_table),
@@ -311,12 +318,12 @@ def demonstrate_composable_system():
     print()
     
     # Layer 3: Vigenère with Caesar table
-    caesar_table = vigenere_produce_table("caesar", shift=3)
+    caesar_table = _produce_table("caesar", shift=3)
     encrypted_caesar = vigenere_encrypt(plaintext, key, table=caesar_table)
     print(f"Vigenère with Caesar table: {encrypted_caesar}")
     
     # Layer 4: Vigenère with Affine table
-    affine_table = vigenere_produce_table("affine", a=3, b=5)
+    affine_table = _produce_table("affine", a=3, b=5)
     encrypted_affine = vigenere_encrypt(plaintext, key, table=affine_table)
     print(f"Vigenère with Affine table: {encrypted_affine}")
     print()
@@ -106,6 +106,18 @@ class TestAffine:
         assert affine._mod_inverse(5, 26) == 21  # 5 * 21 = 105 ≡ 1 (mod 26)
         assert affine._mod_inverse(7, 26) == 15  # 7 * 15 = 105 ≡ 1 (mod 26)
         assert affine._mod_inverse(11, 26) == 19  # 11 * 19 = 209 ≡ 1 (mod 26)
+        assert affine._mod_inverse(-3, 25) == 8  # -3 * 8 = -24 ≡ 1 (mod 25)
+    
+    def test_negative_a_roundtrip_common_length(self):
+        """Test negative 'a' round-trips with a precomputed alphabet length."""
+        encrypted = affine.encrypt("helloworld", -3, 4)
+        assert affine.decrypt(encrypted, -3, 4) == "helloworld"
+    
+    def test_negative_a_roundtrip_other_length(self):
+        """Test negative 'a' round-trips with an alphabet length outside the table."""
+        alphabet = "abcdefghijklmnopqrstuvwxy"  # 25 letters
+        encrypted = affine.encrypt("helloworld", -3, 4, alphabet)
+        assert affine.decrypt(encrypted, -3, 4, alphabet) == "helloworld"
     
     def test_decrypt_invalid_key(self):
         """Test that decryption with invalid key raises error."""
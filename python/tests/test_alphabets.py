@@ -0,0 +1,46 @@
+"""
+Tests for shared alphabet helpers.
+"""
+
+from cryptology import alphabets as ALPHABETS
+from cryptology.classical.substitution.monoalphabetic import affine, caesar, keyword
+
+
+class TestTranslationTable:
+    def test_maps_position_for_position(self):
+        """Test that each source character maps to the target character at its position."""
+        table = ALPHABETS.translation_table("abc", "xyz")
+        assert "cab".translate(table) == "zxy"
+    
+    def test_first_occurrence_wins(self):
+        """Test that a duplicate source character keeps its first mapping."""
+        table = ALPHABETS.translation_table("abca", "xyzw")
+        assert "a".translate(table) == "x"
+
+
+class TestComposeAlphabets:
+    def test_matches_sequential_encryption(self):
+        """Test that a composed Caesar + keyword + affine alphabet equals encrypting in sequence."""
+        source = ALPHABETS.ENGLISH_ALPHABET
+        composed = ALPHABETS.compose_alphabets(
+            source,
+            caesar.produce_alphabet(3, source),
+            keyword.produce_alphabet("secret", source),
+            affine.produce_alphabet(5, 8, source),
+        )
+        
+        text = "the quick brown fox jumps over the lazy dog"
+        expected = affine.encrypt(keyword.encrypt(caesar.encrypt(text, 3), "secret"), 5, 8)
+        assert text.translate(ALPHABETS.translation_table(source, composed)) == expected
+    
+    def test_first_occurrence_wins_for_duplicate_source_character(self):
+        """Test that a duplicate character in source uses its first position."""
+        composed = ALPHABETS.compose_alphabets("abca", "bcad")
+        assert composed == "bcab"
+    
+    def test_characters_outside_alphabet_pass_through(self):
+        """Test that characters outside the alphabet are left unchanged."""
+        source = "abc"
+        composed = ALPHABETS.compose_alphabets(source, "bca", "bca")
+        table = ALPHABETS.translation_table(source, composed)
+        assert "a-b c!9".translate(table) == "c-a b!9"
@@ -6,7 +6,8 @@ Test suite for Chaocipher implementation.
 import unittest
 import string
 from cryptology.classical.substitution.polyalphabetic.chaocipher import (
-    encrypt, decrypt, create_custom_alphabets, create_alphabets_with_mono_ciphers, decrypt_with_alphabets
+    encrypt, decrypt, create_custom_alphabets, create_alphabets_with_mono_ciphers,
+    create_alphabets_with_mono_ciphers_batch, decrypt_with_alphabets
 )
 
 
@@ -377,6 +378,23 @@ class TestChaocipherMonoalphabeticIntegration(unittest.TestCase):
                 right_cipher='caesar', right_params={'shift': 3}
             )
 
+    
+    def test_batch_matches_individual_calls(self):
+        """Test batched alphabet creation against individual calls."""
+        specs = [
+            {'left_cipher': 'caesar', 'left_params': {'shift': 5},
+             'right_cipher': 'keyword', 'right_params': {'keyword': 'SECRET'}},
+            {'left_cipher': 'atbash',
+             'right_cipher': 'affine', 'right_params': {'a': 5, 'b': 7}},
+        ]
+        
+        pairs = create_alphabets_with_mono_ciphers_batch(specs)
+        
+        self.assertEqual(pairs, [create_alphabets_with_mono_ciphers(**spec) for spec in specs])
+        
+        with self.assertRaises(ValueError):
+            create_alphabets_with_mono_ciphers_batch([{'left_cipher': 'invalid'}])
+
 
 if __name__ == '__main__':
     unittest.main()
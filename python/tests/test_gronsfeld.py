@@ -150,6 +150,13 @@ class TestGronsfeldTableGeneration(unittest.TestCase):
         
         with self.assertRaises(ValueError):
             produce_table("keyword")  # Missing keyword
+    
+    def test_cached_table_copies_are_independent(self):
+        """Test modifying a produced table does not affect later tables."""
+        table = produce_table("caesar", shift=5)
+        table[0][0] = "?"
+        
+        self.assertEqual(produce_table("caesar", shift=5)[0][0], "f")
 
 
 class TestGronsfeldRandomKeyGeneration(unittest.TestCase):
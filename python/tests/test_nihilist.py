@@ -375,6 +375,20 @@ class TestNihilistIntegration(unittest.TestCase):
         
         self.assertEqual(decrypted, plaintext)
 
+    def test_square_reuse_across_calls(self):
+        """Test that reusing squares across calls keeps results per square."""
+        plaintext = "hello"
+        key = "12345"
+        standard = nihilist_produce_square("standard")
+        atbash = nihilist_produce_square("atbash")
+
+        first = nihilist_encrypt(plaintext, key, square=standard)
+        other = nihilist_encrypt(plaintext, key, square=atbash)
+
+        self.assertNotEqual(first, other)
+        self.assertEqual(nihilist_encrypt(plaintext, key, square=standard), first)
+        self.assertEqual(nihilist_decrypt(other, key, square=atbash), plaintext)
+
 
 if __name__ == '__main__':
     # Run tests with verbose output
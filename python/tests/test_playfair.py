@@ -3,7 +3,9 @@ Test cases for Playfair cipher implementation.
 """
 
 import unittest
-from cryptology.classical.substitution.polygraphic.playfair import encrypt, decrypt
+from cryptology.classical.substitution.polygraphic.playfair import (
+    encrypt, decrypt, build_grid, encrypt_with_grid, decrypt_with_grid
+)
 
 
 class TestPlayfair(unittest.TestCase):
@@ -110,6 +112,18 @@ class TestPlayfair(unittest.TestCase):
             decrypted = decrypted[:-1]
         
         self.assertEqual(decrypted, expected)
+    
+    def test_prebuilt_grid_matches_full_path(self):
+        """Test that a prebuilt grid gives the same results as encrypt/decrypt."""
+        grid = build_grid("MONARCHY")
+        encrypted = encrypt_with_grid("HELLO WORLD", grid)
+        self.assertEqual(encrypted, encrypt("HELLO WORLD", "MONARCHY"))
+        self.assertEqual(decrypt_with_grid(encrypted, grid), decrypt(encrypted, "MONARCHY"))
+    
+    def test_build_grid_empty_key(self):
+        """Test that building a grid from an empty key raises ValueError."""
+        with self.assertRaises(ValueError):
+            build_grid("")
 
 
 if __name__ == '__main__':
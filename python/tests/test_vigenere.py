@@ -238,6 +238,15 @@ class TestVigenereCipher(unittest.TestCase):
         
         self.assertEqual(encrypted1, encrypted2)
     
+    def test_produced_table_independent_of_default(self):
+        """Test that modifying a produced table does not affect the default table."""
+        encrypted = vigenere_encrypt("attack at dawn", "lemon")
+        
+        table = vigenere_produce_table("classical")
+        table[0][0] = "z"
+        
+        self.assertEqual(vigenere_encrypt("attack at dawn", "lemon"), encrypted)
+    
     def test_invalid_table_type(self):
         """Test handling of invalid table types."""
         with self.assertRaises(ValueError):